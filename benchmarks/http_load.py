@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""Measure tool-call throughput of one streamable HTTP server under concurrent MCP sessions.
+
+The server runs in-process on a free local port, backed by a fake Hubstaff
+API with a fixed per-request latency, so the numbers show how well one warm
+process (shared token, connection pool and cache) serves many clients.
+
+Usage: python benchmarks/http_load.py [--sessions N] [--calls N] [--latency S]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import socket
+import statistics
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import httpx
+import uvicorn
+from mcp import ClientSession
+from mcp.client.streamable_http import streamablehttp_client
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hubstaff_mcp import server  # noqa: E402
+from hubstaff_mcp.client import HubstaffClient  # noqa: E402
+
+TOOLS = ("get_projects", "get_users", "get_organizations")
+
+
+class FakeAPI:
+    """Mock transport handler answering every list endpoint after ``latency`` seconds."""
+    
+    def __init__(self, latency: float, records: int = 50):
+        self.latency = latency
+        self.records = records
+        self.requests = 0
+    
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        await asyncio.sleep(self.latency)
+        if request.url.path.endswith("/access_tokens"):
+            return httpx.Response(200, json={"access_token": "token", "expires_in": 3600})
+        key = request.url.path.rstrip("/").rsplit("/", 1)[-1]
+        records = [{"id": n, "name": f"{key} {n}", "status": "active"} for n in range(self.records)]
+        return httpx.Response(200, json={key: records})
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def run_session(url: str, calls: int, latencies: list) -> None:
+    """One MCP client: connect, then issue ``calls`` tool calls in sequence."""
+    async with streamablehttp_client(url) as (read, write, _):
+        async with ClientSession(read, write) as session:
+            await session.initialize()
+            for n in range(calls):
+                started = time.perf_counter()
+                result = await session.call_tool(TOOLS[n % len(TOOLS)], {"format": "csv"})
+                latencies.append(time.perf_counter() - started)
+                if result.isError:
+                    raise RuntimeError(result.content)
+
+
+async def load(url: str, sessions: int, calls: int, latency: float, cache: bool) -> dict:
+    """Drive ``sessions`` concurrent clients against a server using a fresh fake API."""
+    api = FakeAPI(latency)
+    with patch.dict("os.environ", {"HUBSTAFF_REFRESH_TOKEN": "benchmark"}):
+        client = HubstaffClient(transport=httpx.MockTransport(api), cache_enabled=cache, rate_limit=0)
+    
+    latencies: list = []
+    with patch.object(server, "hubstaff_client", client):
+        started = time.perf_counter()
+        try:
+            await asyncio.gather(*(run_session(url, calls, latencies) for _ in range(sessions)))
+        finally:
+            elapsed = time.perf_counter() - started
+            await client.aclose()
+    
+    latencies.sort()
+    return {
+        "cache": cache,
+        "calls": len(latencies),
+        "seconds": round(elapsed, 3),
+        "calls_per_second": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(statistics.median(latencies) * 1000, 1),
+        "p95_ms": round(latencies[int(len(latencies) * 0.95) - 1] * 1000, 1),
+        "api_requests": api.requests,
+    }
+
+
+async def run(args: argparse.Namespace) -> list:
+    """Start the HTTP server on a free port and run the load with and without caching."""
+    port = free_port()
+    server.mcp.limit_calls(args.max_concurrent_calls)
+    config = uvicorn.Config(server.mcp.streamable_http_app(), host="127.0.0.1", port=port, log_level="warning")
+    http = uvicorn.Server(config)
+    task = asyncio.create_task(http.serve())
+    while not http.started:
+        await asyncio.sleep(0.01)
+    try:
+        url = f"http://127.0.0.1:{port}/mcp"
+        return [await load(url, args.sessions, args.calls, args.latency, cache) for cache in (False, True)]
+    finally:
+        http.should_exit = True
+        await task
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent MCP client sessions")
+    parser.add_argument("--calls", type=int, default=15, help="Tool calls per session")
+    parser.add_argument("--latency", type=float, default=0.05, help="Fake API latency in seconds")
+    parser.add_argument("--max-concurrent-calls", type=int, default=server.DEFAULT_MAX_CONCURRENT_CALLS)
+    args = parser.parse_args()
+    
+    logging.disable(logging.INFO)  # per-request httpx and MCP session logs
+    results = asyncio.run(run(args))
+    print(json.dumps({"sessions": args.sessions, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""Compare decode/encode time of the installed JSON backends.
+
+Usage: python benchmarks/json_backends.py [--records N] [--repeat N]
+"""
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hubstaff_mcp.models import Activity, validate_records  # noqa: E402
+from hubstaff_mcp.serialization import (  # noqa: E402
+    JSON_BACKENDS,
+    backend_available,
+    select_backend,
+)
+from streaming_decode import synthetic_body  # noqa: E402
+
+
+def best_of(repeat: int, fn) -> float:
+    """Fastest of ``repeat`` runs of ``fn``, in seconds."""
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - started)
+    return round(min(timings), 4)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    
+    body = synthetic_body(args.records)
+    activities = json.loads(body)["activities"]
+    report = {"body_bytes": len(body)}
+    for name in JSON_BACKENDS:
+        if not backend_available(name):
+            report[name] = "not installed"
+            continue
+        backend = select_backend(name)
+        report[name] = {
+            "decode_seconds": best_of(args.repeat, lambda: backend.loads(body)),
+            "encode_seconds": best_of(args.repeat, lambda: backend.dumps(activities)),
+        }
+    report["validate_seconds"] = best_of(
+        args.repeat, lambda: validate_records(activities, Activity)
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
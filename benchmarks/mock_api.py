@@ -0,0 +1,163 @@
+"""Offline stand-in for the Hubstaff API, for benchmarks.
+
+:class:`MockHubstaffAPI` is an async handler for ``httpx.MockTransport``
+that serves every endpoint the client uses, with a configurable latency,
+page size and listing size, and can inject 401 and 429 responses.
+"""
+
+import asyncio
+import json
+import random
+from collections import Counter
+from typing import Any, Dict, List, Optional, Tuple
+
+import httpx
+
+# Response key of each paginated listing, by path
+LISTINGS = {
+    "/v2/users": "users",
+    "/v2/projects": "projects",
+    "/v2/time_entries": "time_entries",
+    "/v2/activities": "activities",
+    "/v2/screenshots": "screenshots",
+    "/v2/timesheets": "timesheets",
+}
+
+
+def make_record(key: str, n: int, rng: random.Random) -> Dict[str, Any]:
+    """A plausible record of the given listing with id ``n + 1``."""
+    hour = n % 24
+    base = {"id": n + 1, "created_at": "2025-01-01T00:00:00Z", "updated_at": "2025-01-02T00:00:00Z"}
+    if key == "users":
+        return {**base, "name": f"User {n}", "email": f"user{n}@example.com", "time_zone": "UTC", "status": "active"}
+    if key == "projects":
+        return {**base, "name": f"Project {n}", "status": "active", "description": "Benchmark project " * 3}
+    if key == "tasks":
+        return {**base, "summary": f"Task {n}", "status": "active", "project_id": 1 + n % 20, "assignee_id": 1 + n % 50}
+    if key == "time_entries":
+        return {
+            **base, "user_id": 1 + n % 50, "project_id": 1 + n % 20, "task_id": 1 + n % 300,
+            "starts_at": f"2025-01-01T{hour:02d}:00:00Z", "stops_at": f"2025-01-01T{hour:02d}:45:00Z",
+            "tracked": 2700,
+        }
+    if key == "activities":
+        overall = rng.randint(0, 600)
+        return {
+            **base, "user_id": 1 + n % 50, "project_id": 1 + n % 20, "task_id": 1 + n % 300,
+            "time_slot": f"2025-01-01T{hour:02d}:{(n % 6) * 10:02d}:00Z", "tracked": 600,
+            "keyboard": rng.randint(0, overall), "mouse": rng.randint(0, overall), "overall": overall,
+        }
+    if key == "screenshots":
+        return {
+            **base, "user_id": 1 + n % 50, "project_id": 1 + n % 20,
+            "recorded_at": f"2025-01-01T{hour:02d}:05:00Z", "url": f"https://screens.example.com/{n}.jpg",
+        }
+    if key == "timesheets":
+        return {**base, "user_id": 1 + n % 50, "date": "2025-01-01", "tracked": 28800, "status": "open"}
+    if key == "teams":
+        return {**base, "name": f"Team {n}"}
+    return {**base, "name": f"Organization {n}", "status": "active"}
+
+
+class MockHubstaffAPI:
+    """Fake Hubstaff API with latency, pagination and fault injection.
+    
+    Every listing has ``records`` records served ``page_size`` at a time
+    (date-sharded listings return that many per shard). Every
+    ``unauthorized_every``-th API request is answered with 401 and every
+    ``throttle_every``-th with 429 (``Retry-After: 0``); 0 disables either.
+    """
+    
+    def __init__(
+        self,
+        records: int = 200,
+        page_size: int = 100,
+        latency: float = 0.0,
+        unauthorized_every: int = 0,
+        throttle_every: int = 0,
+        seed: int = 42
+    ):
+        self.records = records
+        self.page_size = page_size
+        self.latency = latency
+        self.unauthorized_every = unauthorized_every
+        self.throttle_every = throttle_every
+        self.requests = 0
+        self.api_requests = 0
+        self.bytes_sent = 0
+        self.statuses: Counter = Counter()
+        self._rng = random.Random(seed)
+        self._data: Dict[str, List[Dict[str, Any]]] = {}
+        self._pages: Dict[Tuple[str, int], bytes] = {}
+        self._next_id = 10_000_000
+    
+    def transport(self) -> httpx.MockTransport:
+        return httpx.MockTransport(self)
+    
+    def _listing(self, key: str) -> List[Dict[str, Any]]:
+        if key not in self._data:
+            self._data[key] = [make_record(key, n, self._rng) for n in range(self.records)]
+        return self._data[key]
+    
+    def _page(self, key: str, start: int) -> bytes:
+        """Encoded page of ``key`` beginning at record id ``start`` (cached)."""
+        body = self._pages.get((key, start))
+        if body is None:
+            records = self._listing(key)
+            index = max(start - 1, 0)
+            payload: Dict[str, Any] = {key: records[index:index + self.page_size]}
+            if index + self.page_size < len(records):
+                payload["pagination"] = {"next_page_start_id": index + self.page_size + 1}
+            body = self._pages[(key, start)] = json.dumps(payload).encode()
+        return body
+    
+    def _respond(self, status: int, body: Optional[bytes] = None, **headers: str) -> httpx.Response:
+        self.statuses[status] += 1
+        self.bytes_sent += len(body or b"")
+        return httpx.Response(
+            status, content=body or b"", headers={"Content-Type": "application/json", **headers}
+        )
+    
+    def _json(self, payload: Any, status: int = 200) -> httpx.Response:
+        return self._respond(status, json.dumps(payload).encode())
+    
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests += 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        path = request.url.path
+        if path == "/access_tokens":
+            return self._json({"access_token": f"token-{self.requests}", "expires_in": 3600})
+        
+        self.api_requests += 1
+        if self.unauthorized_every and self.api_requests % self.unauthorized_every == 0:
+            return self._json({"error": "invalid_token"}, 401)
+        if self.throttle_every and self.api_requests % self.throttle_every == 0:
+            return self._respond(429, b"{}", **{"Retry-After": "0"})
+        return self._route(request.method, path, request)
+    
+    def _route(self, method: str, path: str, request: httpx.Request) -> httpx.Response:
+        parts = path.strip("/").split("/")[1:]  # drop "v2"
+        if method == "GET" and path in LISTINGS:
+            start = int(request.url.params.get("page_start_id", 0))
+            return self._respond(200, self._page(LISTINGS[path], start))
+        if method == "GET" and path == "/v2/users/me":
+            return self._json({"user": make_record("users", 0, self._rng)})
+        if method == "GET" and path == "/v2/organizations":
+            return self._json({"organizations": [make_record("organizations", n, self._rng) for n in range(3)]})
+        if method == "GET" and len(parts) == 3 and parts[0] == "organizations" and parts[2] == "teams":
+            return self._json({"teams": [make_record("teams", n, self._rng) for n in range(10)]})
+        if method == "GET" and len(parts) == 2 and parts[0] == "projects":
+            return self._json({"project": make_record("projects", int(parts[1]) - 1, self._rng)})
+        if method == "GET" and len(parts) == 3 and parts[0] == "projects" and parts[2] == "tasks":
+            start = int(request.url.params.get("page_start_id", 0))
+            return self._respond(200, self._page("tasks", start))
+        if method in ("POST", "PUT") and parts and parts[0] in ("tasks", "time_entries"):
+            key = "task" if parts[0] == "tasks" else "time_entry"
+            body = json.loads(request.content or b"{}")
+            self._next_id += 1
+            record_id = int(parts[1]) if len(parts) > 1 else self._next_id
+            return self._json({key: {"id": record_id, **body}}, 200 if method == "PUT" else 201)
+        if method == "DELETE" and parts and parts[0] == "time_entries":
+            return self._respond(204)
+        return self._json({"error": f"not found: {method} {path}"}, 404)
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""Compare memory held by activity dicts vs. the columnar ColumnStore.
+
+Usage: python benchmarks/records_memory.py [--records N] [--page-size N]
+"""
+
+import argparse
+import gc
+import json
+import random
+import sys
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hubstaff_mcp.records import ColumnStore  # noqa: E402
+
+
+def synthetic_pages(records: int, page_size: int):
+    """Yield raw JSON pages shaped like Hubstaff /activities responses."""
+    rng = random.Random(42)
+    for start in range(0, records, page_size):
+        page = []
+        for i in range(start, min(records, start + page_size)):
+            tracked = 600
+            overall = rng.randint(0, tracked)
+            page.append({
+                "id": 10_000_000 + i,
+                "user_id": rng.randint(1, 500),
+                "project_id": rng.randint(1, 80),
+                "task_id": rng.choice([None, rng.randint(1, 5000)]),
+                "time_slot": f"2025-01-{1 + (i // 14400) % 28:02d}T{(i // 600) % 24:02d}:{(i % 6) * 10:02d}:00Z",
+                "tracked": tracked,
+                "keyboard": rng.randint(0, overall),
+                "mouse": rng.randint(0, overall),
+                "overall": overall,
+            })
+        yield json.dumps({"activities": page}).encode()
+
+
+def measure(load) -> dict:
+    """Run ``load`` and report the memory its result retains and the peak."""
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    gc.collect()
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"retained_bytes": retained, "peak_bytes": peak, "records": len(result)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=200_000)
+    parser.add_argument("--page-size", type=int, default=500)
+    args = parser.parse_args()
+    
+    pages = list(synthetic_pages(args.records, args.page_size))
+    
+    def load_dicts():
+        records = []
+        for page in pages:
+            records.extend(json.loads(page)["activities"])
+        return records
+    
+    def load_columns():
+        store = ColumnStore(time_field="time_slot")
+        for page in pages:
+            store.extend(json.loads(page)["activities"])
+        return store
+    
+    report = {"dicts": measure(load_dicts), "columns": measure(load_columns)}
+    report["retained_ratio"] = round(
+        report["dicts"]["retained_bytes"] / report["columns"]["retained_bytes"], 1
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
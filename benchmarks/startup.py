@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""Measure cold start of the stdio server: import time and time to handshake.
+
+The import phase runs ``python -X importtime -c "import hubstaff_mcp.server"``
+and attributes self time to top-level packages. The handshake phase spawns
+the server the way a desktop MCP host does and times ``initialize`` and the
+first ``tools/list``. Prewarming is disabled, so no network is needed.
+
+Usage: python benchmarks/startup.py [--runs N] [--top N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+SERVER_ENV = {
+    "PYTHONPATH": SRC,
+    "HUBSTAFF_REFRESH_TOKEN": "benchmark",
+    "HUBSTAFF_PREWARM": "false",
+}
+
+
+def import_profile(top: int) -> Dict[str, Any]:
+    """Import time of hubstaff_mcp.server and the packages costing the most."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import hubstaff_mcp.server"],
+        capture_output=True, text=True, check=True, env={**os.environ, "PYTHONPATH": SRC}
+    )
+    by_package: Counter = Counter()
+    total = 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        by_package[name.split(".")[0]] += int(self_us)
+        if name == "hubstaff_mcp.server":
+            total = int(cumulative_us)
+    return {
+        "total_ms": round(total / 1000, 1),
+        "packages_ms": {name: round(us / 1000, 1) for name, us in by_package.most_common(top)},
+    }
+
+
+async def handshake() -> Dict[str, float]:
+    """Seconds from spawning the server until initialize and tools/list complete."""
+    from mcp import ClientSession, StdioServerParameters
+    from mcp.client.stdio import stdio_client
+    
+    params = StdioServerParameters(
+        command=sys.executable,
+        args=["-m", "hubstaff_mcp.server"],
+        env={**os.environ, **SERVER_ENV},
+    )
+    started = time.perf_counter()
+    with open(os.devnull, "w") as errlog:
+        async with stdio_client(params, errlog=errlog) as (read, write):
+            async with ClientSession(read, write) as session:
+                await session.initialize()
+                initialized = time.perf_counter() - started
+                await session.list_tools()
+                listed = time.perf_counter() - started
+    return {"initialize": initialized, "list_tools": listed}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=10, help="Packages listed in the import breakdown")
+    args = parser.parse_args()
+    
+    imports = [import_profile(args.top) for _ in range(args.runs)]
+    handshakes = [asyncio.run(handshake()) for _ in range(args.runs)]
+    report = {
+        "import": min(imports, key=lambda run: run["total_ms"]),
+        "handshake_ms": {
+            phase: {
+                "median": round(statistics.median(run[phase] for run in handshakes) * 1000, 1),
+                "min": round(min(run[phase] for run in handshakes) * 1000, 1),
+            }
+            for phase in ("initialize", "list_tools")
+        },
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
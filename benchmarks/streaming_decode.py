@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""Compare peak memory and time of whole-body vs. streaming JSON decoding.
+
+Usage: python benchmarks/streaming_decode.py [--records N] [--chunk-size N]
+"""
+
+import argparse
+import codecs
+import gc
+import json
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hubstaff_mcp.streaming import JSONArrayStream  # noqa: E402
+
+
+def synthetic_body(records: int) -> bytes:
+    """A single /activities response body with ``records`` entries."""
+    rng = random.Random(42)
+    activities = []
+    for i in range(records):
+        tracked = 600
+        overall = rng.randint(0, tracked)
+        activities.append({
+            "id": 10_000_000 + i,
+            "user_id": rng.randint(1, 500),
+            "project_id": rng.randint(1, 80),
+            "task_id": rng.choice([None, rng.randint(1, 5000)]),
+            "time_slot": f"2025-01-01T{(i // 600) % 24:02d}:{(i % 6) * 10:02d}:00Z",
+            "tracked": tracked,
+            "keyboard": rng.randint(0, overall),
+            "mouse": rng.randint(0, overall),
+            "overall": overall,
+        })
+    return json.dumps({"activities": activities, "pagination": {}}).encode()
+
+
+def measure(consume) -> dict:
+    """Run ``consume`` and report its result, peak traced memory and duration."""
+    gc.collect()
+    tracemalloc.start()
+    started = time.perf_counter()
+    total = consume()
+    elapsed = time.perf_counter() - started
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"tracked_total": total, "peak_bytes": peak, "seconds": round(elapsed, 3)}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=50_000)
+    parser.add_argument("--chunk-size", type=int, default=64 * 1024)
+    args = parser.parse_args()
+    
+    body = synthetic_body(args.records)
+    # Network reads arrive in chunks; they exist before either decoder runs.
+    chunks = [body[i:i + args.chunk_size] for i in range(0, len(body), args.chunk_size)]
+    
+    def whole_body():
+        # What Response.json() does: buffer the body, then decode all of it.
+        data = json.loads(b"".join(chunks))
+        return sum(activity["tracked"] for activity in data["activities"])
+    
+    def streaming():
+        stream = JSONArrayStream("activities")
+        utf8 = codecs.getincrementaldecoder("utf-8")()
+        total = 0
+        for chunk in chunks:
+            for activity in stream.feed(utf8.decode(chunk)):
+                total += activity["tracked"]
+        stream.close()
+        return total
+    
+    report = {
+        "body_bytes": len(body),
+        "whole_body": measure(whole_body),
+        "streaming": measure(streaming),
+    }
+    report["peak_ratio"] = round(
+        report["whole_body"]["peak_bytes"] / report["streaming"]["peak_bytes"], 1
+    )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
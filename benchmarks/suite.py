@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""End-to-end latency, throughput, memory and output size of every MCP tool.
+
+Each tool is called through the MCP server against an in-process mock
+Hubstaff API (see mock_api.py), so results are repeatable offline. The
+report is JSON; pass an earlier report as --compare to see the change.
+
+Usage: python benchmarks/suite.py [--repeat N] [--concurrency N] [--latency S]
+           [--records N] [--page-size N] [--unauthorized-every N]
+           [--throttle-every N] [--tools a,b] [--output FILE] [--compare FILE]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import platform
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import patch
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from hubstaff_mcp import server  # noqa: E402
+from hubstaff_mcp.client import HubstaffClient  # noqa: E402
+from hubstaff_mcp.sessions import SessionStore  # noqa: E402
+from hubstaff_mcp.sync import SyncStore  # noqa: E402
+from mock_api import MockHubstaffAPI  # noqa: E402
+
+DATES = {"start_date": "2025-01-01", "end_date": "2025-01-03"}
+
+# Arguments each tool is benchmarked with
+TOOL_CASES: Dict[str, Dict[str, Any]] = {
+    "get_time_entries": {**DATES, "organization_id": 1, "max_chars": 0},
+    "create_time_entry": {"project_id": 1, "starts_at": "2025-01-01T09:00:00", "stops_at": "2025-01-01T10:00:00"},
+    "update_time_entry": {"entry_id": 7, "stops_at": "2025-01-01T11:00:00"},
+    "delete_time_entry": {"entry_id": 7},
+    "bulk_create_time_entries": {"entries": [
+        {"project_id": 1, "starts_at": f"2025-01-01T{hour:02d}:00:00"} for hour in range(10)
+    ]},
+    "bulk_update_time_entries": {"updates": [{"id": n, "task_id": 3} for n in range(1, 11)]},
+    "bulk_delete_time_entries": {"entry_ids": ",".join(str(n) for n in range(1, 11))},
+    "get_projects": {"organization_id": 1, "max_chars": 0},
+    "get_project_details": {"project_id": 3},
+    "get_tasks": {"project_id": 3, "max_chars": 0},
+    "create_task": {"project_id": 3, "summary": "Benchmark task"},
+    "get_current_user": {},
+    "get_users": {"organization_id": 1, "max_chars": 0},
+    "get_organizations": {},
+    "get_teams": {"organization_id": 1},
+    "get_activities": {**DATES, "organization_id": 1, "max_chars": 0},
+    "get_screenshots": {**DATES, "organization_id": 1, "max_chars": 0},
+    "get_timesheets": {**DATES, "organization_id": 1, "max_chars": 0},
+    "summarize_time": {**DATES, "organization_id": 1, "group_by": "user,project"},
+    "sync_time_data": {"organization_id": 1, **DATES},
+    "refresh_access_token": {},
+    "get_token_status": {},
+    "get_server_metrics": {},
+}
+
+
+def result_text(result: Any) -> str:
+    """Text of a FastMCP call_tool result."""
+    content = result[0] if isinstance(result, tuple) else result
+    return "".join(getattr(block, "text", "") for block in content)
+
+
+def percentile(values: List[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def bench_tool(name: str, arguments: Dict[str, Any], args: argparse.Namespace) -> Dict[str, Any]:
+    """Measure one tool with a fresh client, cache and mock API."""
+    api = MockHubstaffAPI(
+        records=args.records,
+        page_size=args.page_size,
+        latency=args.latency,
+        unauthorized_every=args.unauthorized_every,
+        throttle_every=args.throttle_every,
+    )
+    with patch.dict("os.environ", {"HUBSTAFF_REFRESH_TOKEN": "benchmark"}):
+        client = HubstaffClient(transport=api.transport(), rate_limit=args.rate_limit, token_cache=None)
+    
+    with patch.object(server, "hubstaff_client", client), \
+            patch.object(server, "sync_store", SyncStore()), \
+            patch.object(server, "result_sessions", SessionStore()):
+        # Cold call: token exchange, empty caches; also the memory high-water
+        tracemalloc.start()
+        started = time.perf_counter()
+        text = result_text(await server.mcp.call_tool(name, arguments))
+        cold = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        
+        latencies = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            await server.mcp.call_tool(name, arguments)
+            latencies.append(time.perf_counter() - started)
+        
+        slots = asyncio.Semaphore(args.concurrency)
+        
+        async def one() -> None:
+            async with slots:
+                await server.mcp.call_tool(name, arguments)
+        
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(args.repeat)))
+        elapsed = time.perf_counter() - started
+        await client.aclose()
+    
+    return {
+        "cold_ms": round(cold * 1000, 2),
+        "p50_ms": round(statistics.median(latencies) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+        "calls_per_second": round(args.repeat / elapsed, 1),
+        "peak_memory_bytes": peak,
+        "output_bytes": len(text.encode()),
+        "api_requests": api.api_requests,
+        "api_bytes": api.bytes_sent,
+        "api_statuses": {str(status): count for status, count in sorted(api.statuses.items())},
+        "error": text.strip().startswith("Error"),
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True, cwd=Path(__file__).resolve().parent
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(report: Dict[str, Any], baseline: Dict[str, Any]) -> List[str]:
+    """Per-tool relative change of latency, throughput, memory and output size."""
+    lines = [f"Compared with {baseline['meta']['revision']}:"]
+    for name, current in report["tools"].items():
+        before = baseline["tools"].get(name)
+        if before is None:
+            continue
+        changes = []
+        for key in ("p50_ms", "calls_per_second", "peak_memory_bytes", "output_bytes"):
+            if before[key]:
+                changes.append(f"{key} {(current[key] - before[key]) / before[key] * 100:+.1f}%")
+        lines.append(f"  {name}: " + ", ".join(changes))
+    return lines
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20, help="Warm calls per tool")
+    parser.add_argument("--concurrency", type=int, default=8, help="Concurrent calls in the throughput phase")
+    parser.add_argument("--latency", type=float, default=0.0, help="Mock API latency in seconds")
+    parser.add_argument("--records", type=int, default=200, help="Records per listing")
+    parser.add_argument("--page-size", type=int, default=100)
+    parser.add_argument("--unauthorized-every", type=int, default=0, help="Answer every Nth request with 401")
+    parser.add_argument("--throttle-every", type=int, default=0, help="Answer every Nth request with 429")
+    parser.add_argument("--rate-limit", type=float, default=0, help="Client-side requests per second (0 = off)")
+    parser.add_argument("--tools", help="Comma-separated subset of tools")
+    parser.add_argument("--output", help="Write the JSON report here instead of stdout")
+    parser.add_argument("--compare", help="Earlier report to compare against")
+    args = parser.parse_args()
+    
+    names = args.tools.split(",") if args.tools else list(TOOL_CASES)
+    missing = sorted(set(tool.name for tool in server.mcp._tool_manager.list_tools()) - set(TOOL_CASES))
+    if missing:
+        print(f"No benchmark case for: {', '.join(missing)}", file=sys.stderr)
+    
+    logging.disable(logging.INFO)
+    results: Dict[str, Any] = {}
+    for name in names:
+        results[name] = asyncio.run(bench_tool(name, TOOL_CASES[name], args))
+    
+    config = {key: value for key, value in vars(args).items() if key not in ("output", "compare")}
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": config,
+        },
+        "tools": results,
+    }
+    text = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(text + "\n")
+    else:
+        print(text)
+    if args.compare:
+        baseline = json.loads(Path(args.compare).read_text())
+        print("\n".join(compare(report, baseline)), file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
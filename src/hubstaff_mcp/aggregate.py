@@ -0,0 +1,189 @@
+"""Streaming aggregation of time entries, activities and timesheets."""
+
+from datetime import date
+from typing import Any, AsyncIterable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+def _day(record: Dict[str, Any]) -> Optional[str]:
+    """Return the YYYY-MM-DD a record belongs to."""
+    for field in ("date", "time_slot", "starts_at"):
+        value = record.get(field)
+        if value:
+            return str(value)[:10]
+    return None
+
+
+def _week(record: Dict[str, Any]) -> Optional[str]:
+    """Return the ISO week (e.g. 2025-W03) a record belongs to."""
+    day = _day(record)
+    if day is None:
+        return None
+    try:
+        year, week, _ = date.fromisoformat(day).isocalendar()
+    except ValueError:
+        return None
+    return f"{year}-W{week:02d}"
+
+
+GROUP_KEYS: Dict[str, Callable[[Dict[str, Any]], Any]] = {
+    "user": lambda record: record.get("user_id"),
+    "project": lambda record: record.get("project_id"),
+    "task": lambda record: record.get("task_id"),
+    "day": _day,
+    "week": _week,
+}
+
+
+def parse_group_by(group_by: str) -> Tuple[str, ...]:
+    """Parse a comma-separated group-by spec such as "user,day"."""
+    fields = tuple(field.strip().lower() for field in group_by.split(",") if field.strip())
+    unknown = [field for field in fields if field not in GROUP_KEYS]
+    if unknown or not fields:
+        raise ValueError(
+            f"Invalid group_by: {group_by!r}. Use one or more of: {', '.join(GROUP_KEYS)}."
+        )
+    return fields
+
+
+class Accumulator:
+    """Running totals for one group, in constant memory.
+    
+    Hubstaff reports ``keyboard``, ``mouse`` and ``overall`` as seconds of
+    activity within ``tracked`` seconds. Averages are time-weighted over
+    the ``rated_tracked`` seconds of records that report activity, so time
+    tracked without it does not dilute them; the percentiles come from a
+    0-100% histogram of per-record activity.
+    """
+    
+    __slots__ = (
+        "records", "tracked", "overall", "keyboard", "mouse", "histogram", "rated", "rated_tracked"
+    )
+    
+    def __init__(self):
+        self.records = 0
+        self.tracked = 0
+        self.overall = 0
+        self.keyboard = 0
+        self.mouse = 0
+        self.rated = 0
+        self.rated_tracked = 0
+        self.histogram = [0] * 101
+    
+    def add(self, record: Dict[str, Any]) -> None:
+        tracked = record.get("tracked") or 0
+        self.records += 1
+        self.tracked += tracked
+        if record.get("overall") is None or not tracked:
+            return
+        overall = record.get("overall") or 0
+        self.overall += overall
+        self.keyboard += record.get("keyboard") or 0
+        self.mouse += record.get("mouse") or 0
+        self.rated += 1
+        self.rated_tracked += tracked
+        self.histogram[max(0, min(100, round(100 * overall / tracked)))] += 1
+    
+    def merge(self, other: "Accumulator") -> None:
+        self.records += other.records
+        self.tracked += other.tracked
+        self.overall += other.overall
+        self.keyboard += other.keyboard
+        self.mouse += other.mouse
+        self.rated += other.rated
+        self.rated_tracked += other.rated_tracked
+        self.histogram = [a + b for a, b in zip(self.histogram, other.histogram)]
+    
+    def activity(self, field: str = "overall") -> Optional[float]:
+        """Time-weighted activity percentage for ``field``."""
+        if not self.rated_tracked:
+            return None
+        return 100 * getattr(self, field) / self.rated_tracked
+    
+    def percentile(self, p: float) -> Optional[int]:
+        """Per-record activity percentage at percentile ``p`` (0-100)."""
+        if not self.rated:
+            return None
+        rank = max(1, -(-self.rated * p // 100))  # ceil, nearest-rank method
+        seen = 0
+        for percent, count in enumerate(self.histogram):
+            seen += count
+            if seen >= rank:
+                return percent
+        return 100
+
+
+class TimeAggregator:
+    """Group records by the requested keys and accumulate them as they stream in."""
+    
+    def __init__(self, group_by: Sequence[str]):
+        self.group_by = tuple(group_by)
+        self._key_funcs = [GROUP_KEYS[field] for field in self.group_by]
+        self.groups: Dict[Tuple[Any, ...], Accumulator] = {}
+    
+    def add(self, record: Dict[str, Any]) -> None:
+        key = tuple(func(record) for func in self._key_funcs)
+        accumulator = self.groups.get(key)
+        if accumulator is None:
+            accumulator = self.groups[key] = Accumulator()
+        accumulator.add(record)
+    
+    def add_all(self, records: Iterable[Dict[str, Any]]) -> None:
+        for record in records:
+            self.add(record)
+    
+    async def consume(self, records: AsyncIterable[Dict[str, Any]]) -> "TimeAggregator":
+        """Accumulate every record from an async iterator, one at a time."""
+        async for record in records:
+            self.add(record)
+        return self
+    
+    def total(self) -> Accumulator:
+        total = Accumulator()
+        for accumulator in self.groups.values():
+            total.merge(accumulator)
+        return total
+    
+    def sorted_groups(self) -> List[Tuple[Tuple[Any, ...], Accumulator]]:
+        """Groups ordered by time keys first, then by tracked time descending."""
+        time_fields = [i for i, field in enumerate(self.group_by) if field in ("day", "week")]
+        
+        def sort_key(item: Tuple[Tuple[Any, ...], Accumulator]) -> Tuple[Any, ...]:
+            key, accumulator = item
+            return tuple(str(key[i]) for i in time_fields) + (-accumulator.tracked,)
+        
+        return sorted(self.groups.items(), key=sort_key)
+
+
+def _percent(value: Optional[float]) -> str:
+    return "-" if value is None else f"{value:.0f}%"
+
+
+def format_summary_table(aggregator: TimeAggregator, max_rows: int = 50) -> str:
+    """Render the aggregate as a compact pipe-separated table with a total row."""
+    header = list(aggregator.group_by) + [
+        "hours", "records", "activity", "keyboard", "mouse", "p50", "p90"
+    ]
+    
+    def row(labels: Sequence[Any], acc: Accumulator) -> List[str]:
+        return [str(label) for label in labels] + [
+            f"{acc.tracked / 3600:.2f}",
+            str(acc.records),
+            _percent(acc.activity()),
+            _percent(acc.activity("keyboard")),
+            _percent(acc.activity("mouse")),
+            _percent(acc.percentile(50)),
+            _percent(acc.percentile(90)),
+        ]
+    
+    groups = aggregator.sorted_groups()
+    rows = [row(key, acc) for key, acc in groups[:max_rows]]
+    labels = ["TOTAL"] + [""] * (len(aggregator.group_by) - 1)
+    rows.append(row(labels, aggregator.total()))
+    
+    widths = [max(len(line[i]) for line in [header] + rows) for i in range(len(header))]
+    lines = [" | ".join(cell.ljust(width) for cell, width in zip(line, widths)).rstrip()
+             for line in [header] + rows]
+    lines.insert(1, "-+-".join("-" * width for width in widths))
+    if len(groups) > max_rows:
+        lines.insert(-1, f"... {len(groups) - max_rows} more groups (included in TOTAL)")
+    return "\n".join(lines)
@@ -0,0 +1,276 @@
+"""In-process response caching and request coalescing for HubstaffClient."""
+
+import asyncio
+import re
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+
+# Default bounds for the response cache.
+DEFAULT_CACHE_MAX_ENTRIES = 512
+DEFAULT_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+@dataclass(frozen=True)
+class CachePolicy:
+    """How long GET responses for endpoints matching ``pattern`` stay fresh.
+    
+    ``tag`` groups related entries so a mutation can invalidate all of them.
+    """
+    
+    pattern: str
+    ttl: float
+    tag: str
+    
+    def matches(self, endpoint: str) -> bool:
+        return re.fullmatch(self.pattern, endpoint) is not None
+
+
+# Slowly-changing reference data an agent tends to ask for repeatedly.
+DEFAULT_CACHE_POLICIES: Tuple[CachePolicy, ...] = (
+    CachePolicy(r"/organizations", ttl=3600, tag="organizations"),
+    CachePolicy(r"/organizations/\d+/teams", ttl=900, tag="teams"),
+    CachePolicy(r"/users", ttl=600, tag="users"),
+    CachePolicy(r"/projects", ttl=600, tag="projects"),
+    CachePolicy(r"/projects/\d+", ttl=600, tag="projects"),
+    CachePolicy(r"/projects/\d+/tasks", ttl=120, tag="tasks"),
+)
+
+# Tags invalidated by a POST/PUT/DELETE to endpoints matching each pattern.
+# Time entries are never cached, so writing them invalidates nothing.
+DEFAULT_INVALIDATIONS: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    (r"/tasks(/\d+)?", ("tasks",)),
+)
+
+
+@dataclass
+class CacheEntry:
+    """A cached response body plus the validators needed to revalidate it."""
+    
+    value: Any
+    tag: str
+    size: int
+    expires_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    
+    @property
+    def revalidatable(self) -> bool:
+        return self.etag is not None or self.last_modified is not None
+    
+    def conditional_headers(self) -> Dict[str, str]:
+        """``If-None-Match``/``If-Modified-Since`` headers for a refetch."""
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def cache_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Build a stable key from an endpoint and its (unordered) query params.
+    
+    Params set to None are left out, as they are not sent.
+    """
+    if not params:
+        return endpoint
+    query = "&".join(f"{k}={params[k]}" for k in sorted(params) if params[k] is not None)
+    return f"{endpoint}?{query}" if query else endpoint
+
+
+def request_key(method: str, endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+    """Key identifying equivalent requests, for coalescing concurrent duplicates."""
+    return f"{method.upper()} {cache_key(endpoint, params)}"
+
+
+class ResponseCache:
+    """TTL cache of decoded GET responses with LRU eviction.
+    
+    Entries are bounded both by count and by the byte size of the response
+    bodies they were decoded from. Cached values are shared between callers
+    and must be treated as read-only.
+    
+    Expired entries that carry an ``ETag`` or ``Last-Modified`` validator are
+    kept (subject to LRU eviction) so the next fetch can be a conditional
+    request; a 304 reply then renews them via :meth:`revalidate`.
+    """
+    
+    def __init__(
+        self,
+        policies: Iterable[CachePolicy] = DEFAULT_CACHE_POLICIES,
+        invalidations: Iterable[Tuple[str, Tuple[str, ...]]] = DEFAULT_INVALIDATIONS,
+        max_entries: int = DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes: int = DEFAULT_CACHE_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.policies = tuple(policies)
+        self.invalidations = tuple(invalidations)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.total_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.revalidations = 0
+        self._entries: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def policy_for(self, endpoint: str) -> Optional[CachePolicy]:
+        """Return the first policy matching ``endpoint``, if any."""
+        for policy in self.policies:
+            if policy.matches(endpoint):
+                return policy
+        return None
+    
+    def generation(self, tag: str) -> int:
+        """Invalidation counter for ``tag``, used to discard stale in-flight fills."""
+        return self._generations.get(tag, 0)
+    
+    def get(self, key: str) -> Optional[Any]:
+        """Return a fresh cached value, or None on a miss."""
+        entry = self._entries.get(key)
+        if entry is None or entry.expires_at <= self.clock():
+            if entry is not None and not entry.revalidatable:
+                self._remove(key)
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry.value
+    
+    def get_stale(self, key: str) -> Optional[CacheEntry]:
+        """Return the (possibly expired) entry for ``key`` if it can be revalidated."""
+        entry = self._entries.get(key)
+        if entry is None or not entry.revalidatable:
+            return None
+        return entry
+    
+    def set(
+        self,
+        key: str,
+        value: Any,
+        policy: CachePolicy,
+        size: int,
+        generation: Optional[int] = None,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None
+    ) -> None:
+        """Store ``value`` unless its tag was invalidated since ``generation``."""
+        if generation is not None and generation != self.generation(policy.tag):
+            return
+        if size > self.max_bytes:
+            return
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = CacheEntry(
+            value=value,
+            tag=policy.tag,
+            size=size,
+            expires_at=self.clock() + policy.ttl,
+            etag=etag,
+            last_modified=last_modified,
+        )
+        self.total_bytes += size
+        while len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes:
+            oldest = next(iter(self._entries))
+            self._remove(oldest)
+            self.evictions += 1
+    
+    def revalidate(
+        self,
+        key: str,
+        policy: CachePolicy,
+        generation: Optional[int] = None
+    ) -> Optional[Any]:
+        """Renew an entry after a 304 and return its value (None if it is gone)."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if generation is None or generation == self.generation(policy.tag):
+            entry.expires_at = self.clock() + policy.ttl
+            self._entries.move_to_end(key)
+        self.revalidations += 1
+        return entry.value
+    
+    def invalidate(self, *tags: str) -> None:
+        """Drop all entries for ``tags`` (every entry when no tags are given)."""
+        if not tags:
+            tags = tuple({entry.tag for entry in self._entries.values()} | set(self._generations))
+        for tag in tags:
+            self._generations[tag] = self.generation(tag) + 1
+        for key in [k for k, entry in self._entries.items() if entry.tag in tags]:
+            self._remove(key)
+    
+    def invalidate_for_mutation(self, endpoint: str) -> None:
+        """Invalidate the tags affected by a write to ``endpoint``."""
+        for pattern, tags in self.invalidations:
+            if re.fullmatch(pattern, endpoint):
+                self.invalidate(*tags)
+    
+    def stats(self) -> Dict[str, int]:
+        """Counters describing cache effectiveness and occupancy."""
+        return {
+            "entries": len(self._entries),
+            "bytes": self.total_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "revalidations": self.revalidations,
+        }
+    
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self.total_bytes -= entry.size
+
+
+class SingleFlight:
+    """Share one in-flight awaitable between concurrent callers with the same key.
+    
+    Every caller receives the same result object, which must be treated as
+    read-only.
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[str, asyncio.Future] = {}
+        self.calls = 0
+        self.deduplicated = 0
+    
+    def __len__(self) -> int:
+        return len(self._inflight)
+    
+    async def do(self, key: str, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """Run ``fn`` for ``key``, or await the call already running for it."""
+        future = self._inflight.get(key)
+        if future is not None:
+            self.deduplicated += 1
+            return await asyncio.shield(future)
+        
+        self.calls += 1
+        future = asyncio.ensure_future(fn())
+        self._inflight[key] = future
+        # Cleanup runs on completion, so a cancelled leader doesn't abort
+        # the shared call for callers still waiting on it.
+        future.add_done_callback(lambda done: self._forget(key, done))
+        return await asyncio.shield(future)
+    
+    def stats(self) -> Dict[str, int]:
+        """Calls made, callers that joined one already running, and calls in flight."""
+        return {
+            "calls": self.calls,
+            "deduplicated": self.deduplicated,
+            "inflight": len(self._inflight),
+        }
+    
+    def _forget(self, key: str, future: asyncio.Future) -> None:
+        if self._inflight.get(key) is future:
+            del self._inflight[key]
+        if not future.cancelled():
+            # Mark the exception retrieved even if every waiter went away.
+            future.exception()
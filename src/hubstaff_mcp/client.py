@@ -1,23 +1,290 @@
 """Hubstaff API client for MCP server."""
 
 import asyncio
+import importlib.util
+import logging
 import os
-from datetime import date, datetime
-from typing import Any, Dict, List, Optional
+import time
+from collections import deque
+from contextvars import ContextVar
+from datetime import date, datetime, timedelta, timezone
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
 import httpx
 
+from .cache import (
+    DEFAULT_CACHE_MAX_BYTES,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_POLICIES,
+    CachePolicy,
+    ResponseCache,
+    SingleFlight,
+    cache_key,
+    request_key,
+)
+from .config import env_bool, env_float, env_int
+from .metrics import METRICS, Metrics, endpoint_label
+from .models import RECORD_TYPES, validate_records
+from .records import ColumnStore
+from .streaming import iter_json_array
+from .retry import RetryPolicy
+from .serialization import select_backend
+from .ratelimit import (
+    DEFAULT_MAX_THROTTLE_RETRIES,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RATE_LIMIT_BURST,
+    RateLimiter,
+    bulk_requests,
+)
+from .token_cache import TokenCache, token_cache_key
+from .tracing import TRACER
+
+
+# Connection pool defaults; each can be overridden per client or via environment.
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY = 30.0
+DEFAULT_TIMEOUT = 30.0
+
+# Date-range endpoints are split into shards of this many days and fetched
+# with up to ``DEFAULT_FETCH_CONCURRENCY`` shards in flight.
+DEFAULT_FETCH_CONCURRENCY = 4
+DEFAULT_SHARD_DAYS = 1
+
+# Time-entry mutations run concurrently in bulk operations up to this limit.
+DEFAULT_BULK_CONCURRENCY = 5
+
+# Access tokens are refreshed in the background once they are this many
+# seconds from expiry, so callers never wait on a refresh of a live token.
+DEFAULT_TOKEN_REFRESH_MARGIN = 300.0
+
+logger = logging.getLogger(__name__)
+
+# Default for HubstaffClient(token_cache=...): use HUBSTAFF_TOKEN_CACHE. None disables it.
+_TOKEN_CACHE_FROM_ENV: Any = object()
+
+# Set while warming the response cache: cached entries are refetched, not returned
+_refreshing_cache: ContextVar[bool] = ContextVar("refreshing_cache", default=False)
+
 
 class HubstaffAPIError(Exception):
     """Exception raised for Hubstaff API errors."""
-    pass
+    
+    def __init__(self, message: str, status_code: Optional[int] = None):
+        super().__init__(message)
+        self.status_code = status_code
+
+
+def _http2_available() -> bool:
+    """Return True if the optional ``h2`` package needed for HTTP/2 is installed."""
+    return importlib.util.find_spec("h2") is not None
+
+
+def _parse_utc(value: Any) -> Optional[datetime]:
+    """Parse an ISO 8601 timestamp as an aware UTC datetime (naive means UTC)."""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def date_shards(start_date: date, end_date: date, shard_days: int = 1) -> List[Tuple[date, date]]:
+    """Split an inclusive date range into consecutive ``(start, end)`` shards."""
+    if shard_days < 1:
+        raise ValueError("shard_days must be at least 1")
+    shards = []
+    current = start_date
+    while current <= end_date:
+        shard_end = min(current + timedelta(days=shard_days - 1), end_date)
+        shards.append((current, shard_end))
+        current = shard_end + timedelta(days=1)
+    return shards
+
+
+class ShardedRecords:
+    """Async iterator over date-range shards fetched ahead of the consumer.
+    
+    Up to ``concurrency`` shards are fetched at once and their records are
+    yielded in shard (chronological) order. Records that span a shard
+    boundary are only yielded once; since they can only repeat in the next
+    shard, just the current and previous shards' ids are remembered.
+    :meth:`buffered` returns the records fetched but not yet yielded, so a
+    holder of the iterator can account for its memory.
+    """
+    
+    def __init__(
+        self,
+        fetch_shard: Callable[[date, date], Awaitable[List[Dict[str, Any]]]],
+        shards: Sequence[Tuple[date, date]],
+        concurrency: int
+    ):
+        self._fetch_shard = fetch_shard
+        self._remaining = iter(shards)
+        self._concurrency = concurrency
+        self._pending: deque = deque()
+        self._records: List[Dict[str, Any]] = []
+        self._index = 0
+        self._previous_ids: set = set()
+        self._current_ids: set = set()
+        self._started = False
+    
+    def __aiter__(self) -> "ShardedRecords":
+        return self
+    
+    def _schedule(self) -> None:
+        while len(self._pending) < self._concurrency:
+            shard = next(self._remaining, None)
+            if shard is None:
+                return
+            self._pending.append(asyncio.ensure_future(self._fetch_shard(*shard)))
+    
+    async def __anext__(self) -> Dict[str, Any]:
+        if not self._started:
+            self._started = True
+            self._schedule()
+        while True:
+            while self._index < len(self._records):
+                record = self._records[self._index]
+                self._index += 1
+                record_id = record.get("id")
+                if record_id is not None:
+                    seen = record_id in self._previous_ids or record_id in self._current_ids
+                    self._current_ids.add(record_id)
+                    if seen:
+                        continue
+                return record
+            if not self._pending:
+                raise StopAsyncIteration
+            try:
+                records = await self._pending.popleft()
+            except BaseException:
+                await self.aclose()
+                raise
+            self._schedule()
+            self._records, self._index = records, 0
+            self._previous_ids, self._current_ids = self._current_ids, set()
+    
+    def buffered(self) -> List[Dict[str, Any]]:
+        """Records already fetched that have not been yielded yet."""
+        records = self._records[self._index:]
+        for task in self._pending:
+            if task.done() and not task.cancelled() and task.exception() is None:
+                records.extend(task.result())
+        return records
+    
+    async def aclose(self) -> None:
+        """Cancel shards still being fetched and drop buffered records."""
+        pending, self._pending = list(self._pending), deque()
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
+        self._remaining = iter(())
+        self._records, self._index = [], 0
 
 
 class HubstaffClient:
-    """Hubstaff API client with OAuth token management."""
+    """Hubstaff API client with OAuth token management.
+    
+    All requests (API calls and token refreshes) share one long-lived
+    ``httpx.AsyncClient`` so connections, DNS lookups and TLS sessions are
+    reused across tool calls. Call :meth:`aclose` (or use the client as an
+    async context manager) to release the pool on shutdown.
+    """
     
-    def __init__(self):
-        """Initialize the client with refresh token from environment."""
-        self.refresh_token = os.getenv("HUBSTAFF_REFRESH_TOKEN")
+    # POST endpoints whose retries are made safe by looking for the record a
+    # failed attempt may have created (endpoint -> finder method name).
+    _POST_DEDUP_CHECKS = {"/time_entries": "_find_created_time_entry"}
+    
+    def __init__(
+        self,
+        *,
+        refresh_token: Optional[str] = None,
+        http2: Optional[bool] = None,
+        max_connections: Optional[int] = None,
+        max_keepalive_connections: Optional[int] = None,
+        keepalive_expiry: Optional[float] = None,
+        timeout: Optional[float] = None,
+        fetch_concurrency: Optional[int] = None,
+        shard_days: Optional[int] = None,
+        bulk_concurrency: Optional[int] = None,
+        token_refresh_margin: Optional[float] = None,
+        token_cache: Optional[TokenCache] = _TOKEN_CACHE_FROM_ENV,
+        cache_enabled: Optional[bool] = None,
+        cache_policies: Optional[Sequence[CachePolicy]] = None,
+        cache_max_entries: Optional[int] = None,
+        cache_max_bytes: Optional[int] = None,
+        coalesce_requests: Optional[bool] = None,
+        rate_limit: Optional[float] = None,
+        rate_limit_burst: Optional[int] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        json_backend: Optional[str] = None,
+        validate_responses: Optional[bool] = None,
+        metrics: Optional[Metrics] = None,
+        transport: Optional[httpx.AsyncBaseTransport] = None,
+    ):
+        """Initialize the client with refresh token from environment.
+        
+        Args:
+            refresh_token: Hubstaff personal token (HUBSTAFF_REFRESH_TOKEN)
+            http2: Negotiate HTTP/2 when available (defaults to HUBSTAFF_HTTP2,
+                enabled only if the ``h2`` package is installed)
+            max_connections: Pool size limit (HUBSTAFF_MAX_CONNECTIONS)
+            max_keepalive_connections: Idle connections kept open
+                (HUBSTAFF_MAX_KEEPALIVE_CONNECTIONS)
+            keepalive_expiry: Seconds an idle connection is kept alive
+                (HUBSTAFF_KEEPALIVE_EXPIRY)
+            timeout: Per-request timeout in seconds (HUBSTAFF_TIMEOUT)
+            fetch_concurrency: Date-range shards fetched concurrently; 1
+                disables sharding (HUBSTAFF_FETCH_CONCURRENCY)
+            shard_days: Days per date-range shard (HUBSTAFF_SHARD_DAYS)
+            bulk_concurrency: Mutations in flight at once during bulk
+                operations (HUBSTAFF_BULK_CONCURRENCY)
+            token_refresh_margin: Seconds before expiry at which the access
+                token is refreshed in the background
+                (HUBSTAFF_TOKEN_REFRESH_MARGIN)
+            token_cache: On-disk cache used to reuse access tokens across
+                restarts (defaults to the file named by HUBSTAFF_TOKEN_CACHE;
+                None disables it)
+            cache_enabled: Cache reference-data GETs in memory
+                (HUBSTAFF_CACHE_ENABLED)
+            cache_policies: Per-endpoint TTL policies (defaults to
+                DEFAULT_CACHE_POLICIES)
+            cache_max_entries: Response cache entry limit
+                (HUBSTAFF_CACHE_MAX_ENTRIES)
+            cache_max_bytes: Response cache size limit in bytes
+                (HUBSTAFF_CACHE_MAX_BYTES)
+            coalesce_requests: Share one request between identical concurrent
+                GETs (HUBSTAFF_COALESCE_REQUESTS)
+            rate_limit: Requests per second allowed by the client-side token
+                bucket, 0 for no limit (HUBSTAFF_RATE_LIMIT)
+            rate_limit_burst: Token bucket capacity (HUBSTAFF_RATE_LIMIT_BURST)
+            retry_policy: Retry policy for transient failures (defaults to
+                RetryPolicy.from_env())
+            json_backend: JSON library used for request and response bodies:
+                auto, msgspec, orjson or json (HUBSTAFF_JSON_BACKEND)
+            validate_responses: Check list records against the shapes in
+                :mod:`hubstaff_mcp.models` (HUBSTAFF_VALIDATE_RESPONSES)
+            metrics: Where request latencies, statuses and sizes are
+                recorded (defaults to the process-wide registry)
+            transport: Custom httpx transport, mainly for tests
+        """
+        self.refresh_token = refresh_token or os.getenv("HUBSTAFF_REFRESH_TOKEN")
         if not self.refresh_token:
             raise ValueError(
                 "Hubstaff refresh token (personal token) is required. "
@@ -27,25 +294,162 @@ class HubstaffClient:
         self.base_url = "https://api.hubstaff.com/v2"
         self.auth_url = "https://account.hubstaff.com/access_tokens"
         self.access_token = None
+        # Wall-clock (time.time()) expiry of access_token, None when unknown.
         self.token_expires_at = None
+        
+        if http2 is None:
+            http2 = env_bool("HUBSTAFF_HTTP2", True)
+        self.http2 = http2 and _http2_available()
+        self.limits = httpx.Limits(
+            max_connections=max_connections
+            if max_connections is not None
+            else env_int("HUBSTAFF_MAX_CONNECTIONS", DEFAULT_MAX_CONNECTIONS),
+            max_keepalive_connections=max_keepalive_connections
+            if max_keepalive_connections is not None
+            else env_int(
+                "HUBSTAFF_MAX_KEEPALIVE_CONNECTIONS", DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+            ),
+            keepalive_expiry=keepalive_expiry
+            if keepalive_expiry is not None
+            else env_float("HUBSTAFF_KEEPALIVE_EXPIRY", DEFAULT_KEEPALIVE_EXPIRY),
+        )
+        self.timeout = (
+            timeout if timeout is not None else env_float("HUBSTAFF_TIMEOUT", DEFAULT_TIMEOUT)
+        )
+        self.fetch_concurrency = (
+            fetch_concurrency
+            if fetch_concurrency is not None
+            else env_int("HUBSTAFF_FETCH_CONCURRENCY", DEFAULT_FETCH_CONCURRENCY)
+        )
+        self.shard_days = (
+            shard_days if shard_days is not None else env_int("HUBSTAFF_SHARD_DAYS", DEFAULT_SHARD_DAYS)
+        )
+        self.bulk_concurrency = (
+            bulk_concurrency
+            if bulk_concurrency is not None
+            else env_int("HUBSTAFF_BULK_CONCURRENCY", DEFAULT_BULK_CONCURRENCY)
+        )
+        self.token_refresh_margin = (
+            token_refresh_margin
+            if token_refresh_margin is not None
+            else env_float("HUBSTAFF_TOKEN_REFRESH_MARGIN", DEFAULT_TOKEN_REFRESH_MARGIN)
+        )
+        self.token_refresh_count = 0
+        
+        # Reuse a still-valid access token (and any rotated refresh token)
+        # from a previous run so the first call skips the token exchange.
+        self.token_cache = (
+            token_cache if token_cache is not _TOKEN_CACHE_FROM_ENV else TokenCache.from_env()
+        )
+        self._token_cache_key = token_cache_key(self.refresh_token)
+        if self.token_cache is not None:
+            cached = self.token_cache.load(self._token_cache_key)
+            if cached:
+                self.refresh_token = cached.get("refresh_token") or self.refresh_token
+                self.access_token = cached.get("access_token")
+                self.token_expires_at = cached.get("expires_at")
+        if cache_enabled is None:
+            cache_enabled = env_bool("HUBSTAFF_CACHE_ENABLED", True)
+        self.response_cache = ResponseCache(
+            policies=cache_policies if cache_policies is not None else DEFAULT_CACHE_POLICIES,
+            max_entries=cache_max_entries
+            if cache_max_entries is not None
+            else env_int("HUBSTAFF_CACHE_MAX_ENTRIES", DEFAULT_CACHE_MAX_ENTRIES),
+            max_bytes=cache_max_bytes
+            if cache_max_bytes is not None
+            else env_int("HUBSTAFF_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES),
+        ) if cache_enabled else None
+        self._inflight = SingleFlight()
+        self.coalesce_requests = (
+            coalesce_requests
+            if coalesce_requests is not None
+            else env_bool("HUBSTAFF_COALESCE_REQUESTS", True)
+        )
+        self.rate_limiter = RateLimiter(
+            rate=rate_limit
+            if rate_limit is not None
+            else env_float("HUBSTAFF_RATE_LIMIT", DEFAULT_RATE_LIMIT),
+            burst=rate_limit_burst
+            if rate_limit_burst is not None
+            else env_int("HUBSTAFF_RATE_LIMIT_BURST", DEFAULT_RATE_LIMIT_BURST),
+            max_retries=env_int("HUBSTAFF_MAX_THROTTLE_RETRIES", DEFAULT_MAX_THROTTLE_RETRIES),
+        )
+        self.retry_policy = retry_policy if retry_policy is not None else RetryPolicy.from_env()
+        self.retry_stats = {"retries": 0, "exhausted": 0, "deduplicated": 0}
+        self.json = select_backend(json_backend)
+        self.validate_responses = (
+            validate_responses
+            if validate_responses is not None
+            else env_bool("HUBSTAFF_VALIDATE_RESPONSES", False)
+        )
+        self.metrics = metrics if metrics is not None else METRICS
+        self._transport = transport
+        self._http: Optional[httpx.AsyncClient] = None
+        self._refresh_lock: Optional[asyncio.Lock] = None
+        self._background_refresh: Optional[asyncio.Task] = None
+    
+    async def __aenter__(self) -> "HubstaffClient":
+        return self
+    
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+    
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """The shared pooled HTTP client, created on first use."""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=self.http2,
+                limits=self.limits,
+                timeout=self.timeout,
+                transport=self._transport,
+            )
+        return self._http
+    
+    async def aclose(self) -> None:
+        """Close the connection pool. The client reopens it if used again."""
+        if self._background_refresh is not None and not self._background_refresh.done():
+            self._background_refresh.cancel()
+            await asyncio.gather(self._background_refresh, return_exceptions=True)
+        self._background_refresh = None
+        if self._http is not None:
+            http, self._http = self._http, None
+            await http.aclose()
     
     async def _refresh_access_token(self) -> str:
         """Refresh the access token using the refresh token."""
         try:
-            async with httpx.AsyncClient() as client:
-                data = {
-                    "grant_type": "refresh_token",
-                    "refresh_token": self.refresh_token
-                }
-                
-                response = await client.post(self.auth_url, data=data)
-                await response.raise_for_status()
-
-                # Get the JSON response
-                token_data = await response.json()
-
-                # Extract the access token
-                return token_data["access_token"]
+            data = {
+                "grant_type": "refresh_token",
+                "refresh_token": self.refresh_token
+            }
+            
+            response = await self._timed(
+                "POST", self.auth_url, lambda: self.http.post(self.auth_url, data=data)
+            )
+            response.raise_for_status()
+            
+            # Get the JSON response
+            token_data = response.json()
+            
+            # Track expiry so the token can be renewed before it lapses
+            expires_in = token_data.get("expires_in")
+            self.token_expires_at = time.time() + float(expires_in) if expires_in else None
+            self.token_refresh_count += 1
+            
+            # Hubstaff may rotate the refresh token; keep using the newest one
+            if token_data.get("refresh_token"):
+                self.refresh_token = token_data["refresh_token"]
+            if self.token_cache is not None:
+                self.token_cache.save(
+                    self._token_cache_key,
+                    token_data["access_token"],
+                    self.token_expires_at,
+                    self.refresh_token
+                )
+            
+            # Extract the access token
+            return token_data["access_token"]
                 
         except Exception as e:
             # Get error details if it's an HTTP error
@@ -55,58 +459,226 @@ class HubstaffClient:
                 error_text = str(e)
             raise HubstaffAPIError(f"Token refresh failed - {error_text}")
     
-    async def _ensure_access_token(self) -> str:
-        """Ensure we have a valid access token."""
-        if not self.access_token:
+    def _token_seconds_left(self) -> Optional[float]:
+        """Seconds until the access token expires, or None if unknown."""
+        if self.token_expires_at is None:
+            return None
+        return self.token_expires_at - time.time()
+    
+    def _token_expired(self) -> bool:
+        """Return True if the access token is missing or past its expiry."""
+        seconds_left = self._token_seconds_left()
+        return not self.access_token or (seconds_left is not None and seconds_left <= 0)
+    
+    async def refresh_access_token(self, stale_token: Optional[str] = None) -> str:
+        """Replace ``stale_token`` with a fresh access token, one refresh at a time.
+        
+        Concurrent callers queue on a lock; whoever gets there first performs
+        the refresh and everyone behind it reuses the new token instead of
+        issuing their own POST to the auth endpoint.
+        """
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        
+        async with self._refresh_lock:
+            if self.access_token != stale_token and not self._token_expired():
+                return self.access_token
             self.access_token = await self._refresh_access_token()
-        return self.access_token
+            return self.access_token
     
-    async def _make_request(
-        self, 
-        method: str, 
-        endpoint: str, 
+    async def prewarm(self) -> None:
+        """Get an access token and connect to the API ahead of the first call.
+        
+        Reuses a cached token when it is still valid; fetching the current
+        user then leaves a pooled connection to the API host open.
+        """
+        with TRACER.span("prewarm"):
+            await self._ensure_access_token()
+            await self.get_current_user()
+    
+    async def warm_reference_data(self) -> None:
+        """Fetch organizations and their users, projects and teams into the response cache.
+        
+        Makes the same requests as the list tools, with and without an
+        organization filter, one at a time and at bulk priority so they
+        queue behind interactive calls for the rate limit. Cached entries
+        are refetched (conditionally when they carry a validator) and
+        replaced in place, so repeating this before they expire keeps them
+        fresh without a gap.
+        """
+        if self.response_cache is None:
+            return
+        token = _refreshing_cache.set(True)
+        try:
+            with TRACER.span("warm"), bulk_requests():
+                organizations = await self.get_organizations()
+                for organization_id in [None, *(org["id"] for org in organizations if "id" in org)]:
+                    await self.get_users(organization_id)
+                    await self.get_projects(organization_id)
+                    if organization_id is not None:
+                        await self.get_teams(organization_id)
+        finally:
+            _refreshing_cache.reset(token)
+    
+    def _schedule_background_refresh(self) -> None:
+        """Start a background refresh unless one is already running."""
+        if self._background_refresh is not None and not self._background_refresh.done():
+            return
+        
+        async def refresh() -> None:
+            try:
+                await self.refresh_access_token(stale_token=self.access_token)
+            except HubstaffAPIError as e:
+                # The current token is still valid; the next call retries.
+                logger.warning("Background token refresh failed: %s", e)
+        
+        self._background_refresh = asyncio.ensure_future(refresh())
+    
+    async def _ensure_access_token(self) -> str:
+        """Ensure we have a valid access token.
+        
+        Expired (or missing) tokens are refreshed before returning. Tokens
+        within ``token_refresh_margin`` of expiry are returned immediately
+        while a single background refresh renews them.
+        """
+        with TRACER.span("token.ensure") as span:
+            if self._token_expired():
+                if span is not None:
+                    span.set("token.refreshed", True)
+                return await self.refresh_access_token(stale_token=self.access_token)
+            seconds_left = self._token_seconds_left()
+            if seconds_left is not None and seconds_left <= self.token_refresh_margin:
+                self._schedule_background_refresh()
+            return self.access_token
+    
+    async def _timed(
+        self,
+        method: str,
+        url: str,
+        send: Callable[[], Awaitable[httpx.Response]]
+    ) -> httpx.Response:
+        """Run ``send`` and record its latency, status and (if read) body size."""
+        with TRACER.span(f"http {method}", **{"http.method": method, "url.path": endpoint_label(url)}) as span:
+            started = time.perf_counter()
+            try:
+                response = await send()
+            except Exception as e:
+                self.metrics.observe_request(method, url, time.perf_counter() - started, error=e)
+                raise
+            # A streamed body still being read is counted by _stream_records
+            size = len(response.content) if response.is_closed else None
+            self.metrics.observe_request(
+                method, url, time.perf_counter() - started, response.status_code, size
+            )
+            if span is not None:
+                span.set("http.status_code", response.status_code)
+                span.set("http.response_size", size if size is not None else -1)
+            return response
+    
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
         data: Optional[Dict[str, Any]] = None,
-        params: Optional[Dict[str, Any]] = None
-    ) -> Dict[str, Any]:
-        """Make an authenticated request to the Hubstaff API."""
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> httpx.Response:
+        """Send a single request over the shared connection pool.
+        
+        With ``stream``, a successful GET is returned with its body unread
+        and the caller must close it; error bodies are always read.
+        """
+        method = method.upper()
+        return await self._timed(
+            method, url, lambda: self._dispatch(method, url, headers, data, params, stream)
+        )
+    
+    async def _dispatch(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Optional[Dict[str, Any]],
+        params: Optional[Dict[str, Any]],
+        stream: bool
+    ) -> httpx.Response:
+        if method == "GET" and stream:
+            request = self.http.build_request("GET", url, headers=headers, params=params)
+            response = await self.http.send(request, stream=True)
+            if not response.is_success:
+                await response.aread()
+            return response
+        if method == "GET":
+            return await self.http.get(url, headers=headers, params=params)
+        elif method == "POST":
+            return await self.http.post(url, headers=headers, content=self.json.dumps(data))
+        elif method == "PUT":
+            return await self.http.put(url, headers=headers, content=self.json.dumps(data))
+        elif method == "DELETE":
+            return await self.http.delete(url, headers=headers)
+        raise ValueError(f"Unsupported HTTP method: {method}")
+    
+    async def _send_limited(
+        self,
+        method: str,
+        url: str,
+        headers: Dict[str, str],
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        stream: bool = False
+    ) -> httpx.Response:
+        """Send through the rate limiter, backing off and retrying on 429."""
+        limiter = self.rate_limiter
+        attempt = 0
+        while True:
+            await limiter.acquire()
+            response = await self._send(
+                method, url, headers, data=data, params=params, stream=stream
+            )
+            limiter.observe(response)
+            if response.status_code != 429 or attempt >= limiter.max_retries:
+                return response
+            limiter.on_throttled(response, attempt)
+            attempt += 1
+    
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        stream: bool = False
+    ) -> httpx.Response:
+        """Send an authenticated request, refreshing the token once on 401."""
         access_token = await self._ensure_access_token()
         url = f"{self.base_url}{endpoint}"
         
         headers = {
             "Authorization": f"Bearer {access_token}",
-            "Content-Type": "application/json"
+            "Content-Type": "application/json",
+            **(headers or {})
         }
         
         try:
-            async with httpx.AsyncClient() as client:
-                if method.upper() == "GET":
-                    response = await client.get(url, headers=headers, params=params)
-                elif method.upper() == "POST":
-                    response = await client.post(url, headers=headers, json=data)
-                elif method.upper() == "PUT":
-                    response = await client.put(url, headers=headers, json=data)
-                elif method.upper() == "DELETE":
-                    response = await client.delete(url, headers=headers)
-                else:
-                    raise ValueError(f"Unsupported HTTP method: {method}")
-                
-                # Handle 401 Unauthorized - token might be expired
-                if response.status_code == 401:
-                    # Refresh token and retry once
-                    self.access_token = await self._refresh_access_token()
-                    headers["Authorization"] = f"Bearer {self.access_token}"
-                    
-                    if method.upper() == "GET":
-                        response = await client.get(url, headers=headers, params=params)
-                    elif method.upper() == "POST":
-                        response = await client.post(url, headers=headers, json=data)
-                    elif method.upper() == "PUT":
-                        response = await client.put(url, headers=headers, json=data)
-                    elif method.upper() == "DELETE":
-                        response = await client.delete(url, headers=headers)
-                
+            response = await self._send_limited(
+                method, url, headers, data=data, params=params, stream=stream
+            )
+            
+            # Handle 401 Unauthorized - token might be expired
+            if response.status_code == 401:
+                # Refresh token (once across concurrent callers) and retry once
+                access_token = await self.refresh_access_token(stale_token=access_token)
+                headers["Authorization"] = f"Bearer {access_token}"
+                response = await self._send_limited(
+                    method, url, headers, data=data, params=params, stream=stream
+                )
+            
+            # 304 Not Modified answers a conditional request; the caller handles it
+            if response.status_code != 304:
                 response.raise_for_status()
-                return response.json()
+            return response
                 
         except Exception as e:
             # Get error details if it's an HTTP error
@@ -118,7 +690,307 @@ class HubstaffClient:
                     error_msg = f"HTTP {e.response.status_code}: {e.response.text}"
             else:
                 error_msg = f"Request failed: {str(e)}"
-            raise HubstaffAPIError(error_msg)
+            status_code = e.response.status_code if hasattr(e, 'response') else None
+            raise HubstaffAPIError(error_msg, status_code=status_code) from e
+    
+    async def _with_retry(
+        self,
+        method: str,
+        operation: Callable[[], Awaitable[Any]],
+        idempotency_key: Optional[str] = None,
+        dedup_check: Optional[Callable[[], Awaitable[Optional[Dict[str, Any]]]]] = None
+    ) -> Any:
+        """Run ``operation``, retrying transient failures per ``retry_policy``.
+        
+        Non-idempotent requests are only retried with an idempotency key, or
+        when ``dedup_check`` confirms the failed attempt did not take effect;
+        if it finds the result of that attempt, the result is returned as-is.
+        If ``dedup_check`` raises, it can't tell, and the original error is
+        raised instead of risking a duplicate.
+        """
+        policy = self.retry_policy
+        safe = policy.is_idempotent(method) or idempotency_key is not None
+        attempt = 1
+        while True:
+            try:
+                return await operation()
+            except HubstaffAPIError as e:
+                retryable = policy.is_retryable(e.status_code, e.__cause__)
+                if not retryable or not (safe or dedup_check is not None):
+                    raise
+                if attempt >= policy.max_attempts:
+                    self.retry_stats["exhausted"] += 1
+                    raise
+                error = e
+            
+            await asyncio.sleep(policy.backoff(attempt))
+            if not safe:
+                try:
+                    existing = await dedup_check()
+                except Exception:
+                    raise error
+                if existing is not None:
+                    self.retry_stats["deduplicated"] += 1
+                    return existing
+            self.retry_stats["retries"] += 1
+            attempt += 1
+    
+    def _decode(self, response: httpx.Response) -> Dict[str, Any]:
+        """Decode a JSON response body; empty bodies (e.g. 204) decode to {}."""
+        if not response.content:
+            return {}
+        with TRACER.span("decode", **{"json.backend": self.json.name, "bytes": len(response.content)}):
+            try:
+                return self.json.loads(response.content)
+            except ValueError as e:
+                raise HubstaffAPIError(f"Request failed: {str(e)}")
+    
+    def _validate(self, key: str, records: List[Dict[str, Any]]) -> None:
+        """Check records listed under ``key`` if response validation is on."""
+        model = RECORD_TYPES.get(key)
+        if not self.validate_responses or model is None:
+            return
+        try:
+            validate_records(records, model)
+        except ValueError as e:
+            raise HubstaffAPIError(f"Unexpected response from Hubstaff: {e}") from e
+    
+    async def _make_request(
+        self, 
+        method: str, 
+        endpoint: str, 
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        idempotency_key: Optional[str] = None,
+        dedup_check: Optional[Callable[[], Awaitable[Optional[Dict[str, Any]]]]] = None
+    ) -> Dict[str, Any]:
+        """Make an authenticated request to the Hubstaff API.
+        
+        Identical concurrent GETs (same endpoint and params) share one
+        request and its decoded result, which callers must not modify. GETs
+        for endpoints with a cache policy are served from the response
+        cache. Expired entries with an ETag/Last-Modified are refetched
+        conditionally and reused on 304. Writes invalidate the cached
+        resources they affect.
+        
+        Transient failures are retried per ``retry_policy``; see
+        :meth:`_with_retry` for when POSTs are considered safe to retry.
+        """
+        method = method.upper()
+        cache = self.response_cache
+        policy = cache.policy_for(endpoint) if cache is not None and method == "GET" else None
+        
+        if policy is None and method == "GET" and self.coalesce_requests:
+            # Identical concurrent GETs share one request
+            return await self._inflight.do(
+                request_key(method, endpoint, params),
+                lambda: self._with_retry(
+                    method, lambda: self._get_decoded(endpoint, params)
+                )
+            )
+        
+        if policy is None:
+            headers = {"Idempotency-Key": idempotency_key} if idempotency_key else None
+            finder_name = self._POST_DEDUP_CHECKS.get(endpoint) if method == "POST" else None
+            if dedup_check is None and finder_name is not None and data is not None:
+                finder = getattr(self, finder_name)
+                dedup_check = lambda: finder(data)
+            
+            async def send() -> Dict[str, Any]:
+                response = await self._request(
+                    method, endpoint, data=data, params=params, headers=headers
+                )
+                return self._decode(response)
+            
+            try:
+                return await self._with_retry(method, send, idempotency_key, dedup_check)
+            finally:
+                if cache is not None and method != "GET":
+                    cache.invalidate_for_mutation(endpoint)
+        
+        key = cache_key(endpoint, params)
+        if not _refreshing_cache.get():
+            cached = cache.get(key)
+            if cached is not None:
+                return cached
+        
+        async def fill() -> Dict[str, Any]:
+            generation = cache.generation(policy.tag)
+            # Revalidate an expired entry instead of re-downloading it
+            stale = cache.get_stale(key)
+            headers = stale.conditional_headers() if stale is not None else None
+            response = await self._with_retry(
+                "GET", lambda: self._request("GET", endpoint, params=params, headers=headers)
+            )
+            if response.status_code == 304 and stale is not None:
+                result = cache.revalidate(key, policy, generation)
+                if result is not None:
+                    return result
+                response = await self._with_retry(
+                    "GET", lambda: self._request("GET", endpoint, params=params)
+                )
+            result = self._decode(response)
+            cache.set(
+                key,
+                result,
+                policy,
+                len(response.content),
+                generation,
+                etag=response.headers.get("ETag"),
+                last_modified=response.headers.get("Last-Modified")
+            )
+            return result
+        
+        return await self._inflight.do(request_key(method, endpoint, params), fill)
+    
+    async def _get_decoded(
+        self,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        return self._decode(await self._request("GET", endpoint, params=params))
+    
+    def invalidate_cache(self, *tags: str) -> None:
+        """Drop cached responses for ``tags`` (e.g. "projects"), or all of them."""
+        if self.response_cache is not None:
+            self.response_cache.invalidate(*tags)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Counters for request coalescing, caching, retries and rate limiting."""
+        return {
+            "coalescing": self._inflight.stats(),
+            "cache": self.response_cache.stats() if self.response_cache is not None else None,
+            "retries": dict(self.retry_stats),
+            "rate_limit": {
+                "throttled": self.rate_limiter.throttled,
+                "queued": self.rate_limiter.queued,
+                "remaining": self.rate_limiter.remaining,
+            },
+            "token_refreshes": self.token_refresh_count,
+        }
+    
+    async def _stream_records(
+        self,
+        endpoint: str,
+        key: str,
+        params: Dict[str, Any],
+        members: Dict[str, Any]
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield records under ``key`` from one page as its body arrives.
+        
+        Only one record (plus the unparsed tail of the body) is held in
+        memory at a time. The other top-level members, such as
+        ``pagination``, are stored in ``members`` once the page is consumed.
+        Opening the response is retried like any GET; a failure after
+        records have been yielded is raised to the caller. Parsing is traced
+        as one "decode" span per chunk of the body, since the page is decoded
+        while it downloads.
+        """
+        response = await self._with_retry(
+            "GET", lambda: self._request("GET", endpoint, params=params, stream=True)
+        )
+        
+        def timer(size: int) -> ContextManager[Any]:
+            return TRACER.span("decode", **{"json.backend": "stream", "bytes": size})
+        
+        try:
+            async for record in iter_json_array(response.aiter_bytes(), key, members, timer):
+                yield record
+        except (httpx.HTTPError, ValueError) as e:
+            raise HubstaffAPIError(f"Request failed: {str(e)}") from e
+        finally:
+            await response.aclose()
+            self.metrics.add_bytes("GET", f"{self.base_url}{endpoint}", response.num_bytes_downloaded)
+    
+    async def _paginate(
+        self,
+        endpoint: str,
+        key: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_limit: Optional[int] = None,
+        stream: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Yield records under ``key`` from every page of a list endpoint.
+        
+        Follows Hubstaff's ``pagination.next_page_start_id`` cursor. Pages are
+        requested lazily, so a caller that stops iterating early never
+        triggers the next page fetch. With ``stream``, each page is decoded
+        incrementally (see :meth:`_stream_records`) instead of as a whole.
+        """
+        params = dict(params or {})
+        if page_limit:
+            params["page_limit"] = page_limit
+        
+        while True:
+            if stream:
+                response = {}
+                async for record in self._stream_records(endpoint, key, params, response):
+                    self._validate(key, [record])
+                    yield record
+            else:
+                response = await self._make_request("GET", endpoint, params=params)
+                records = response.get(key, [])
+                self._validate(key, records)
+                for record in records:
+                    yield record
+            
+            next_start_id = (response.get("pagination") or {}).get("next_page_start_id")
+            if not next_start_id or next_start_id == params.get("page_start_id"):
+                return
+            params["page_start_id"] = next_start_id
+    
+    def _iter_date_range(
+        self,
+        iter_range: Callable[[date, date], AsyncIterator[Dict[str, Any]]],
+        start_date: Optional[date],
+        end_date: Optional[date],
+        concurrency: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over records for a date range, prefetching day shards concurrently.
+        
+        The range is split into ``shard_days``-sized shards, fetched by a
+        :class:`ShardedRecords` with up to ``concurrency`` shards ahead of
+        the consumer, so memory stays bounded by the lookahead window. Falls
+        back to a single serial scan when the range is open-ended, fits in
+        one shard or concurrency is 1.
+        """
+        concurrency = concurrency or self.fetch_concurrency
+        shards = (
+            date_shards(start_date, end_date, self.shard_days)
+            if start_date and end_date
+            else []
+        )
+        if concurrency <= 1 or len(shards) <= 1:
+            return iter_range(start_date, end_date)
+        
+        async def fetch_shard(shard_start: date, shard_end: date) -> List[Dict[str, Any]]:
+            return [record async for record in iter_range(shard_start, shard_end)]
+        
+        return ShardedRecords(fetch_shard, shards, concurrency)
+    
+    @staticmethod
+    def _filter_params(
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        user_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None,
+        organization_id: Optional[int] = None
+    ) -> Dict[str, Any]:
+        """Build the query parameters shared by the filtered list endpoints."""
+        params = {}
+        
+        if start_date:
+            params["start_date"] = start_date.strftime("%Y-%m-%d")
+        if end_date:
+            params["end_date"] = end_date.strftime("%Y-%m-%d")
+        if user_ids:
+            params["user_ids"] = ",".join(map(str, user_ids))
+        if project_ids:
+            params["project_ids"] = ",".join(map(str, project_ids))
+        if organization_id:
+            params["organization_id"] = organization_id
+        
+        return params
     
     # API Methods
     
@@ -127,44 +999,65 @@ class HubstaffClient:
         response = await self._make_request("GET", "/users/me")
         return response.get("user", response)
     
+    def iter_users(
+        self,
+        organization_id: Optional[int] = None,
+        page_limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over organization users across all pages."""
+        params = self._filter_params(organization_id=organization_id)
+        return self._paginate("/users", "users", params, page_limit)
+    
     async def get_users(self, organization_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get organization users."""
-        endpoint = "/users"
-        params = {}
-        if organization_id:
-            params["organization_id"] = organization_id
-        
-        response = await self._make_request("GET", endpoint, params=params)
-        return response.get("users", [])
+        return [user async for user in self.iter_users(organization_id)]
     
     async def get_organizations(self) -> List[Dict[str, Any]]:
         """Get user organizations."""
         response = await self._make_request("GET", "/organizations")
         return response.get("organizations", [])
     
+    def iter_projects(
+        self,
+        organization_id: Optional[int] = None,
+        page_limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over projects across all pages."""
+        params = self._filter_params(organization_id=organization_id)
+        return self._paginate("/projects", "projects", params, page_limit)
+    
     async def get_projects(self, organization_id: Optional[int] = None) -> List[Dict[str, Any]]:
         """Get list of projects."""
-        endpoint = "/projects"
-        params = {}
-        if organization_id:
-            params["organization_id"] = organization_id
-        
-        response = await self._make_request("GET", endpoint, params=params)
-        return response.get("projects", [])
+        return [project async for project in self.iter_projects(organization_id)]
     
     async def get_project(self, project_id: int) -> Dict[str, Any]:
         """Get detailed information about a specific project."""
         response = await self._make_request("GET", f"/projects/{project_id}")
         return response.get("project", response)
     
+    def iter_tasks(
+        self,
+        project_id: int,
+        page_limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over a project's tasks across all pages."""
+        return self._paginate(f"/projects/{project_id}/tasks", "tasks", page_limit=page_limit)
+    
     async def get_tasks(self, project_id: int) -> List[Dict[str, Any]]:
         """Get tasks for a specific project."""
-        response = await self._make_request("GET", f"/projects/{project_id}/tasks")
-        return response.get("tasks", [])
+        return [task async for task in self.iter_tasks(project_id)]
     
-    async def create_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a new task."""
-        response = await self._make_request("POST", "/tasks", data=task_data)
+    async def create_task(
+        self,
+        task_data: Dict[str, Any],
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a new task.
+        
+        Failed attempts are only retried when ``idempotency_key`` is given.
+        """
+        retry_options = {"idempotency_key": idempotency_key} if idempotency_key else {}
+        response = await self._make_request("POST", "/tasks", data=task_data, **retry_options)
         return response.get("task", response)
     
     async def get_teams(self, organization_id: int) -> List[Dict[str, Any]]:
@@ -172,36 +1065,140 @@ class HubstaffClient:
         response = await self._make_request("GET", f"/organizations/{organization_id}/teams")
         return response.get("teams", [])
     
+    def iter_time_entries(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        user_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None,
+        organization_id: Optional[int] = None,
+        page_limit: Optional[int] = None,
+        concurrency: Optional[int] = 1,
+        stream: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over time entries across all pages, with optional filtering.
+        
+        With ``concurrency`` above 1 (None uses ``fetch_concurrency``), a
+        bounded date range is prefetched as concurrent day shards. ``stream``
+        decodes each page incrementally, for callers that consume records
+        one at a time.
+        """
+        return self._iter_date_range(
+            lambda start, end: self._paginate(
+                "/time_entries",
+                "time_entries",
+                self._filter_params(start, end, user_ids, project_ids, organization_id),
+                page_limit,
+                stream
+            ),
+            start_date,
+            end_date,
+            concurrency
+        )
+    
     async def get_time_entries(
         self,
         start_date: Optional[date] = None,
         end_date: Optional[date] = None,
         user_ids: Optional[List[int]] = None,
         project_ids: Optional[List[int]] = None,
-        organization_id: Optional[int] = None
+        organization_id: Optional[int] = None,
+        concurrency: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Get time entries with optional filtering."""
-        params = {}
+        """Get time entries with optional filtering.
         
-        if start_date:
-            params["start_date"] = start_date.strftime("%Y-%m-%d")
-        if end_date:
-            params["end_date"] = end_date.strftime("%Y-%m-%d")
-        if user_ids:
-            params["user_ids"] = ",".join(map(str, user_ids))
-        if project_ids:
-            params["project_ids"] = ",".join(map(str, project_ids))
-        if organization_id:
-            params["organization_id"] = organization_id
-        
-        response = await self._make_request("GET", "/time_entries", params=params)
-        return response.get("time_entries", [])
+        Bounded date ranges are fetched as concurrent day shards (see
+        ``fetch_concurrency``); pass ``concurrency=1`` for a serial scan.
+        """
+        entries = self.iter_time_entries(
+            start_date,
+            end_date,
+            user_ids,
+            project_ids,
+            organization_id,
+            concurrency=concurrency
+        )
+        return [entry async for entry in entries]
+    
+    async def load_time_entries(
+        self,
+        start_date: Optional[date] = None,
+        end_date: Optional[date] = None,
+        user_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None,
+        organization_id: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> ColumnStore:
+        """Get time entries decoded into a compact :class:`ColumnStore`."""
+        store = ColumnStore(time_field="starts_at")
+        return await store.extend_async(self.iter_time_entries(
+            start_date,
+            end_date,
+            user_ids,
+            project_ids,
+            organization_id,
+            concurrency=concurrency,
+            stream=True
+        ))
     
-    async def create_time_entry(self, time_entry_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Create a new time entry."""
-        response = await self._make_request("POST", "/time_entries", data=time_entry_data)
+    async def create_time_entry(
+        self,
+        time_entry_data: Dict[str, Any],
+        idempotency_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Create a new time entry.
+        
+        A transient failure is retried only after checking that the failed
+        attempt didn't create the entry anyway (same user, project, start time
+        and task; see ``_POST_DEDUP_CHECKS``), so retries never produce
+        duplicates. If that can't be checked, the failure is raised.
+        """
+        retry_options = {"idempotency_key": idempotency_key} if idempotency_key else {}
+        response = await self._make_request(
+            "POST", "/time_entries", data=time_entry_data, **retry_options
+        )
         return response.get("time_entry", response)
     
+    async def _find_created_time_entry(
+        self,
+        time_entry_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Look up the entry a failed POST of ``time_entry_data`` may have created.
+        
+        Matches entries of the same user (``user_id``, else the token's
+        user), project and task that start at the same instant, compared in
+        UTC; timestamps without an offset are taken as UTC. Entries are
+        searched a day either side of the start, whatever time zone the API
+        filters dates in. Returns None if there is no such entry; raises
+        ValueError if the request can't be matched reliably.
+        """
+        starts_at = _parse_utc(time_entry_data.get("starts_at"))
+        if starts_at is None or "project_id" not in time_entry_data:
+            raise ValueError("time entry has no parseable starts_at or project_id")
+        user_id = time_entry_data.get("user_id")
+        if user_id is None:
+            user_id = (await self.get_current_user()).get("id")
+            if user_id is None:
+                raise ValueError("the current user is unknown")
+        
+        day = starts_at.date()
+        entries = await self.get_time_entries(
+            start_date=day - timedelta(days=1),
+            end_date=day + timedelta(days=1),
+            user_ids=[user_id],
+            project_ids=[time_entry_data["project_id"]],
+            concurrency=1
+        )
+        for entry in entries:
+            if str(entry.get("user_id")) != str(user_id):
+                continue
+            if _parse_utc(entry.get("starts_at")) != starts_at:
+                continue
+            if "task_id" in time_entry_data and entry.get("task_id") != time_entry_data["task_id"]:
+                continue
+            return {"time_entry": entry}
+        return None
+    
     async def update_time_entry(self, entry_id: int, updates: Dict[str, Any]) -> Dict[str, Any]:
         """Update an existing time entry."""
         response = await self._make_request("PUT", f"/time_entries/{entry_id}", data=updates)
@@ -211,47 +1208,189 @@ class HubstaffClient:
         """Delete a time entry."""
         await self._make_request("DELETE", f"/time_entries/{entry_id}")
     
+    async def _run_bulk(
+        self,
+        items: Sequence[Any],
+        operation: Callable[[Any], Awaitable[Any]],
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Apply ``operation`` to every item with bounded concurrency.
+        
+        Requests run at bulk priority so interactive tool calls are served
+        first. Returns one report per item, in input order:
+        ``{"index", "ok", "result"}`` on success or ``{"index", "ok",
+        "error"}`` on failure. One item failing does not stop the others.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency or self.bulk_concurrency))
+        
+        async def run(index: int, item: Any) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    result = await operation(item)
+                except Exception as e:
+                    return {"index": index, "ok": False, "error": str(e)}
+                return {"index": index, "ok": True, "result": result}
+        
+        with bulk_requests():
+            return await asyncio.gather(*(run(i, item) for i, item in enumerate(items)))
+    
+    async def bulk_create_time_entries(
+        self,
+        entries: Sequence[Dict[str, Any]],
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Create many time entries concurrently; see :meth:`_run_bulk` for the report."""
+        return await self._run_bulk(entries, self.create_time_entry, concurrency)
+    
+    async def bulk_update_time_entries(
+        self,
+        updates: Sequence[Dict[str, Any]],
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Update many time entries concurrently.
+        
+        Each item holds the entry ``id`` plus the fields to change.
+        """
+        async def update(item: Dict[str, Any]) -> Dict[str, Any]:
+            fields = {key: value for key, value in item.items() if key != "id"}
+            return await self.update_time_entry(item["id"], fields)
+        
+        return await self._run_bulk(updates, update, concurrency)
+    
+    async def bulk_delete_time_entries(
+        self,
+        entry_ids: Sequence[int],
+        concurrency: Optional[int] = None
+    ) -> List[Dict[str, Any]]:
+        """Delete many time entries concurrently."""
+        return await self._run_bulk(entry_ids, self.delete_time_entry, concurrency)
+    
+    def iter_activities(
+        self,
+        start_date: date,
+        end_date: date,
+        user_ids: Optional[List[int]] = None,
+        organization_id: Optional[int] = None,
+        page_limit: Optional[int] = None,
+        concurrency: Optional[int] = 1,
+        stream: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over user activities for a date range across all pages.
+        
+        With ``concurrency`` above 1 (None uses ``fetch_concurrency``), the
+        range is prefetched as concurrent day shards. ``stream`` decodes each
+        page incrementally, for callers that consume records one at a time.
+        """
+        return self._iter_date_range(
+            lambda start, end: self._paginate(
+                "/activities",
+                "activities",
+                self._filter_params(start, end, user_ids, organization_id=organization_id),
+                page_limit,
+                stream
+            ),
+            start_date,
+            end_date,
+            concurrency
+        )
+    
     async def get_activities(
         self,
         start_date: date,
         end_date: date,
         user_ids: Optional[List[int]] = None,
-        organization_id: Optional[int] = None
+        organization_id: Optional[int] = None,
+        concurrency: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Get user activities for a date range."""
-        params = {
-            "start_date": start_date.strftime("%Y-%m-%d"),
-            "end_date": end_date.strftime("%Y-%m-%d")
-        }
+        """Get user activities for a date range.
         
-        if user_ids:
-            params["user_ids"] = ",".join(map(str, user_ids))
-        if organization_id:
-            params["organization_id"] = organization_id
+        The range is fetched as concurrent day shards (see
+        ``fetch_concurrency``); pass ``concurrency=1`` for a serial scan.
+        """
+        activities = self.iter_activities(
+            start_date, end_date, user_ids, organization_id, concurrency=concurrency
+        )
+        return [activity async for activity in activities]
+    
+    async def load_activities(
+        self,
+        start_date: date,
+        end_date: date,
+        user_ids: Optional[List[int]] = None,
+        organization_id: Optional[int] = None,
+        concurrency: Optional[int] = None
+    ) -> ColumnStore:
+        """Get activities decoded into a compact :class:`ColumnStore`.
+        
+        Records are decoded into the store as each response body arrives, so
+        neither the raw pages nor a full list of dicts is held in memory.
+        """
+        store = ColumnStore(time_field="time_slot")
+        return await store.extend_async(self.iter_activities(
+            start_date, end_date, user_ids, organization_id, concurrency=concurrency, stream=True
+        ))
+    
+    def iter_screenshots(
+        self,
+        start_date: date,
+        end_date: date,
+        user_ids: Optional[List[int]] = None,
+        organization_id: Optional[int] = None,
+        page_limit: Optional[int] = None,
+        concurrency: Optional[int] = 1,
+        stream: bool = False
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over screenshots for a date range across all pages.
         
-        response = await self._make_request("GET", "/activities", params=params)
-        return response.get("activities", [])
+        With ``concurrency`` above 1 (None uses ``fetch_concurrency``), the
+        range is prefetched as concurrent day shards. ``stream`` decodes each
+        page incrementally, for callers that consume records one at a time.
+        """
+        return self._iter_date_range(
+            lambda start, end: self._paginate(
+                "/screenshots",
+                "screenshots",
+                self._filter_params(start, end, user_ids, organization_id=organization_id),
+                page_limit,
+                stream
+            ),
+            start_date,
+            end_date,
+            concurrency
+        )
     
     async def get_screenshots(
         self,
         start_date: date,
         end_date: date,
         user_ids: Optional[List[int]] = None,
-        organization_id: Optional[int] = None
+        organization_id: Optional[int] = None,
+        concurrency: Optional[int] = None
     ) -> List[Dict[str, Any]]:
-        """Get screenshots for a date range."""
-        params = {
-            "start_date": start_date.strftime("%Y-%m-%d"),
-            "end_date": end_date.strftime("%Y-%m-%d")
-        }
-        
-        if user_ids:
-            params["user_ids"] = ",".join(map(str, user_ids))
-        if organization_id:
-            params["organization_id"] = organization_id
+        """Get screenshots for a date range.
         
-        response = await self._make_request("GET", "/screenshots", params=params)
-        return response.get("screenshots", [])
+        The range is fetched as concurrent day shards (see
+        ``fetch_concurrency``); pass ``concurrency=1`` for a serial scan.
+        """
+        screenshots = self.iter_screenshots(
+            start_date, end_date, user_ids, organization_id, concurrency=concurrency
+        )
+        return [screenshot async for screenshot in screenshots]
+    
+    def iter_timesheets(
+        self,
+        start_date: date,
+        end_date: date,
+        user_ids: Optional[List[int]] = None,
+        project_ids: Optional[List[int]] = None,
+        organization_id: Optional[int] = None,
+        page_limit: Optional[int] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Iterate over timesheet rows for a date range across all pages."""
+        params = self._filter_params(
+            start_date, end_date, user_ids, project_ids, organization_id
+        )
+        return self._paginate("/timesheets", "timesheets", params, page_limit)
     
     async def get_timesheets(
         self,
@@ -262,17 +1401,8 @@ class HubstaffClient:
         organization_id: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """Generate timesheets for a date range."""
-        params = {
-            "start_date": start_date.strftime("%Y-%m-%d"),
-            "end_date": end_date.strftime("%Y-%m-%d")
-        }
-        
-        if user_ids:
-            params["user_ids"] = ",".join(map(str, user_ids))
-        if project_ids:
-            params["project_ids"] = ",".join(map(str, project_ids))
-        if organization_id:
-            params["organization_id"] = organization_id
-        
-        response = await self._make_request("GET", "/timesheets", params=params)
-        return response.get("timesheets", [])
+        return [
+            timesheet async for timesheet in self.iter_timesheets(
+                start_date, end_date, user_ids, project_ids, organization_id
+            )
+        ]
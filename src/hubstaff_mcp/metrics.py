@@ -0,0 +1,242 @@
+"""In-process latency histograms and counters for tool calls and API requests."""
+
+import re
+import time
+from bisect import bisect_left
+from collections import Counter
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+
+# Upper bounds, in seconds, of the latency histogram buckets
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+@lru_cache(maxsize=1024)
+def endpoint_label(url: str) -> str:
+    """Collapse numeric IDs in a request URL's path so labels stay bounded.
+    
+    ``https://api.hubstaff.com/v2/projects/42/tasks`` becomes
+    ``/v2/projects/{id}/tasks``.
+    """
+    return _ID_SEGMENT.sub("/{id}", urlsplit(url).path)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (cumulative when exported)."""
+    
+    __slots__ = ("buckets", "counts", "count", "sum")
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        # One count per bucket plus the +Inf overflow
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+    
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+    
+    def quantile(self, q: float) -> Optional[float]:
+        """Upper bound of the bucket holding the ``q`` quantile (None if empty)."""
+        if self.count == 0:
+            return None
+        rank = q * self.count
+        seen = 0
+        for bound, count in zip(self.buckets, self.counts):
+            seen += count
+            if seen >= rank:
+                return bound
+        return float("inf")
+    
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.sum / self.count * 1000, 1) if self.count else None,
+            "p50_ms": _ms(self.quantile(0.5)),
+            "p95_ms": _ms(self.quantile(0.95)),
+            "p99_ms": _ms(self.quantile(0.99)),
+        }
+
+
+def _ms(seconds: Optional[float]) -> Optional[float]:
+    if seconds is None or seconds == float("inf"):
+        return seconds
+    return round(seconds * 1000, 1)
+
+
+class Metrics:
+    """Per-tool and per-endpoint latency, sizes, statuses and error classes.
+    
+    Recording is a dictionary lookup and a bisect, cheap enough to leave
+    on for every call. Read the numbers with :meth:`snapshot` or
+    :meth:`render_prometheus`.
+    """
+    
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.started = time.time()
+        self.tool_latency: Dict[str, Histogram] = {}
+        self.tool_errors: Counter = Counter()
+        self.tool_records: Counter = Counter()
+        self.request_latency: Dict[Tuple[str, str], Histogram] = {}
+        self.responses: Counter = Counter()
+        self.request_errors: Counter = Counter()
+        self.bytes_received: Counter = Counter()
+    
+    def _histogram(self, table: Dict[Any, Histogram], key: Any) -> Histogram:
+        histogram = table.get(key)
+        if histogram is None:
+            histogram = table[key] = Histogram(self.buckets)
+        return histogram
+    
+    def observe_tool(self, tool: str, seconds: float) -> None:
+        """Record one completed tool call."""
+        self._histogram(self.tool_latency, tool).observe(seconds)
+    
+    def record_tool_error(self, tool: str, error: BaseException) -> None:
+        """Count a tool call that failed with ``error``."""
+        self.tool_errors[(tool, type(error).__name__)] += 1
+    
+    def add_records(self, tool: str, count: int) -> None:
+        """Count records returned by a list tool."""
+        self.tool_records[tool] += count
+    
+    def observe_request(
+        self,
+        method: str,
+        url: str,
+        seconds: float,
+        status: Optional[int] = None,
+        size: Optional[int] = None,
+        error: Optional[BaseException] = None
+    ) -> None:
+        """Record one HTTP exchange (``size`` is None while a body is still streaming)."""
+        key = (method, endpoint_label(url))
+        self._histogram(self.request_latency, key).observe(seconds)
+        if error is not None:
+            self.request_errors[key + (type(error).__name__,)] += 1
+        else:
+            self.responses[key + (str(status),)] += 1
+        if size:
+            self.bytes_received[key] += size
+    
+    def add_bytes(self, method: str, url: str, size: int) -> None:
+        """Count body bytes of a streamed response once it has been read."""
+        self.bytes_received[(method, endpoint_label(url))] += size
+    
+    def snapshot(self) -> Dict[str, Any]:
+        """All recorded numbers as plain data."""
+        return {
+            "uptime_seconds": round(time.time() - self.started, 1),
+            "tools": {
+                tool: {
+                    **histogram.snapshot(),
+                    "records": self.tool_records.get(tool, 0),
+                    "errors": {
+                        error: count for (name, error), count in self.tool_errors.items()
+                        if name == tool
+                    },
+                }
+                for tool, histogram in sorted(self.tool_latency.items())
+            },
+            "requests": {
+                f"{method} {endpoint}": {
+                    **histogram.snapshot(),
+                    "bytes_received": self.bytes_received.get((method, endpoint), 0),
+                    "statuses": {
+                        status: count for (m, e, status), count in self.responses.items()
+                        if (m, e) == (method, endpoint)
+                    },
+                    "errors": {
+                        error: count for (m, e, error), count in self.request_errors.items()
+                        if (m, e) == (method, endpoint)
+                    },
+                }
+                for (method, endpoint), histogram in sorted(self.request_latency.items())
+            },
+        }
+    
+    def render_prometheus(
+        self,
+        counters: Mapping[str, float] = {},
+        gauges: Mapping[str, float] = {}
+    ) -> str:
+        """Prometheus text exposition of the metrics plus extra ``counters``/``gauges``."""
+        lines: List[str] = []
+        prefix = "hubstaff_mcp"
+        
+        lines += _histogram_lines(
+            f"{prefix}_tool_duration_seconds", ("tool",),
+            (((tool,), histogram) for tool, histogram in sorted(self.tool_latency.items()))
+        )
+        lines += _counter_lines(f"{prefix}_tool_errors_total", ("tool", "error"), self.tool_errors)
+        lines += _counter_lines(
+            f"{prefix}_tool_records_total", ("tool",),
+            {(tool,): count for tool, count in self.tool_records.items()}
+        )
+        lines += _histogram_lines(
+            f"{prefix}_api_request_duration_seconds", ("method", "endpoint"),
+            sorted(self.request_latency.items())
+        )
+        lines += _counter_lines(
+            f"{prefix}_api_responses_total", ("method", "endpoint", "status"), self.responses
+        )
+        lines += _counter_lines(
+            f"{prefix}_api_request_errors_total", ("method", "endpoint", "error"), self.request_errors
+        )
+        lines += _counter_lines(
+            f"{prefix}_api_received_bytes_total", ("method", "endpoint"), self.bytes_received
+        )
+        for name, value in counters.items():
+            lines += [f"# TYPE {prefix}_{name} counter", f"{prefix}_{name} {_number(value)}"]
+        for name, value in gauges.items():
+            lines += [f"# TYPE {prefix}_{name} gauge", f"{prefix}_{name} {_number(value)}"]
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(names: Tuple[str, ...], values: Tuple[str, ...], **extra: str) -> str:
+    pairs = list(zip(names, values)) + list(extra.items())
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in pairs) + "}"
+
+
+def _number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+def _histogram_lines(
+    name: str,
+    label_names: Tuple[str, ...],
+    series: Iterable[Tuple[Tuple[str, ...], Histogram]]
+) -> List[str]:
+    lines = [f"# TYPE {name} histogram"]
+    for labels, histogram in series:
+        cumulative = 0
+        for bound, count in zip(histogram.buckets + (float("inf"),), histogram.counts):
+            cumulative += count
+            lines.append(f"{name}_bucket{_labels(label_names, labels, le=_number(bound))} {cumulative}")
+        lines.append(f"{name}_sum{_labels(label_names, labels)} {_number(histogram.sum)}")
+        lines.append(f"{name}_count{_labels(label_names, labels)} {histogram.count}")
+    return lines
+
+
+def _counter_lines(name: str, label_names: Tuple[str, ...], counts: Mapping[Tuple[str, ...], int]) -> List[str]:
+    lines = [f"# TYPE {name} counter"]
+    for labels, count in sorted(counts.items()):
+        lines.append(f"{name}{_labels(label_names, labels)} {count}")
+    return lines
+
+
+# Process-wide metrics shared by the server and every client it creates
+METRICS = Metrics()
@@ -0,0 +1,143 @@
+"""Typed shapes of the Hubstaff records the server reads.
+
+The client keeps records as plain dicts, so these are ``TypedDict``s
+declaring the fields the formatters and aggregations consume. Unknown
+fields are allowed, and every field is optional, because Hubstaff omits
+null-valued keys. :func:`validate_records` checks decoded records against
+these shapes.
+"""
+
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    Optional,
+    Tuple,
+    Type,
+    TypedDict,
+    Union,
+    get_args,
+    get_origin,
+    get_type_hints,
+)
+
+
+class TimeEntry(TypedDict, total=False):
+    id: int
+    user_id: int
+    project_id: int
+    task_id: Optional[int]
+    starts_at: str
+    stops_at: Optional[str]
+    tracked: int
+    keyboard: int
+    mouse: int
+    overall: int
+    paid: bool
+    billable: bool
+
+
+class Activity(TypedDict, total=False):
+    id: int
+    user_id: int
+    project_id: int
+    task_id: Optional[int]
+    time_slot: str
+    starts_at: str
+    tracked: int
+    keyboard: int
+    mouse: int
+    overall: int
+    billable: bool
+
+
+class Screenshot(TypedDict, total=False):
+    id: int
+    user_id: int
+    project_id: int
+    task_id: Optional[int]
+    time_slot: str
+    recorded_at: str
+    url: str
+    full_url: str
+    screen: int
+
+
+class Timesheet(TypedDict, total=False):
+    id: int
+    user_id: int
+    project_id: int
+    date: str
+    tracked: int
+
+
+class Project(TypedDict, total=False):
+    id: int
+    name: str
+    status: str
+    description: Optional[str]
+    created_at: str
+
+
+class Task(TypedDict, total=False):
+    id: int
+    project_id: int
+    summary: str
+    details: Optional[str]
+    status: str
+    assignee_id: Optional[int]
+
+
+class User(TypedDict, total=False):
+    id: int
+    name: str
+    email: str
+    time_zone: str
+    created_at: str
+
+
+# Record type for the top-level key of each list response.
+RECORD_TYPES: Dict[str, Type[Any]] = {
+    "time_entries": TimeEntry,
+    "activities": Activity,
+    "screenshots": Screenshot,
+    "timesheets": Timesheet,
+    "projects": Project,
+    "tasks": Task,
+    "users": User,
+}
+
+
+def _accepted_types(annotation: Any) -> Tuple[type, ...]:
+    """Runtime types allowed for a field annotation (ints are valid floats)."""
+    if get_origin(annotation) is Union:
+        return tuple(t for arg in get_args(annotation) for t in _accepted_types(arg))
+    if annotation is type(None):
+        return (type(None),)
+    if annotation is float:
+        return (int, float)
+    return (annotation,)
+
+
+_FIELD_TYPES: Dict[type, Tuple[Tuple[str, Tuple[type, ...]], ...]] = {
+    model: tuple(
+        (field, _accepted_types(annotation))
+        for field, annotation in get_type_hints(model).items()
+    )
+    for model in RECORD_TYPES.values()
+}
+
+
+def validate_records(records: Iterable[Dict[str, Any]], model: Type[Any]) -> None:
+    """Raise ValueError if any record has a field of the wrong type for ``model``."""
+    fields = _FIELD_TYPES[model]
+    for record in records:
+        if not isinstance(record, dict):
+            raise ValueError(f"Expected a {model.__name__} object, got {type(record).__name__}")
+        for field, types in fields:
+            value = record.get(field)
+            if value is not None and not isinstance(value, types):
+                raise ValueError(
+                    f"{model.__name__} {record.get('id')}: field {field!r} should be "
+                    f"{' or '.join(t.__name__ for t in types)}, got {type(value).__name__}"
+                )
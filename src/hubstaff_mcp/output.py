@@ -0,0 +1,147 @@
+"""Compact, size-bounded rendering of record lists for MCP tool output."""
+
+import base64
+import csv
+import hashlib
+import io
+import json
+from typing import Any, Callable, Dict, Iterable, Optional, Sequence
+
+from .config import env_int
+from .serialization import select_backend
+
+
+OUTPUT_FORMATS = ("text", "table", "csv", "jsonl")
+
+# Output larger than this is cut off with a continuation cursor unless the
+# caller passes its own max_chars; 0 disables the limit.
+DEFAULT_MAX_OUTPUT_CHARS = 50_000
+
+
+def default_max_chars() -> int:
+    """Character budget for tool output (HUBSTAFF_MAX_OUTPUT_CHARS)."""
+    return env_int("HUBSTAFF_MAX_OUTPUT_CHARS", DEFAULT_MAX_OUTPUT_CHARS)
+
+
+def encode_cursor(state: Dict[str, Any]) -> str:
+    """Pack continuation state into an opaque cursor string."""
+    raw = json.dumps(state, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def query_fingerprint(*parts: Any) -> str:
+    """Short stable hash of a call's normalized arguments, carried in its cursors."""
+    raw = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=str).encode()
+    return hashlib.sha256(raw).hexdigest()[:16]
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Unpack a cursor from :func:`encode_cursor`; raises ValueError if malformed."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        state = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not isinstance(state, dict):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return state
+
+
+def _cell(value: Any) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+class RecordWriter:
+    """Render records one at a time into a single buffer within a size budget.
+    
+    ``text`` uses ``render_text`` blocks separated by ``---`` under ``title``;
+    ``table`` (pipe-separated), ``csv`` and ``jsonl`` emit only ``columns``.
+    :meth:`write` returns False once ``max_rows`` or ``max_chars`` would be
+    exceeded, leaving the record unwritten. The first record is always
+    written so paging makes progress.
+    """
+    
+    def __init__(
+        self,
+        format: str,
+        columns: Sequence[str],
+        render_text: Callable[[Dict[str, Any]], str],
+        title: str,
+        max_rows: Optional[int] = None,
+        max_chars: Optional[int] = None
+    ):
+        if format not in OUTPUT_FORMATS:
+            raise ValueError(f"Unknown format {format!r}. Use: {', '.join(OUTPUT_FORMATS)}.")
+        self.format = format
+        self.columns = tuple(columns)
+        self.render_text = render_text
+        self.max_rows = max_rows or None
+        self.max_chars = max_chars or None
+        self.rows = 0
+        self.truncated = False
+        self._buffer = io.StringIO()
+        self._chars = 0
+        self._row = io.StringIO()
+        self._csv = csv.writer(self._row, lineterminator="\n")
+        self._json = select_backend() if format == "jsonl" else None
+        
+        if format == "text":
+            self._emit(title + "\n")
+        elif format == "table":
+            self._emit(" | ".join(self.columns) + "\n")
+            self._emit("-+-".join("-" * len(column) for column in self.columns) + "\n")
+        elif format == "csv":
+            self._emit(self._csv_line(self.columns))
+    
+    def _emit(self, text: str) -> None:
+        self._buffer.write(text)
+        self._chars += len(text)
+    
+    def _csv_line(self, values: Iterable[Any]) -> str:
+        self._row.seek(0)
+        self._row.truncate()
+        self._csv.writerow(values)
+        return self._row.getvalue()
+    
+    def _render(self, record: Dict[str, Any]) -> str:
+        if self.format == "text":
+            block = self.render_text(record)
+            return block if self.rows == 0 else "\n---\n" + block
+        values = [record.get(column) for column in self.columns]
+        if self.format == "table":
+            return " | ".join(_cell(value) for value in values) + "\n"
+        if self.format == "csv":
+            return self._csv_line(_cell(value) for value in values)
+        return self._json.dumps(dict(zip(self.columns, values))).decode() + "\n"
+    
+    def write(self, record: Dict[str, Any]) -> bool:
+        """Append ``record``; False (and nothing written) if over budget."""
+        if self.max_rows is not None and self.rows >= self.max_rows:
+            self.truncated = True
+            return False
+        chunk = self._render(record)
+        if (
+            self.max_chars is not None
+            and self.rows > 0
+            and self._chars + len(chunk) > self.max_chars
+        ):
+            self.truncated = True
+            return False
+        self._emit(chunk)
+        self.rows += 1
+        return True
+    
+    def getvalue(self, remaining: Optional[int] = None, cursor: Optional[str] = None) -> str:
+        """The rendered output, with a truncation note carrying ``cursor``."""
+        output = self._buffer.getvalue()
+        if not self.truncated:
+            return output
+        more = f"{remaining} more records" if remaining is not None else "more available"
+        note = f"[Output truncated after {self.rows} records; {more}."
+        if cursor:
+            note += f' Call again with cursor="{cursor}" to continue.'
+        return output.rstrip("\n") + "\n" + note + "]"
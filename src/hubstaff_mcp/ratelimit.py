@@ -0,0 +1,186 @@
+"""Client-side rate limiting for Hubstaff API requests."""
+
+import asyncio
+import contextvars
+import heapq
+import itertools
+import random
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Callable, ContextManager, Iterator, List, Optional, Tuple
+
+import httpx
+
+# Lower values are served first when requests queue for rate-limit tokens.
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BULK = 10
+
+_priority: contextvars.ContextVar[int] = contextvars.ContextVar(
+    "hubstaff_request_priority", default=PRIORITY_INTERACTIVE
+)
+
+DEFAULT_RATE_LIMIT = 10.0
+DEFAULT_RATE_LIMIT_BURST = 20
+DEFAULT_MAX_THROTTLE_RETRIES = 3
+
+
+@contextmanager
+def request_priority(priority: int) -> Iterator[None]:
+    """Run the enclosed requests at ``priority`` (e.g. PRIORITY_BULK)."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def bulk_requests() -> ContextManager[None]:
+    """Mark the enclosed requests as background/bulk work."""
+    return request_priority(PRIORITY_BULK)
+
+
+def parse_retry_after(value: Optional[str], now: Optional[float] = None) -> Optional[float]:
+    """Parse a Retry-After header (delta seconds or HTTP date) into seconds."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    now = time.time() if now is None else now
+    return max(0.0, retry_at.timestamp() - now)
+
+
+def _header(response: httpx.Response, name: str) -> Optional[str]:
+    return response.headers.get(name) or response.headers.get(f"X-{name}")
+
+
+class RateLimiter:
+    """Token bucket shared by every coroutine using one HubstaffClient.
+    
+    Requests wait for a token before being sent; queued requests are granted
+    tokens in priority order, so interactive tool calls overtake bulk
+    fetches. Rate-limit response headers and 429 replies pause the whole
+    bucket, not just the request that saw them.
+    """
+    
+    def __init__(
+        self,
+        rate: float = DEFAULT_RATE_LIMIT,
+        burst: int = DEFAULT_RATE_LIMIT_BURST,
+        max_retries: int = DEFAULT_MAX_THROTTLE_RETRIES,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Create a limiter allowing ``rate`` requests/second (0 = unlimited)."""
+        self.rate = rate
+        self.burst = max(1, burst)
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.clock = clock
+        self.tokens = float(self.burst)
+        self.paused_until = 0.0
+        self.throttled = 0
+        self.queued = 0
+        self.remaining: Optional[int] = None
+        self._updated = clock()
+        self._waiters: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+        self._dispatcher: Optional[asyncio.Task] = None
+    
+    def _refill(self) -> None:
+        now = self.clock()
+        if self.rate > 0:
+            self.tokens = min(self.burst, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+    
+    def _delay(self) -> float:
+        """Seconds until a token can be handed out."""
+        self._refill()
+        now = self.clock()
+        if now < self.paused_until:
+            return self.paused_until - now
+        if self.rate <= 0 or self.tokens >= 1:
+            return 0.0
+        return (1 - self.tokens) / self.rate
+    
+    def _take(self) -> None:
+        if self.rate > 0:
+            self.tokens -= 1
+    
+    async def acquire(self, priority: Optional[int] = None) -> None:
+        """Wait for permission to send one request."""
+        if not self._waiters and self._delay() == 0:
+            self._take()
+            return
+        
+        priority = _priority.get() if priority is None else priority
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        self.queued += 1
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.ensure_future(self._dispatch())
+        await future
+    
+    async def _dispatch(self) -> None:
+        while self._waiters:
+            delay = self._delay()
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue  # the waiter was cancelled
+            self._take()
+            future.set_result(None)
+    
+    def pause(self, seconds: float) -> None:
+        """Stop handing out tokens for ``seconds`` (extends any current pause)."""
+        self.paused_until = max(self.paused_until, self.clock() + seconds)
+    
+    def observe(self, response: httpx.Response) -> None:
+        """Track rate-limit headers, pausing when the server quota is spent."""
+        remaining = _header(response, "RateLimit-Remaining")
+        if remaining is None:
+            return
+        try:
+            self.remaining = int(float(remaining))
+        except ValueError:
+            return
+        if self.remaining > 0:
+            return
+        reset = _header(response, "RateLimit-Reset")
+        try:
+            reset_seconds = float(reset) if reset else self.backoff_base
+        except ValueError:
+            reset_seconds = self.backoff_base
+        # Some servers send an epoch timestamp rather than a delta.
+        if reset_seconds > 10 ** 9:
+            reset_seconds = max(0.0, reset_seconds - datetime.now(timezone.utc).timestamp())
+        self.pause(reset_seconds)
+    
+    def throttle_delay(self, response: httpx.Response, attempt: int) -> float:
+        """Delay before retrying a 429: Retry-After if given, else jittered backoff."""
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is not None:
+            # A little jitter so waiting coroutines don't stampede together.
+            return retry_after + random.uniform(0, min(1.0, self.backoff_base))
+        backoff = min(self.backoff_max, self.backoff_base * (2 ** attempt))
+        return random.uniform(backoff / 2, backoff)
+    
+    def on_throttled(self, response: httpx.Response, attempt: int) -> float:
+        """Record a 429, pause the bucket and return the delay applied."""
+        self.throttled += 1
+        delay = self.throttle_delay(response, attempt)
+        self.pause(delay)
+        return delay
@@ -0,0 +1,167 @@
+"""Compact columnar storage for time entries and activities."""
+
+import sys
+from array import array
+from datetime import datetime, timezone
+from typing import Any, AsyncIterable, Dict, Iterable, Iterator, Optional, Sequence, Tuple
+
+# Stand-in for a missing ID in the int64 columns.
+MISSING = -(2 ** 63)
+
+ID_FIELDS = ("id", "user_id", "project_id", "task_id")
+VALUE_FIELDS = ("tracked", "keyboard", "mouse", "overall")
+SUMMABLE_FIELDS = VALUE_FIELDS
+
+_SECONDS_PER_DAY = 86400
+
+
+def _to_epoch(value: Optional[str]) -> int:
+    """Convert an ISO-8601 timestamp to UTC epoch seconds (MISSING if absent)."""
+    if not value:
+        return MISSING
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp())
+
+
+def _from_epoch(value: int) -> Optional[str]:
+    if value == MISSING:
+        return None
+    return datetime.fromtimestamp(value, tz=timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
+class ColumnStore:
+    """Time entries or activities stored as parallel int64 arrays.
+    
+    Each record costs eight bytes per numeric column instead of a full dict
+    of boxed values. Timestamps are stored as epoch seconds, and any extra
+    string fields listed in ``string_fields`` are interned so repeated
+    values (statuses, sources) share one object. Records can be
+    materialized back into dicts with :meth:`record` or iteration.
+    """
+    
+    def __init__(
+        self,
+        time_field: str = "starts_at",
+        string_fields: Sequence[str] = ()
+    ):
+        """Create an empty store.
+        
+        Args:
+            time_field: Timestamp field to keep, e.g. "starts_at" for time
+                entries or "time_slot" for activities
+            string_fields: Extra string fields to keep (interned)
+        """
+        self.time_field = time_field
+        self.string_fields = tuple(string_fields)
+        self.ids = {field: array("q") for field in ID_FIELDS}
+        self.values = {field: array("q") for field in VALUE_FIELDS}
+        self.times = array("q")
+        self.strings = {field: [] for field in self.string_fields}
+    
+    def __len__(self) -> int:
+        return len(self.times)
+    
+    def append(self, record: Dict[str, Any]) -> None:
+        """Add one decoded API record."""
+        for field, column in self.ids.items():
+            value = record.get(field)
+            column.append(MISSING if value is None else int(value))
+        for field, column in self.values.items():
+            column.append(int(record.get(field) or 0))
+        self.times.append(_to_epoch(record.get(self.time_field)))
+        for field, column in self.strings.items():
+            value = record.get(field)
+            column.append(sys.intern(value) if isinstance(value, str) else value)
+    
+    def extend(self, records: Iterable[Dict[str, Any]]) -> "ColumnStore":
+        for record in records:
+            self.append(record)
+        return self
+    
+    async def extend_async(self, records: AsyncIterable[Dict[str, Any]]) -> "ColumnStore":
+        """Decode records from an async iterator (e.g. ``client.iter_activities``)."""
+        async for record in records:
+            self.append(record)
+        return self
+    
+    def record(self, index: int) -> Dict[str, Any]:
+        """Materialize the record at ``index`` as a dict."""
+        record = {}
+        for field, column in self.ids.items():
+            value = column[index]
+            record[field] = None if value == MISSING else value
+        for field, column in self.values.items():
+            record[field] = column[index]
+        record[self.time_field] = _from_epoch(self.times[index])
+        for field, column in self.strings.items():
+            record[field] = column[index]
+        return record
+    
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        for index in range(len(self)):
+            yield self.record(index)
+    
+    def nbytes(self) -> int:
+        """Approximate memory held by the columns (string objects excluded)."""
+        columns = list(self.ids.values()) + list(self.values.values()) + [self.times]
+        total = sum(sys.getsizeof(column) for column in columns)
+        return total + sum(sys.getsizeof(column) for column in self.strings.values())
+    
+    def _key_column(self, field: str) -> Sequence[int]:
+        if field in self.ids:
+            return self.ids[field]
+        if field == "day":
+            return array("q", (
+                MISSING if t == MISSING else t // _SECONDS_PER_DAY for t in self.times
+            ))
+        raise ValueError(f"Cannot group by {field!r}. Use one of: {', '.join(ID_FIELDS)}, day.")
+    
+    def sum(self, field: str) -> int:
+        """Total of one value column."""
+        return sum(self.values[field])
+    
+    def group_sum(
+        self,
+        by: Sequence[str],
+        fields: Sequence[str] = SUMMABLE_FIELDS
+    ) -> Dict[Tuple[Any, ...], Dict[str, int]]:
+        """Sum value columns grouped by ID columns and/or "day".
+        
+        Works column-at-a-time over the typed arrays: keys are zipped once,
+        then each value column is folded into per-group totals.
+        
+        Returns:
+            Mapping of group key tuple (None for a missing ID, YYYY-MM-DD for
+            "day") to ``{field: total}`` plus a ``records`` count
+        """
+        key_columns = [self._key_column(field) for field in by]
+        keys = list(zip(*key_columns)) if key_columns else [()] * len(self)
+        
+        groups: Dict[Tuple[int, ...], Dict[str, int]] = {}
+        for key in keys:
+            totals = groups.get(key)
+            if totals is None:
+                totals = groups[key] = dict.fromkeys(fields, 0)
+                totals["records"] = 0
+            totals["records"] += 1
+        for field in fields:
+            for key, value in zip(keys, self.values[field]):
+                groups[key][field] += value
+        
+        return {self._label(by, key): totals for key, totals in groups.items()}
+    
+    @staticmethod
+    def _label(by: Sequence[str], key: Tuple[int, ...]) -> Tuple[Any, ...]:
+        labels = []
+        for field, value in zip(by, key):
+            if value == MISSING:
+                labels.append(None)
+            elif field == "day":
+                labels.append(
+                    datetime.fromtimestamp(value * _SECONDS_PER_DAY, tz=timezone.utc).strftime("%Y-%m-%d")
+                )
+            else:
+                labels.append(value)
+        return tuple(labels)
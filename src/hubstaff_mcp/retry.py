@@ -0,0 +1,63 @@
+"""Retry policy for transient Hubstaff API failures."""
+
+import random
+from dataclasses import dataclass
+from typing import FrozenSet, Optional, Tuple, Type
+
+import httpx
+
+from .config import env_float, env_int, env_str
+
+DEFAULT_RETRY_STATUSES: FrozenSet[int] = frozenset({500, 502, 503, 504})
+DEFAULT_RETRY_EXCEPTIONS: Tuple[Type[BaseException], ...] = (httpx.TransportError,)
+IDEMPOTENT_METHODS: FrozenSet[str] = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Which failures are retried, how often, and how long to wait between tries.
+    
+    Only idempotent methods are retried unconditionally. POSTs are retried
+    only when the caller supplies an idempotency key or a dedup check that
+    can tell whether the failed attempt actually took effect.
+    """
+    
+    max_attempts: int = 3
+    backoff_base: float = 0.5
+    backoff_multiplier: float = 2.0
+    backoff_max: float = 8.0
+    jitter: bool = True
+    retry_statuses: FrozenSet[int] = DEFAULT_RETRY_STATUSES
+    retry_exceptions: Tuple[Type[BaseException], ...] = DEFAULT_RETRY_EXCEPTIONS
+    
+    @classmethod
+    def from_env(cls) -> "RetryPolicy":
+        """Build a policy from HUBSTAFF_RETRY_* environment variables."""
+        statuses = env_str("HUBSTAFF_RETRY_STATUSES")
+        return cls(
+            max_attempts=env_int("HUBSTAFF_RETRY_ATTEMPTS", cls.max_attempts),
+            backoff_base=env_float("HUBSTAFF_RETRY_BACKOFF", cls.backoff_base),
+            backoff_max=env_float("HUBSTAFF_RETRY_BACKOFF_MAX", cls.backoff_max),
+            retry_statuses=frozenset(int(s) for s in statuses.split(","))
+            if statuses
+            else DEFAULT_RETRY_STATUSES,
+        )
+    
+    def is_idempotent(self, method: str) -> bool:
+        return method.upper() in IDEMPOTENT_METHODS
+    
+    def is_retryable(self, status_code: Optional[int], cause: Optional[BaseException]) -> bool:
+        """Return True for a retryable status code or transport exception."""
+        if status_code is not None:
+            return status_code in self.retry_statuses
+        return cause is not None and isinstance(cause, self.retry_exceptions)
+    
+    def backoff(self, attempt: int) -> float:
+        """Delay after failed attempt number ``attempt`` (1-based)."""
+        delay = min(
+            self.backoff_max, self.backoff_base * self.backoff_multiplier ** (attempt - 1)
+        )
+        if self.jitter:
+            # "Equal jitter": keep at least half the delay, randomise the rest.
+            delay = random.uniform(delay / 2, delay)
+        return delay
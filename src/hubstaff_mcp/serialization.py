@@ -0,0 +1,80 @@
+"""Pluggable JSON encoding/decoding, using orjson or msgspec when installed."""
+
+import importlib.util
+import json
+from dataclasses import dataclass
+from typing import Any, Callable, Optional, Union
+
+from .config import env_str
+
+
+# Fastest first; "json" (the standard library) is always available.
+JSON_BACKENDS = ("msgspec", "orjson", "json")
+
+
+@dataclass(frozen=True)
+class JSONBackend:
+    """A JSON implementation: ``loads`` accepts bytes or str, ``dumps`` returns bytes."""
+    
+    name: str
+    loads: Callable[[Union[bytes, str]], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _stdlib_backend() -> JSONBackend:
+    def dumps(obj: Any) -> bytes:
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode()
+    
+    return JSONBackend("json", json.loads, dumps)
+
+
+def _orjson_backend() -> JSONBackend:
+    import orjson
+    
+    return JSONBackend("orjson", orjson.loads, orjson.dumps)
+
+
+def _msgspec_backend() -> JSONBackend:
+    import msgspec
+    
+    decoder = msgspec.json.Decoder()
+    
+    def loads(data: Union[bytes, str]) -> Any:
+        # msgspec errors don't derive from ValueError like the others' do
+        try:
+            return decoder.decode(data)
+        except msgspec.DecodeError as e:
+            raise ValueError(str(e)) from e
+    
+    return JSONBackend("msgspec", loads, msgspec.json.Encoder().encode)
+
+
+_FACTORIES = {
+    "json": _stdlib_backend,
+    "orjson": _orjson_backend,
+    "msgspec": _msgspec_backend,
+}
+
+
+def backend_available(name: str) -> bool:
+    """Whether the package behind backend ``name`` is importable."""
+    return name == "json" or importlib.util.find_spec(name) is not None
+
+
+def select_backend(name: Optional[str] = None) -> JSONBackend:
+    """Return the named backend, or the fastest installed one.
+    
+    ``name`` defaults to HUBSTAFF_JSON_BACKEND; "auto" (the default) picks
+    the first available of :data:`JSON_BACKENDS`. Raises ValueError for an
+    unknown backend or one whose package is not installed.
+    """
+    name = (name or env_str("HUBSTAFF_JSON_BACKEND", "auto")).lower()
+    if name == "auto":
+        name = next(backend for backend in JSON_BACKENDS if backend_available(backend))
+    if name not in _FACTORIES:
+        raise ValueError(
+            f"Unknown JSON backend {name!r}. Use auto, {', '.join(JSON_BACKENDS)}."
+        )
+    if not backend_available(name):
+        raise ValueError(f"JSON backend {name!r} is not installed.")
+    return _FACTORIES[name]()
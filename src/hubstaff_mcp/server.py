@@ -1,29 +1,177 @@
 """Main MCP server implementation for Hubstaff integration."""
 
+import argparse
 import asyncio
+import inspect
+import json
 import os
 import sys
+import time
+from contextlib import AsyncExitStack, nullcontext
+from contextvars import ContextVar
 from datetime import datetime, date
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Sequence, Union
 from mcp.server.fastmcp import FastMCP
+from mcp.types import InitializedNotification
+from .aggregate import TimeAggregator, format_summary_table, parse_group_by
 from .client import HubstaffClient, HubstaffAPIError
+from .config import env_bool, env_float, env_int, env_str
+from .metrics import METRICS
+from .models import Activity, Project, Screenshot, Task, TimeEntry, Timesheet, User
+from .output import RecordWriter, decode_cursor, default_max_chars, encode_cursor, query_fingerprint
+from .sessions import END, ResultSession, SessionStore
+from .tenants import ClientRegistry
+from .token_cache import token_cache_key
+from .tracing import TRACER, CallProfiler, JSONFileExporter
+from .warmup import DEFAULT_PREWARM_INTERVAL, ClientWarmer
+
+
+TRANSPORTS = ("stdio", "sse", "streamable-http")
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8000
+
+# Tool calls run at once; further calls wait for a free slot (0 = unlimited)
+DEFAULT_MAX_CONCURRENT_CALLS = 32
+
+LOOPBACK_HOSTS = ("127.0.0.1", "localhost", "::1")
+
+# HTTP header carrying a client's own Hubstaff personal token in multi-tenant mode
+TENANT_HEADER = "x-hubstaff-token"
+
+# Client of the tenant whose tool call is running (unset for the server's own account)
+tenant_client: ContextVar[Optional[HubstaffClient]] = ContextVar("tenant_client", default=None)
+
+# Key of that tenant (see token_cache_key), which result sessions are bound to
+tenant_key: ContextVar[Optional[str]] = ContextVar("tenant_key", default=None)
+
+# Name of the tool being called, for metrics recorded inside it
+current_tool: ContextVar[str] = ContextVar("current_tool", default="")
 
-# Load environment variables from .env file if present
-try:
-    from dotenv import load_dotenv
-    load_dotenv()
-except ImportError:
-    pass  # dotenv is optional
+
+class HubstaffMCP(FastMCP):
+    """FastMCP server that bounds tool concurrency and routes calls to tenants.
+    
+    Over HTTP one process serves every connected client; calls beyond the
+    limit queue here instead of all contending for the shared connection
+    pool and rate limit. With a :class:`ClientRegistry` in ``tenants``,
+    requests carrying the ``X-Hubstaff-Token`` header run against that
+    token's own client. ``prewarm``, if set, is started in the background
+    once the first client finishes its handshake.
+    """
+    
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.call_slots: Optional[asyncio.Semaphore] = None
+        self.tenants: Optional[ClientRegistry] = None
+        self.profiler: Optional[CallProfiler] = None
+        self.prewarm: Optional[Callable[[], Awaitable[None]]] = None
+        self._prewarm_task: Optional[asyncio.Task] = None
+        self._mcp_server.notification_handlers[InitializedNotification] = self._initialized
+    
+    async def _initialized(self, notification: InitializedNotification) -> None:
+        if self.prewarm is not None and self._prewarm_task is None:
+            self._prewarm_task = asyncio.ensure_future(self.prewarm())
+    
+    async def stop_prewarm(self) -> None:
+        """Cancel the prewarm task if it is still running."""
+        task, self._prewarm_task = self._prewarm_task, None
+        if task is not None and not task.done():
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+    
+    def limit_calls(self, limit: int) -> None:
+        """Allow at most ``limit`` concurrent tool calls (0 removes the limit)."""
+        self.call_slots = asyncio.Semaphore(limit) if limit > 0 else None
+    
+    def request_token(self) -> Optional[str]:
+        """The Hubstaff token sent with the current HTTP request, if any."""
+        try:
+            request = self._mcp_server.request_context.request
+        except LookupError:
+            return None
+        headers = getattr(request, "headers", None)
+        return headers.get(TENANT_HEADER) if headers is not None else None
+    
+    async def call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        started = time.perf_counter()
+        tool_token = current_tool.set(name)
+        profile = self.profiler.profile(name) if self.profiler is not None else nullcontext()
+        try:
+            with TRACER.span(f"tool {name}", tool=name), profile:
+                return await self._call_tool(name, arguments)
+        except Exception as e:
+            METRICS.record_tool_error(name, e)
+            raise
+        finally:
+            current_tool.reset(tool_token)
+            METRICS.observe_tool(name, time.perf_counter() - started)
+    
+    async def _call_tool(self, name: str, arguments: Dict[str, Any]) -> Any:
+        async with AsyncExitStack() as stack:
+            if self.call_slots is not None:
+                await stack.enter_async_context(self.call_slots)
+            token = self.request_token()
+            if token and self.tenants is None:
+                raise ValueError(
+                    f"This server does not accept per-user tokens; remove the {TENANT_HEADER} header."
+                )
+            if token:
+                client = await stack.enter_async_context(self.tenants.lease(token))
+                stack.callback(tenant_client.reset, tenant_client.set(client))
+                stack.callback(tenant_key.reset, tenant_key.set(token_cache_key(token)))
+            elif hubstaff_client is None and self.tenants is not None:
+                raise ValueError(f"Send your Hubstaff personal token in the {TENANT_HEADER} header.")
+            return await super().call_tool(name, arguments)
 
 
 # Initialize FastMCP server
-mcp = FastMCP("hubstaff")
+mcp = HubstaffMCP("hubstaff")
 
 # Initialize Hubstaff client (will be initialized in main() with proper error handling)
 hubstaff_client = None
 
+# Optional local mirror of time entries/activities (enabled by HUBSTAFF_SYNC_DB)
+sync_store = None
+
+# Unread results of list calls truncated by their output budget, by cursor
+result_sessions = SessionStore()
+
+
+async def close_tenant_sessions(key: str) -> None:
+    """Close the result sessions of a tenant whose client is being closed."""
+    await result_sessions.close_tenant(key)
+
+
+def current_client() -> Optional[HubstaffClient]:
+    """The client for the running tool call: its tenant's, else the server's own."""
+    return tenant_client.get() or hubstaff_client
+
+
+def tool_error(action: str, error: Exception) -> str:
+    """Count ``error`` against the running tool and describe it for the caller."""
+    METRICS.record_tool_error(current_tool.get() or "unknown", error)
+    return f"Error {action}: {str(error)}"
+
 
-def format_time_entry(entry: Dict[str, Any]) -> str:
+def synced(
+    resource: str,
+    organization_id: Optional[int],
+    start: Optional[date],
+    end: Optional[date]
+) -> bool:
+    """True if the local sync store can answer this range without calling Hubstaff."""
+    return (
+        sync_store is not None
+        and tenant_client.get() is None
+        and organization_id is not None
+        and start is not None
+        and end is not None
+        and sync_store.covers(organization_id, resource, start, end)
+    )
+
+
+def format_time_entry(entry: TimeEntry) -> str:
     """Format a time entry for display."""
     tracked_hours = entry.get("tracked", 0) / 3600 if entry.get("tracked") else 0
     return f"""
@@ -41,7 +189,7 @@ Paid: {'Yes' if entry.get('paid') else 'No'}
 """
 
 
-def format_project(project: Dict[str, Any]) -> str:
+def format_project(project: Project) -> str:
     """Format a project for display."""
     return f"""
  Project ID: {project.get('id')}
@@ -52,6 +200,228 @@ def format_project(project: Dict[str, Any]) -> str:
 """
 
 
+def format_task(task: Task) -> str:
+    """Format a task for display."""
+    return f"""
+Task ID: {task.get('id')}
+Summary: {task.get('summary')}
+Details: {task.get('details', 'No details')}
+Project ID: {task.get('project_id')}
+Assignee ID: {task.get('assignee_id', 'Unassigned')}
+Status: {task.get('status', 'Unknown')}
+"""
+
+
+def format_user(user: User) -> str:
+    """Format an organization member for display."""
+    return f"""
+User ID: {user.get('id')}
+Name: {user.get('name')}
+Email: {user.get('email')}
+Time Zone: {user.get('time_zone', 'Not specified')}
+"""
+
+
+def format_organization(org: Dict[str, Any]) -> str:
+    """Format an organization for display."""
+    return f"""
+Organization ID: {org.get('id')}
+Name: {org.get('name')}
+"""
+
+
+def format_team(team: Dict[str, Any]) -> str:
+    """Format a team for display."""
+    return f"""
+Team ID: {team.get('id')}
+Name: {team.get('name')}
+"""
+
+
+def format_activity(activity: Activity) -> str:
+    """Format an activity slot for display."""
+    return f"""
+Activity ID: {activity.get('id')}
+User ID: {activity.get('user_id')}
+Time Slot: {activity.get('time_slot')}
+Keyboard: {activity.get('keyboard', 0)}%
+Mouse: {activity.get('mouse', 0)}%
+Overall: {activity.get('overall', 0)}%
+"""
+
+
+def format_screenshot(screenshot: Screenshot) -> str:
+    """Format a screenshot for display."""
+    return f"""
+Screenshot ID: {screenshot.get('id')}
+User ID: {screenshot.get('user_id')}
+Time Slot: {screenshot.get('time_slot')}
+URL: {screenshot.get('url')}
+"""
+
+
+def format_timesheet(timesheet: Timesheet) -> str:
+    """Format a timesheet row for display."""
+    total_hours = timesheet.get("tracked", 0) / 3600 if timesheet.get("tracked") else 0
+    return f"""
+User ID: {timesheet.get('user_id')}
+Project ID: {timesheet.get('project_id')}
+Date: {timesheet.get('date')}
+Total Hours: {total_hours:.2f}
+Tracked Time: {timesheet.get('tracked', 0)} seconds
+"""
+
+
+# Columns emitted by the table, csv and jsonl output formats.
+# Records read from a session before each "render" span formats them
+RENDER_BATCH = 100
+
+TIME_ENTRY_COLUMNS = (
+    "id", "user_id", "project_id", "task_id", "starts_at", "stops_at", "tracked",
+    "overall", "paid",
+)
+PROJECT_COLUMNS = ("id", "name", "status", "created_at")
+TASK_COLUMNS = ("id", "project_id", "summary", "status", "assignee_id")
+USER_COLUMNS = ("id", "name", "email", "time_zone")
+ORGANIZATION_COLUMNS = ("id", "name")
+TEAM_COLUMNS = ("id", "name")
+ACTIVITY_COLUMNS = (
+    "id", "user_id", "project_id", "time_slot", "tracked", "keyboard", "mouse", "overall",
+)
+SCREENSHOT_COLUMNS = ("id", "user_id", "time_slot", "url")
+TIMESHEET_COLUMNS = ("user_id", "project_id", "date", "tracked")
+
+
+Records = Union[List[Dict[str, Any]], AsyncIterator[Dict[str, Any]]]
+
+
+async def resume_session(
+    session_id: str,
+    tool: str,
+    tenant: Optional[str],
+    fingerprint: str,
+    offset: int
+) -> Optional[ResultSession]:
+    """The live session a cursor points to, locked, or None to rerun the query.
+    
+    Another call with the same cursor may have read from or finished the
+    session while this one waited for its lock.
+    """
+    session = await result_sessions.get(session_id, tool, tenant, fingerprint)
+    if session is None:
+        return None
+    await session.lock.acquire()
+    if session.closed or session.id not in result_sessions or session.offset != offset:
+        session.lock.release()
+        return None
+    return session
+
+
+async def render_records(
+    tool: str,
+    fetch: Callable[[], Union[Records, Awaitable[Records]]],
+    empty: str,
+    title: str,
+    render_text: Callable[[Dict[str, Any]], str],
+    columns: Sequence[str],
+    format: str = "text",
+    max_rows: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    cursor: Optional[str] = None,
+    query: Optional[Dict[str, Any]] = None
+) -> str:
+    """Render a tool's records in ``format`` within the output budget.
+    
+    ``fetch`` returns the records as a list or a (lazily paginated) async
+    iterator. When the budget cuts them short, the unread remainder is kept
+    in a result session and the output ends with a cursor; a call with that
+    cursor resumes from the session without querying Hubstaff again. If the
+    session has expired or another call with the cursor got to it first, the
+    query is rerun and skips the records already shown. ``query`` holds the call's normalized filter arguments; a cursor
+    is only accepted by a call with the same ``query`` and ``format``.
+    """
+    state = decode_cursor(cursor) if cursor else {}
+    fingerprint = query_fingerprint(tool, query or {}, format)
+    if cursor and state.get("query") != fingerprint:
+        raise ValueError(
+            "This cursor was returned for different arguments; repeat the "
+            "call that returned it with only the cursor added."
+        )
+    tenant = tenant_key.get()
+    offset = int(state.get("offset", 0))
+    session = (
+        await resume_session(state["session"], tool, tenant, fingerprint, offset)
+        if "session" in state
+        else None
+    )
+    if session is None:
+        records = fetch()
+        if inspect.isawaitable(records):
+            records = await records
+        session = ResultSession(tool, records, tenant=tenant, query=fingerprint)
+        await session.skip(offset)
+        await session.lock.acquire()
+    
+    try:
+        start = session.offset
+        writer = RecordWriter(
+            format,
+            columns,
+            render_text,
+            title,
+            max_rows=max_rows,
+            max_chars=max_chars if max_chars is not None else default_max_chars()
+        )
+        try:
+            exhausted = False
+            while not exhausted and not writer.truncated:
+                # Records are read (fetching pages as needed) outside the
+                # "render" span, so it times formatting only
+                limit = RENDER_BATCH
+                if writer.max_rows is not None:
+                    limit = min(limit, writer.max_rows - writer.rows + 1)
+                batch = []
+                while len(batch) < limit:
+                    record = await session.next()
+                    if record is END:
+                        exhausted = True
+                        break
+                    batch.append(record)
+                if not batch:
+                    break
+                with TRACER.span("render", format=format) as span:
+                    for index, record in enumerate(batch):
+                        if not writer.write(record):
+                            for unwritten in reversed(batch[index:]):
+                                session.push_back(unwritten)
+                            break
+                    if span is not None:
+                        span.set("rows", writer.rows)
+            METRICS.add_records(tool, writer.rows)
+            
+            if writer.truncated:
+                # Re-added after every read: prefetched shards count against the caps
+                await result_sessions.add(session)
+                return writer.getvalue(
+                    remaining=session.remaining,
+                    cursor=encode_cursor({
+                        "session": session.id, "offset": session.offset, "query": fingerprint
+                    })
+                )
+        except BaseException:
+            await result_sessions.close(session.id)
+            await session.aclose()
+            raise
+    finally:
+        session.lock.release()
+    
+    await result_sessions.close(session.id)
+    await session.aclose()
+    if not writer.rows:
+        return empty if start == 0 else "No more records."
+    return writer.getvalue()
+
+
 def parse_date_string(date_str: str) -> date:
     """Parse date string in YYYY-MM-DD format."""
     try:
@@ -66,7 +436,11 @@ async def get_time_entries(
     end_date: Optional[str] = None,
     user_ids: Optional[str] = None,
     project_ids: Optional[str] = None,
-    organization_id: Optional[int] = None
+    organization_id: Optional[int] = None,
+    format: str = "text",
+    max_rows: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    cursor: Optional[str] = None
 ) -> str:
     """Get time entries with optional filtering.
     
@@ -76,6 +450,10 @@ async def get_time_entries(
         user_ids: Comma-separated list of user IDs
         project_ids: Comma-separated list of project IDs
         organization_id: Organization ID to filter by
+        format: Output format: text, table, csv or jsonl
+        max_rows: Maximum number of records to return (optional)
+        max_chars: Maximum output size in characters (optional)
+        cursor: Cursor returned by a truncated previous call, to read the next records
     """
     try:
         # Parse dates
@@ -86,22 +464,43 @@ async def get_time_entries(
         user_id_list = [int(x.strip()) for x in user_ids.split(",")] if user_ids else None
         project_id_list = [int(x.strip()) for x in project_ids.split(",")] if project_ids else None
         
-        entries = await hubstaff_client.get_time_entries(
-            start_date=start_date_obj,
-            end_date=end_date_obj,
-            user_ids=user_id_list,
-            project_ids=project_id_list,
-            organization_id=organization_id
-        )
-        
-        if not entries:
-            return "No time entries found for the specified criteria."
+        def fetch() -> Records:
+            if synced("time_entries", organization_id, start_date_obj, end_date_obj):
+                return sync_store.query(
+                    "time_entries", organization_id, start_date_obj, end_date_obj,
+                    user_id_list, project_id_list
+                )
+            return current_client().iter_time_entries(
+                start_date=start_date_obj,
+                end_date=end_date_obj,
+                user_ids=user_id_list,
+                project_ids=project_id_list,
+                organization_id=organization_id,
+                concurrency=None
+            )
         
-        formatted_entries = [format_time_entry(entry) for entry in entries]
-        return "Time Entries:\n" + "\n---\n".join(formatted_entries)
+        return await render_records(
+            "get_time_entries",
+            fetch,
+            "No time entries found for the specified criteria.",
+            "Time Entries:",
+            format_time_entry,
+            TIME_ENTRY_COLUMNS,
+            format,
+            max_rows,
+            max_chars,
+            cursor,
+            query={
+                "start_date": start_date_obj,
+                "end_date": end_date_obj,
+                "user_ids": user_id_list,
+                "project_ids": project_id_list,
+                "organization_id": organization_id,
+            }
+        )
         
     except Exception as e:
-        return f"Error retrieving time entries: {str(e)}"
+        return tool_error("retrieving time entries", e)
 
 
 @mcp.tool()
@@ -130,11 +529,11 @@ async def create_time_entry(
         if task_id:
             time_entry_data["task_id"] = task_id
             
-        entry = await hubstaff_client.create_time_entry(time_entry_data)
+        entry = await current_client().create_time_entry(time_entry_data)
         return f"Time entry created successfully:\n{format_time_entry(entry)}"
         
     except Exception as e:
-        return f"Error creating time entry: {str(e)}"
+        return tool_error("creating time entry", e)
 
 
 @mcp.tool()
@@ -160,11 +559,11 @@ async def update_time_entry(
         if not updates:
             return "No updates provided."
             
-        entry = await hubstaff_client.update_time_entry(entry_id, updates)
+        entry = await current_client().update_time_entry(entry_id, updates)
         return f"Time entry updated successfully:\n{format_time_entry(entry)}"
         
     except Exception as e:
-        return f"Error updating time entry: {str(e)}"
+        return tool_error("updating time entry", e)
 
 
 @mcp.tool()
@@ -175,31 +574,138 @@ async def delete_time_entry(entry_id: int) -> str:
         entry_id: ID of the time entry to delete
     """
     try:
-        await hubstaff_client.delete_time_entry(entry_id)
+        await current_client().delete_time_entry(entry_id)
         return f"Time entry {entry_id} deleted successfully."
         
     except Exception as e:
-        return f"Error deleting time entry: {str(e)}"
+        return tool_error("deleting time entry", e)
+
+
+def format_bulk_report(
+    action: str,
+    reports: List[Dict[str, Any]],
+    item_ids: List[Optional[int]]
+) -> str:
+    """Summarize a bulk operation as succeeded IDs plus one line per failure."""
+    succeeded = [report for report in reports if report["ok"]]
+    failed = [report for report in reports if not report["ok"]]
+    
+    lines = [f"Bulk {action}: {len(succeeded)} succeeded, {len(failed)} failed ({len(reports)} total)"]
+    if succeeded:
+        ids = []
+        for report in succeeded:
+            result = report["result"]
+            ids.append(result.get("id") if isinstance(result, dict) else item_ids[report["index"]])
+        lines.append("Succeeded IDs: " + ", ".join(str(entry_id) for entry_id in ids))
+    if failed:
+        lines.append("Failed:")
+        for report in failed:
+            item_id = item_ids[report["index"]]
+            label = f"item {report['index']}" + (f" (ID {item_id})" if item_id else "")
+            lines.append(f"- {label}: {report['error']}")
+    return "\n".join(lines)
 
 
 @mcp.tool()
-async def get_projects(organization_id: Optional[int] = None) -> str:
-    """Get list of projects.
+async def bulk_create_time_entries(entries: List[Dict[str, Any]]) -> str:
+    """Create many time entries in one call.
     
     Args:
-        organization_id: Organization ID to filter by (optional)
+        entries: List of time entries, each with project_id and starts_at
+            (ISO format) and optionally stops_at and task_id
+    """
+    try:
+        allowed = ("project_id", "starts_at", "stops_at", "task_id")
+        time_entries = []
+        for index, entry in enumerate(entries):
+            if not entry.get("project_id") or not entry.get("starts_at"):
+                return f"Error: item {index} needs both project_id and starts_at. Nothing was created."
+            time_entries.append({key: entry[key] for key in allowed if entry.get(key)})
+        
+        reports = await current_client().bulk_create_time_entries(time_entries)
+        return format_bulk_report("create", reports, [None] * len(reports))
+        
+    except Exception as e:
+        return tool_error("creating time entries", e)
+
+
+@mcp.tool()
+async def bulk_update_time_entries(updates: List[Dict[str, Any]]) -> str:
+    """Update many time entries in one call.
+    
+    Args:
+        updates: List of updates, each with the entry id and the new
+            stops_at (ISO format) and/or task_id
     """
     try:
-        projects = await hubstaff_client.get_projects(organization_id=organization_id)
+        allowed = ("stops_at", "task_id")
+        changes = []
+        for index, update in enumerate(updates):
+            fields = {key: update[key] for key in allowed if update.get(key)}
+            if not update.get("id") or not fields:
+                return f"Error: item {index} needs an id and stops_at or task_id. Nothing was updated."
+            changes.append({"id": update["id"], **fields})
+        
+        reports = await current_client().bulk_update_time_entries(changes)
+        return format_bulk_report("update", reports, [change["id"] for change in changes])
         
-        if not projects:
-            return "No projects found."
+    except Exception as e:
+        return tool_error("updating time entries", e)
+
+
+@mcp.tool()
+async def bulk_delete_time_entries(entry_ids: str) -> str:
+    """Delete many time entries in one call.
+    
+    Args:
+        entry_ids: Comma-separated list of time entry IDs
+    """
+    try:
+        id_list = [int(x.strip()) for x in entry_ids.split(",") if x.strip()]
+        if not id_list:
+            return "No time entry IDs provided."
         
-        formatted_projects = [format_project(project) for project in projects]
-        return "Projects:\n" + "\n---\n".join(formatted_projects)
+        reports = await current_client().bulk_delete_time_entries(id_list)
+        return format_bulk_report("delete", reports, id_list)
         
     except Exception as e:
-        return f"Error retrieving projects: {str(e)}"
+        return tool_error("deleting time entries", e)
+
+
+@mcp.tool()
+async def get_projects(
+    organization_id: Optional[int] = None,
+    format: str = "text",
+    max_rows: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> str:
+    """Get list of projects.
+    
+    Args:
+        organization_id: Organization ID to filter by (optional)
+        format: Output format: text, table, csv or jsonl
+        max_rows: Maximum number of records to return (optional)
+        max_chars: Maximum output size in characters (optional)
+        cursor: Cursor returned by a truncated previous call, to read the next records
+    """
+    try:
+        return await render_records(
+            "get_projects",
+            lambda: current_client().iter_projects(organization_id=organization_id),
+            "No projects found.",
+            "Projects:",
+            format_project,
+            PROJECT_COLUMNS,
+            format,
+            max_rows,
+            max_chars,
+            cursor,
+            query={"organization_id": organization_id}
+        )
+        
+    except Exception as e:
+        return tool_error("retrieving projects", e)
 
 
 @mcp.tool()
@@ -210,42 +716,47 @@ async def get_project_details(project_id: int) -> str:
         project_id: ID of the project
     """
     try:
-        project = await hubstaff_client.get_project(project_id)
+        project = await current_client().get_project(project_id)
         return f"Project Details:\n{format_project(project)}"
         
     except Exception as e:
-        return f"Error retrieving project details: {str(e)}"
+        return tool_error("retrieving project details", e)
 
 
 @mcp.tool()
-async def get_tasks(project_id: int) -> str:
+async def get_tasks(
+    project_id: int,
+    format: str = "text",
+    max_rows: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> str:
     """Get tasks for a specific project.
     
     Args:
         project_id: ID of the project
+        format: Output format: text, table, csv or jsonl
+        max_rows: Maximum number of records to return (optional)
+        max_chars: Maximum output size in characters (optional)
+        cursor: Cursor returned by a truncated previous call, to read the next records
     """
     try:
-        tasks = await hubstaff_client.get_tasks(project_id)
-        
-        if not tasks:
-            return f"No tasks found for project {project_id}."
-        
-        formatted_tasks = []
-        for task in tasks:
-            formatted_task = f"""
-Task ID: {task.get('id')}
-Summary: {task.get('summary')}
-Details: {task.get('details', 'No details')}
-Project ID: {task.get('project_id')}
-Assignee ID: {task.get('assignee_id', 'Unassigned')}
-Status: {task.get('status', 'Unknown')}
-"""
-            formatted_tasks.append(formatted_task)
-        
-        return f"Tasks for Project {project_id}:\n" + "\n---\n".join(formatted_tasks)
+        return await render_records(
+            "get_tasks",
+            lambda: current_client().iter_tasks(project_id),
+            f"No tasks found for project {project_id}.",
+            f"Tasks for Project {project_id}:",
+            format_task,
+            TASK_COLUMNS,
+            format,
+            max_rows,
+            max_chars,
+            cursor,
+            query={"project_id": project_id}
+        )
         
     except Exception as e:
-        return f"Error retrieving tasks: {str(e)}"
+        return tool_error("retrieving tasks", e)
 
 
 @mcp.tool()
@@ -274,18 +785,18 @@ async def create_task(
         if assignee_id:
             task_data["assignee_id"] = assignee_id
             
-        task = await hubstaff_client.create_task(task_data)
+        task = await current_client().create_task(task_data)
         return f"Task created successfully:\nTask ID: {task.get('id')}\nSummary: {task.get('summary')}"
         
     except Exception as e:
-        return f"Error creating task: {str(e)}"
+        return tool_error("creating task", e)
 
 
 @mcp.tool()
 async def get_current_user() -> str:
     """Get information about the current user."""
     try:
-        user = await hubstaff_client.get_current_user()
+        user = await current_client().get_current_user()
         return f"""
 Current User:
 ID: {user.get('id')}
@@ -296,86 +807,109 @@ Created: {user.get('created_at', 'Unknown')}
 """
         
     except Exception as e:
-        return f"Error retrieving current user: {str(e)}"
+        return tool_error("retrieving current user", e)
 
 
 @mcp.tool()
-async def get_users(organization_id: Optional[int] = None) -> str:
+async def get_users(
+    organization_id: Optional[int] = None,
+    format: str = "text",
+    max_rows: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> str:
     """Get organization users.
     
     Args:
         organization_id: Organization ID (optional)
+        format: Output format: text, table, csv or jsonl
+        max_rows: Maximum number of records to return (optional)
+        max_chars: Maximum output size in characters (optional)
+        cursor: Cursor returned by a truncated previous call, to read the next records
     """
     try:
-        users = await hubstaff_client.get_users(organization_id=organization_id)
-        
-        if not users:
-            return "No users found."
-        
-        formatted_users = []
-        for user in users:
-            formatted_user = f"""
-User ID: {user.get('id')}
-Name: {user.get('name')}
-Email: {user.get('email')}
-Time Zone: {user.get('time_zone', 'Not specified')}
-"""
-            formatted_users.append(formatted_user)
-        
-        return "Users:\n" + "\n---\n".join(formatted_users)
+        return await render_records(
+            "get_users",
+            lambda: current_client().iter_users(organization_id=organization_id),
+            "No users found.",
+            "Users:",
+            format_user,
+            USER_COLUMNS,
+            format,
+            max_rows,
+            max_chars,
+            cursor,
+            query={"organization_id": organization_id}
+        )
         
     except Exception as e:
-        return f"Error retrieving users: {str(e)}"
+        return tool_error("retrieving users", e)
 
 
 @mcp.tool()
-async def get_organizations() -> str:
-    """Get user organizations."""
+async def get_organizations(
+    format: str = "text",
+    max_rows: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> str:
+    """Get user organizations.
+    
+    Args:
+        format: Output format: text, table, csv or jsonl
+        max_rows: Maximum number of records to return (optional)
+        max_chars: Maximum output size in characters (optional)
+        cursor: Cursor returned by a truncated previous call, to read the next records
+    """
     try:
-        orgs = await hubstaff_client.get_organizations()
-        
-        if not orgs:
-            return "No organizations found."
-        
-        formatted_orgs = []
-        for org in orgs:
-            formatted_org = f"""
-Organization ID: {org.get('id')}
-Name: {org.get('name')}
-"""
-            formatted_orgs.append(formatted_org)
-        
-        return "Organizations:\n" + "\n---\n".join(formatted_orgs)
+        return await render_records(
+            "get_organizations",
+            current_client().get_organizations,
+            "No organizations found.",
+            "Organizations:",
+            format_organization,
+            ORGANIZATION_COLUMNS,
+            format,
+            max_rows,
+            max_chars,
+            cursor
+        )
         
     except Exception as e:
-        return f"Error retrieving organizations: {str(e)}"
+        return tool_error("retrieving organizations", e)
 
 
 @mcp.tool()
-async def get_teams(organization_id: int) -> str:
+async def get_teams(
+    organization_id: int,
+    format: str = "text",
+    max_rows: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    cursor: Optional[str] = None
+) -> str:
     """Get teams for an organization.
     
     Args:
         organization_id: Organization ID
+        format: Output format: text, table, csv or jsonl
+        max_rows: Maximum number of records to return (optional)
+        max_chars: Maximum output size in characters (optional)
+        cursor: Cursor returned by a truncated previous call, to read the next records
     """
     try:
-        teams = await hubstaff_client.get_teams(organization_id)
-        
-        if not teams:
-            return f"No teams found for organization {organization_id}."
-        
-        formatted_teams = []
-        for team in teams:
-            formatted_team = f"""
-Team ID: {team.get('id')}
-Name: {team.get('name')}
-"""
-            formatted_teams.append(formatted_team)
-        
-        return f"Teams for Organization {organization_id}:\n" + "\n---\n".join(formatted_teams)
+        return await render_records(
+            "get_teams",
+            lambda: current_client().get_teams(organization_id),
+            f"No teams found for organization {organization_id}.",
+            f"Teams for Organization {organization_id}:",
+            format_team,
+            TEAM_COLUMNS,
+            format, max_rows, max_chars, cursor,
+            query={"organization_id": organization_id}
+        )
         
     except Exception as e:
-        return f"Error retrieving teams: {str(e)}"
+        return tool_error("retrieving teams", e)
 
 
 @mcp.tool()
@@ -383,7 +917,11 @@ async def get_activities(
     start_date: str,
     end_date: str,
     user_ids: Optional[str] = None,
-    organization_id: Optional[int] = None
+    organization_id: Optional[int] = None,
+    format: str = "text",
+    max_rows: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    cursor: Optional[str] = None
 ) -> str:
     """Get user activities for a date range.
     
@@ -392,38 +930,50 @@ async def get_activities(
         end_date: End date in YYYY-MM-DD format
         user_ids: Comma-separated list of user IDs (optional)
         organization_id: Organization ID (optional)
+        format: Output format: text, table, csv or jsonl
+        max_rows: Maximum number of records to return (optional)
+        max_chars: Maximum output size in characters (optional)
+        cursor: Cursor returned by a truncated previous call, to read the next records
     """
     try:
         start_date_obj = parse_date_string(start_date)
         end_date_obj = parse_date_string(end_date)
         user_id_list = [int(x.strip()) for x in user_ids.split(",")] if user_ids else None
         
-        activities = await hubstaff_client.get_activities(
-            start_date=start_date_obj,
-            end_date=end_date_obj,
-            user_ids=user_id_list,
-            organization_id=organization_id
-        )
-        
-        if not activities:
-            return "No activities found for the specified criteria."
-        
-        formatted_activities = []
-        for activity in activities:
-            formatted_activity = f"""
-Activity ID: {activity.get('id')}
-User ID: {activity.get('user_id')}
-Time Slot: {activity.get('time_slot')}
-Keyboard: {activity.get('keyboard', 0)}%
-Mouse: {activity.get('mouse', 0)}%
-Overall: {activity.get('overall', 0)}%
-"""
-            formatted_activities.append(formatted_activity)
+        def fetch() -> Records:
+            if synced("activities", organization_id, start_date_obj, end_date_obj):
+                return sync_store.query(
+                    "activities", organization_id, start_date_obj, end_date_obj, user_id_list
+                )
+            return current_client().iter_activities(
+                start_date=start_date_obj,
+                end_date=end_date_obj,
+                user_ids=user_id_list,
+                organization_id=organization_id,
+                concurrency=None
+            )
         
-        return "Activities:\n" + "\n---\n".join(formatted_activities)
+        return await render_records(
+            "get_activities",
+            fetch,
+            "No activities found for the specified criteria.",
+            "Activities:",
+            format_activity,
+            ACTIVITY_COLUMNS,
+            format,
+            max_rows,
+            max_chars,
+            cursor,
+            query={
+                "start_date": start_date_obj,
+                "end_date": end_date_obj,
+                "user_ids": user_id_list,
+                "organization_id": organization_id,
+            }
+        )
         
     except Exception as e:
-        return f"Error retrieving activities: {str(e)}"
+        return tool_error("retrieving activities", e)
 
 
 @mcp.tool()
@@ -431,7 +981,11 @@ async def get_screenshots(
     start_date: str,
     end_date: str,
     user_ids: Optional[str] = None,
-    organization_id: Optional[int] = None
+    organization_id: Optional[int] = None,
+    format: str = "text",
+    max_rows: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    cursor: Optional[str] = None
 ) -> str:
     """Get screenshots for a date range.
     
@@ -440,36 +994,43 @@ async def get_screenshots(
         end_date: End date in YYYY-MM-DD format
         user_ids: Comma-separated list of user IDs (optional)
         organization_id: Organization ID (optional)
+        format: Output format: text, table, csv or jsonl
+        max_rows: Maximum number of records to return (optional)
+        max_chars: Maximum output size in characters (optional)
+        cursor: Cursor returned by a truncated previous call, to read the next records
     """
     try:
         start_date_obj = parse_date_string(start_date)
         end_date_obj = parse_date_string(end_date)
         user_id_list = [int(x.strip()) for x in user_ids.split(",")] if user_ids else None
         
-        screenshots = await hubstaff_client.get_screenshots(
-            start_date=start_date_obj,
-            end_date=end_date_obj,
-            user_ids=user_id_list,
-            organization_id=organization_id
+        return await render_records(
+            "get_screenshots",
+            lambda: current_client().iter_screenshots(
+                start_date=start_date_obj,
+                end_date=end_date_obj,
+                user_ids=user_id_list,
+                organization_id=organization_id,
+                concurrency=None
+            ),
+            "No screenshots found for the specified criteria.",
+            "Screenshots:",
+            format_screenshot,
+            SCREENSHOT_COLUMNS,
+            format,
+            max_rows,
+            max_chars,
+            cursor,
+            query={
+                "start_date": start_date_obj,
+                "end_date": end_date_obj,
+                "user_ids": user_id_list,
+                "organization_id": organization_id,
+            }
         )
         
-        if not screenshots:
-            return "No screenshots found for the specified criteria."
-        
-        formatted_screenshots = []
-        for screenshot in screenshots:
-            formatted_screenshot = f"""
-Screenshot ID: {screenshot.get('id')}
-User ID: {screenshot.get('user_id')}
-Time Slot: {screenshot.get('time_slot')}
-URL: {screenshot.get('url')}
-"""
-            formatted_screenshots.append(formatted_screenshot)
-        
-        return "Screenshots:\n" + "\n---\n".join(formatted_screenshots)
-        
     except Exception as e:
-        return f"Error retrieving screenshots: {str(e)}"
+        return tool_error("retrieving screenshots", e)
 
 
 @mcp.tool()
@@ -478,7 +1039,11 @@ async def get_timesheets(
     end_date: str,
     user_ids: Optional[str] = None,
     project_ids: Optional[str] = None,
-    organization_id: Optional[int] = None
+    organization_id: Optional[int] = None,
+    format: str = "text",
+    max_rows: Optional[int] = None,
+    max_chars: Optional[int] = None,
+    cursor: Optional[str] = None
 ) -> str:
     """Generate timesheets for a date range.
     
@@ -488,6 +1053,10 @@ async def get_timesheets(
         user_ids: Comma-separated list of user IDs (optional)
         project_ids: Comma-separated list of project IDs (optional)
         organization_id: Organization ID (optional)
+        format: Output format: text, table, csv or jsonl
+        max_rows: Maximum number of records to return (optional)
+        max_chars: Maximum output size in characters (optional)
+        cursor: Cursor returned by a truncated previous call, to read the next records
     """
     try:
         start_date_obj = parse_date_string(start_date)
@@ -495,33 +1064,157 @@ async def get_timesheets(
         user_id_list = [int(x.strip()) for x in user_ids.split(",")] if user_ids else None
         project_id_list = [int(x.strip()) for x in project_ids.split(",")] if project_ids else None
         
-        timesheets = await hubstaff_client.get_timesheets(
-            start_date=start_date_obj,
-            end_date=end_date_obj,
-            user_ids=user_id_list,
-            project_ids=project_id_list,
-            organization_id=organization_id
+        def fetch() -> Records:
+            if synced("time_entries", organization_id, start_date_obj, end_date_obj):
+                return sync_store.query_timesheets(
+                    organization_id, start_date_obj, end_date_obj, user_id_list, project_id_list
+                )
+            return current_client().iter_timesheets(
+                start_date=start_date_obj,
+                end_date=end_date_obj,
+                user_ids=user_id_list,
+                project_ids=project_id_list,
+                organization_id=organization_id
+            )
+        
+        return await render_records(
+            "get_timesheets",
+            fetch,
+            "No timesheet data found for the specified criteria.",
+            "Timesheets:",
+            format_timesheet,
+            TIMESHEET_COLUMNS,
+            format,
+            max_rows,
+            max_chars,
+            cursor,
+            query={
+                "start_date": start_date_obj,
+                "end_date": end_date_obj,
+                "user_ids": user_id_list,
+                "project_ids": project_id_list,
+                "organization_id": organization_id,
+            }
         )
         
-        if not timesheets:
-            return "No timesheet data found for the specified criteria."
+    except Exception as e:
+        return tool_error("generating timesheets", e)
+
+
+@mcp.tool()
+async def summarize_time(
+    start_date: str,
+    end_date: str,
+    group_by: str = "user",
+    source: str = "activities",
+    user_ids: Optional[str] = None,
+    project_ids: Optional[str] = None,
+    organization_id: Optional[int] = None,
+    max_rows: int = 50
+) -> str:
+    """Summarize tracked time and activity as a compact table instead of raw records.
+    
+    Args:
+        start_date: Start date in YYYY-MM-DD format
+        end_date: End date in YYYY-MM-DD format
+        group_by: Comma-separated grouping: user, project, task, day, week (e.g. "user,week")
+        source: Records to aggregate: activities, time_entries or timesheets
+        user_ids: Comma-separated list of user IDs (optional)
+        project_ids: Comma-separated list of project IDs (optional, not used for activities)
+        organization_id: Organization ID (optional)
+        max_rows: Maximum number of groups to list (all groups count toward the total)
+    """
+    try:
+        start_date_obj = parse_date_string(start_date)
+        end_date_obj = parse_date_string(end_date)
+        user_id_list = [int(x.strip()) for x in user_ids.split(",")] if user_ids else None
+        project_id_list = [int(x.strip()) for x in project_ids.split(",")] if project_ids else None
+        aggregator = TimeAggregator(parse_group_by(group_by))
+        
+        if source == "activities":
+            records = current_client().iter_activities(
+                start_date_obj,
+                end_date_obj,
+                user_id_list,
+                organization_id,
+                concurrency=None,
+                stream=True
+            )
+        elif source == "time_entries":
+            records = current_client().iter_time_entries(
+                start_date_obj,
+                end_date_obj,
+                user_id_list,
+                project_id_list,
+                organization_id,
+                concurrency=None,
+                stream=True
+            )
+        elif source == "timesheets":
+            records = current_client().iter_timesheets(
+                start_date_obj, end_date_obj, user_id_list, project_id_list, organization_id
+            )
+        else:
+            return f"Error: unknown source {source!r}. Use activities, time_entries or timesheets."
         
-        formatted_timesheets = []
-        for timesheet in timesheets:
-            total_hours = timesheet.get("tracked", 0) / 3600 if timesheet.get("tracked") else 0
-            formatted_timesheet = f"""
-User ID: {timesheet.get('user_id')}
-Project ID: {timesheet.get('project_id')}
-Date: {timesheet.get('date')}
-Total Hours: {total_hours:.2f}
-Tracked Time: {timesheet.get('tracked', 0)} seconds
-"""
-            formatted_timesheets.append(formatted_timesheet)
+        await aggregator.consume(records)
+        if not aggregator.groups:
+            return "No records found for the specified criteria."
         
-        return "Timesheets:\n" + "\n---\n".join(formatted_timesheets)
+        title = f"Time summary {start_date} to {end_date} ({source}, by {', '.join(aggregator.group_by)}):"
+        return title + "\n" + format_summary_table(aggregator, max_rows=max_rows)
         
     except Exception as e:
-        return f"Error generating timesheets: {str(e)}"
+        return tool_error("summarizing time", e)
+
+
+@mcp.tool()
+async def sync_time_data(
+    organization_id: int,
+    start_date: str,
+    end_date: Optional[str] = None,
+    resources: str = "time_entries,activities"
+) -> str:
+    """Mirror time entries and activities into the local sync database.
+    
+    Only days not yet synced (plus the last few days, which may still
+    change) are downloaded. Past ranges that are fully synced are then
+    answered locally by get_time_entries, get_activities and get_timesheets.
+    Requires the HUBSTAFF_SYNC_DB environment variable.
+    
+    Args:
+        organization_id: Organization ID to sync
+        start_date: First day to sync in YYYY-MM-DD format
+        end_date: Last day to sync in YYYY-MM-DD format (defaults to today)
+        resources: Comma-separated resources: time_entries, activities
+    """
+    try:
+        if sync_store is None:
+            return "Error: local sync is disabled. Set HUBSTAFF_SYNC_DB to a database file path."
+        if tenant_client.get() is not None:
+            return "Error: local sync is only available for the server's own Hubstaff account."
+        
+        start_date_obj = parse_date_string(start_date)
+        end_date_obj = parse_date_string(end_date) if end_date else None
+        resource_list = [x.strip() for x in resources.split(",") if x.strip()]
+        
+        from .sync import sync_organization
+        summary = await sync_organization(
+            current_client(), sync_store, organization_id, start_date_obj, end_date_obj,
+            resource_list
+        )
+        
+        lines = [f"Synced organization {organization_id}:"]
+        for resource, counts in summary.items():
+            high_water = sync_store.high_water(organization_id, resource)
+            lines.append(
+                f"- {resource}: {counts['records']} records from {counts['days']} days "
+                f"(synced through {high_water or 'n/a'})"
+            )
+        return "\n".join(lines)
+        
+    except Exception as e:
+        return tool_error("syncing time data", e)
 
 
 @mcp.tool()
@@ -532,13 +1225,14 @@ async def refresh_access_token() -> str:
     and getting a fresh access token for debugging purposes.
     """
     try:
-        if hubstaff_client is None:
+        client = current_client()
+        if client is None:
             return "Error: Hubstaff client not initialized. Please check your HUBSTAFF_REFRESH_TOKEN environment variable."
         
-        access_token = await hubstaff_client._refresh_access_token()
-        
-        # Update the client's stored access token
-        hubstaff_client.access_token = access_token
+        # Force a refresh of the current token (coalesced with any in-flight refresh)
+        access_token = await client.refresh_access_token(
+            stale_token=client.access_token
+        )
         
         # Return a truncated version for security (show first 10 characters)
         token_preview = access_token[:10] + "..." if len(access_token) > 10 else access_token
@@ -553,7 +1247,7 @@ Note: The full token is stored internally and will be used for subsequent API ca
 """
         
     except Exception as e:
-        return f"Error refreshing access token: {str(e)}"
+        return tool_error("refreshing access token", e)
 
 
 @mcp.tool()
@@ -564,11 +1258,12 @@ async def get_token_status() -> str:
     and provides information about the token configuration.
     """
     try:
-        if hubstaff_client is None:
+        client = current_client()
+        if client is None:
             return "Error: Hubstaff client not initialized. Please check your HUBSTAFF_REFRESH_TOKEN environment variable."
         
-        refresh_token = hubstaff_client.refresh_token
-        access_token = hubstaff_client.access_token
+        refresh_token = client.refresh_token
+        access_token = client.access_token
         
         # Check refresh token
         if not refresh_token:
@@ -580,6 +1275,9 @@ async def get_token_status() -> str:
         if access_token:
             access_token_preview = access_token[:10] + "..." if len(access_token) > 10 else access_token
             token_status = "✅ Access token available"
+            if client.token_expires_at is not None:
+                seconds_left = client.token_expires_at - time.time()
+                token_status += f" (expires in {int(seconds_left // 60)} minutes)"
         else:
             access_token_preview = "Not available"
             token_status = "⚠️  No access token (will be obtained on first API call)"
@@ -595,23 +1293,235 @@ Refresh Token Status: ✅ Available
 Access Token: {access_token_preview}
 Access Token Status: {token_status}
 
-API Base URL: {hubstaff_client.base_url}
-Auth URL: {hubstaff_client.auth_url}
+API Base URL: {client.base_url}
+Auth URL: {client.auth_url}
 
 Configuration: ✅ Ready for API calls
 """
         
     except Exception as e:
-        return f"Error checking token status: {str(e)}"
+        return tool_error("checking token status", e)
+
+
+def open_clients() -> List[HubstaffClient]:
+    """The server's own client and every open tenant client."""
+    clients = [hubstaff_client] if hubstaff_client is not None else []
+    if mcp.tenants is not None:
+        clients += mcp.tenants.clients()
+    return clients
+
+
+def client_counters() -> Dict[str, Dict[str, int]]:
+    """Retry, token, cache, coalescing and rate-limit numbers summed over all clients.
+    
+    Returns ``{"counters": ..., "gauges": ...}``; counters only ever grow,
+    as they include the clients of tenants that have since been closed.
+    """
+    counters = dict.fromkeys((
+        "api_retries_total", "api_retries_exhausted_total", "token_refreshes_total",
+        "cache_hits_total", "cache_misses_total", "cache_revalidations_total",
+        "cache_evictions_total", "coalesced_requests_total", "rate_limit_throttled_total",
+    ), 0)
+    gauges = dict.fromkeys(("cache_entries", "cache_bytes", "inflight_requests"), 0)
+    open_stats = [client.stats() for client in open_clients()]
+    retired = [mcp.tenants.retired_stats] if mcp.tenants is not None else []
+    for stats in open_stats + retired:
+        retries = stats.get("retries", {})
+        counters["api_retries_total"] += retries.get("retries", 0)
+        counters["api_retries_exhausted_total"] += retries.get("exhausted", 0)
+        counters["token_refreshes_total"] += stats.get("token_refreshes", 0)
+        counters["coalesced_requests_total"] += stats.get("coalescing", {}).get("deduplicated", 0)
+        counters["rate_limit_throttled_total"] += stats.get("rate_limit", {}).get("throttled", 0)
+        if stats.get("cache"):
+            counters["cache_hits_total"] += stats["cache"]["hits"]
+            counters["cache_misses_total"] += stats["cache"]["misses"]
+            counters["cache_revalidations_total"] += stats["cache"]["revalidations"]
+            counters["cache_evictions_total"] += stats["cache"]["evictions"]
+    for stats in open_stats:
+        gauges["inflight_requests"] += stats["coalescing"]["inflight"]
+        if stats["cache"] is not None:
+            gauges["cache_entries"] += stats["cache"]["entries"]
+            gauges["cache_bytes"] += stats["cache"]["bytes"]
+    sessions = result_sessions.stats()
+    gauges["result_sessions"] = sessions["sessions"]
+    gauges["result_session_bytes"] = sessions["bytes"]
+    if mcp.tenants is not None:
+        gauges["tenants"] = len(mcp.tenants)
+    return {"counters": counters, "gauges": gauges}
+
+
+@mcp.tool()
+async def get_server_metrics() -> str:
+    """Get latency, error and cache statistics of this MCP server.
+    
+    Reports per-tool and per-API-endpoint call counts and latency
+    percentiles (bucket upper bounds), bytes received, HTTP statuses,
+    error classes, records returned, retries, token refreshes and cache
+    hit rates since the server started.
+    """
+    try:
+        return json.dumps({**METRICS.snapshot(), **client_counters()}, indent=2)
+    except Exception as e:
+        return tool_error("collecting metrics", e)
+
+
+async def prometheus_metrics(request: Any) -> Any:
+    """Serve the metrics in Prometheus text format (HTTP transports only)."""
+    from starlette.responses import PlainTextResponse
+    
+    numbers = client_counters()
+    return PlainTextResponse(
+        METRICS.render_prometheus(numbers["counters"], numbers["gauges"]),
+        media_type="text/plain; version=0.0.4"
+    )
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    """Parse command-line options, defaulting to the HUBSTAFF_* environment."""
+    parser = argparse.ArgumentParser(prog="hubstaff-mcp", description="MCP server for the Hubstaff API")
+    parser.add_argument(
+        "--transport",
+        choices=TRANSPORTS,
+        default=env_str("HUBSTAFF_TRANSPORT", "stdio"),
+        help="stdio for a single desktop client; sse or streamable-http to serve many clients from one process"
+    )
+    parser.add_argument("--host", default=env_str("HUBSTAFF_HOST", DEFAULT_HOST), help="Address to bind in HTTP mode")
+    parser.add_argument("--port", type=int, default=env_int("HUBSTAFF_PORT", DEFAULT_PORT), help="Port to bind in HTTP mode")
+    parser.add_argument(
+        "--max-concurrent-calls",
+        type=int,
+        default=env_int("HUBSTAFF_MAX_CONCURRENT_CALLS", DEFAULT_MAX_CONCURRENT_CALLS),
+        help="Tool calls executed at once across all clients (0 = unlimited)"
+    )
+    parser.add_argument(
+        "--metrics-path",
+        default=env_str("HUBSTAFF_METRICS_PATH"),
+        help="Serve Prometheus metrics at this HTTP path, e.g. /metrics (HTTP transports only)"
+    )
+    parser.add_argument(
+        "--trace-file",
+        default=env_str("HUBSTAFF_TRACE_FILE"),
+        help="Append OpenTelemetry (OTLP/JSON) trace spans of every tool call to this file"
+    )
+    parser.add_argument(
+        "--profile-dir",
+        default=env_str("HUBSTAFF_PROFILE_DIR"),
+        help="Keep cProfile dumps of the slowest tool calls in this directory"
+    )
+    parser.add_argument(
+        "--no-prewarm",
+        dest="prewarm",
+        action="store_false",
+        default=env_bool("HUBSTAFF_PREWARM", True),
+        help="Don't fetch the access token and open connections in the background after the handshake"
+    )
+    parser.add_argument(
+        "--prewarm-data",
+        action="store_true",
+        default=env_bool("HUBSTAFF_PREWARM_DATA", False),
+        help="Also cache organizations, users, projects and teams in the background and keep them fresh"
+    )
+    parser.add_argument(
+        "--prewarm-interval",
+        type=float,
+        default=env_float("HUBSTAFF_PREWARM_INTERVAL", DEFAULT_PREWARM_INTERVAL),
+        help="Seconds between refreshes of the prewarmed data, with 10%% jitter (0 = warm once)"
+    )
+    parser.add_argument(
+        "--multi-tenant",
+        action="store_true",
+        default=env_bool("HUBSTAFF_MULTI_TENANT", False),
+        help=f"Let HTTP clients use their own Hubstaff token via the {TENANT_HEADER} header"
+    )
+    args = parser.parse_args(argv)
+    if args.transport not in TRANSPORTS:
+        parser.error(f"invalid transport {args.transport!r} (choose from {', '.join(TRANSPORTS)})")
+    if args.multi_tenant and args.transport == "stdio":
+        parser.error("--multi-tenant requires the sse or streamable-http transport")
+    return args
+
+
+def configure_transport(args: argparse.Namespace) -> None:
+    """Apply the transport options to the FastMCP server settings."""
+    mcp.settings.host = args.host
+    mcp.settings.port = args.port
+    if args.host not in LOOPBACK_HOSTS:
+        # FastMCP only allows localhost Host headers by default; a server
+        # bound to a shared address must accept its public name
+        mcp.settings.transport_security = None
+    mcp.limit_calls(args.max_concurrent_calls)
+    mcp.tenants = ClientRegistry.from_env() if args.multi_tenant else None
+    if mcp.tenants is not None:
+        mcp.tenants.on_close = close_tenant_sessions
+    if args.metrics_path and args.transport != "stdio":
+        mcp.custom_route(args.metrics_path, methods=["GET"])(prometheus_metrics)
+
+
+def configure_diagnostics(args: argparse.Namespace) -> None:
+    """Enable tracing and profiling if requested."""
+    TRACER.exporter = JSONFileExporter(args.trace_file) if args.trace_file else None
+    mcp.profiler = CallProfiler.from_env(args.profile_dir) if args.profile_dir else None
+
+
+async def serve(transport: str = "stdio") -> None:
+    """Run the server on ``transport`` and release the client's connection pool on exit."""
+    try:
+        if transport == "sse":
+            await mcp.run_sse_async()
+        elif transport == "streamable-http":
+            await mcp.run_streamable_http_async()
+        else:
+            await mcp.run_stdio_async()
+    finally:
+        await mcp.stop_prewarm()
+        await result_sessions.aclose()
+        if mcp.tenants is not None:
+            await mcp.tenants.aclose()
+        if hubstaff_client is not None:
+            await hubstaff_client.aclose()
+        if sync_store is not None:
+            sync_store.close()
 
 
-def main():
+def load_env_file() -> None:
+    """Load variables from a .env file unless the environment already has the token.
+    
+    Desktop MCP hosts pass HUBSTAFF_REFRESH_TOKEN in the server's
+    environment, so the .env search is skipped on their every launch.
+    """
+    if os.getenv("HUBSTAFF_REFRESH_TOKEN"):
+        return
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return  # dotenv is optional
+    load_dotenv()
+
+
+def main(argv: Optional[Sequence[str]] = None):
     """Main entry point for the MCP server."""
     try:
+        load_env_file()
+        args = parse_args(argv)
+        configure_transport(args)
+        configure_diagnostics(args)
         # Initialize Hubstaff client here to catch configuration errors early
-        global hubstaff_client
-        hubstaff_client = HubstaffClient()
-        mcp.run(transport="stdio")
+        global hubstaff_client, sync_store, result_sessions
+        if args.multi_tenant and not env_str("HUBSTAFF_REFRESH_TOKEN"):
+            # Every client must then bring its own token
+            hubstaff_client = None
+        else:
+            hubstaff_client = HubstaffClient()
+            if args.prewarm:
+                mcp.prewarm = ClientWarmer(hubstaff_client, args.prewarm_data, args.prewarm_interval).run
+        if env_str("HUBSTAFF_SYNC_DB"):
+            # Only load sqlite3 when the local mirror is enabled
+            from .sync import SyncStore
+            sync_store = SyncStore.from_env()
+        result_sessions = SessionStore.from_env()
+        asyncio.run(serve(args.transport))
+    except KeyboardInterrupt:
+        pass
     except ValueError as e:
         print(f"Configuration Error: {e}", file=sys.stderr)
         print("Please set your HUBSTAFF_REFRESH_TOKEN environment variable or create a .env file", file=sys.stderr)
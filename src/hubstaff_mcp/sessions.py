@@ -0,0 +1,243 @@
+"""Server-side result sessions that let list tools resume across calls."""
+
+import asyncio
+import secrets
+import sys
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
+
+from .config import env_float, env_int
+
+
+DEFAULT_SESSION_IDLE_TIMEOUT = 300.0
+DEFAULT_MAX_SESSIONS = 32
+DEFAULT_SESSION_MAX_BYTES = 32 * 1024 * 1024
+
+# Returned by ResultSession.next() once the records are exhausted.
+END = object()
+
+
+def estimate_size(records: List[Dict[str, Any]]) -> int:
+    """Rough in-memory size of a list of flat records, in bytes."""
+    size = sys.getsizeof(records)
+    for record in records:
+        size += sys.getsizeof(record)
+        for value in record.values():
+            size += sys.getsizeof(value)
+    return size
+
+
+class ResultSession:
+    """The unread remainder of one tool call's results.
+    
+    ``records`` is either a list (already in memory) or a live async
+    iterator, typically a paginated client iterator that only fetches the
+    next page when it is reached. ``tenant`` is the key of the tenant whose
+    client fetched the records, or None for the server's own account, and
+    ``query`` fingerprints the arguments of the call that produced them.
+    """
+    
+    def __init__(
+        self,
+        tool: str,
+        records: Union[List[Dict[str, Any]], AsyncIterator[Dict[str, Any]]],
+        offset: int = 0,
+        tenant: Optional[str] = None,
+        query: Optional[str] = None
+    ):
+        self.id = secrets.token_urlsafe(12)
+        self.tool = tool
+        self.tenant = tenant
+        self.query = query
+        self.offset = offset
+        self.last_used = 0.0
+        self.closed = False
+        # Held while a tool call reads from the session
+        self.lock = asyncio.Lock()
+        self._pending: List[Dict[str, Any]] = []
+        if isinstance(records, list):
+            self.total: Optional[int] = len(records)
+            self._size = estimate_size(records)
+            self._list: Optional[List[Dict[str, Any]]] = records
+            self._iterator: Optional[AsyncIterator[Dict[str, Any]]] = None
+        else:
+            self.total = None
+            self._size = 0
+            self._list = None
+            self._iterator = records
+    
+    @property
+    def size(self) -> int:
+        """Rough size of the records held in memory, in bytes.
+        
+        Iterators that prefetch (see :class:`~hubstaff_mcp.client.ShardedRecords`)
+        are measured by the records they have buffered, so the figure grows
+        and shrinks as the session is read.
+        """
+        buffered = getattr(self._iterator, "buffered", None)
+        if buffered is not None:
+            return estimate_size(buffered())
+        return self._size
+    
+    @property
+    def remaining(self) -> Optional[int]:
+        """Records left to read, when known."""
+        return self.total - self.offset if self.total is not None else None
+    
+    async def next(self) -> Any:
+        """Return the next record, or :data:`END`."""
+        if self._pending:
+            record = self._pending.pop()
+        elif self._list is not None:
+            if self.offset >= len(self._list):
+                return END
+            record = self._list[self.offset]
+        else:
+            try:
+                record = await self._iterator.__anext__()
+            except StopAsyncIteration:
+                return END
+        self.offset += 1
+        return record
+    
+    def push_back(self, record: Dict[str, Any]) -> None:
+        """Return an unconsumed record so the next read yields it again."""
+        self._pending.append(record)
+        self.offset -= 1
+    
+    async def skip(self, count: int) -> None:
+        """Discard ``count`` records (used to resume without a live session)."""
+        if self._list is not None:
+            self.offset = min(count, len(self._list))
+            return
+        while self.offset < count and await self.next() is not END:
+            pass
+    
+    async def aclose(self) -> None:
+        """Stop the underlying iterator, cancelling any prefetched pages."""
+        self.closed = True
+        self._size = 0
+        self._list = None
+        self._pending.clear()
+        if self._iterator is not None and hasattr(self._iterator, "aclose"):
+            await self._iterator.aclose()
+        self._iterator = None
+
+
+class SessionStore:
+    """LRU registry of open result sessions with an idle timeout and size cap.
+    
+    Sessions idle longer than ``idle_timeout`` are closed on the next
+    access. When more than ``max_sessions`` are open, or their buffered
+    records exceed ``max_bytes``, the least recently used are closed.
+    """
+    
+    def __init__(
+        self,
+        idle_timeout: float = DEFAULT_SESSION_IDLE_TIMEOUT,
+        max_sessions: int = DEFAULT_MAX_SESSIONS,
+        max_bytes: int = DEFAULT_SESSION_MAX_BYTES,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+        self.max_bytes = max_bytes
+        self.clock = clock
+        self.expired = 0
+        self.evicted = 0
+        self._sessions: "OrderedDict[str, ResultSession]" = OrderedDict()
+    
+    @classmethod
+    def from_env(cls) -> "SessionStore":
+        """Build a store from HUBSTAFF_SESSION_* settings."""
+        return cls(
+            idle_timeout=env_float("HUBSTAFF_SESSION_IDLE_TIMEOUT", DEFAULT_SESSION_IDLE_TIMEOUT),
+            max_sessions=env_int("HUBSTAFF_MAX_SESSIONS", DEFAULT_MAX_SESSIONS),
+            max_bytes=env_int("HUBSTAFF_SESSION_MAX_BYTES", DEFAULT_SESSION_MAX_BYTES),
+        )
+    
+    def __len__(self) -> int:
+        return len(self._sessions)
+    
+    def __contains__(self, session_id: str) -> bool:
+        return session_id in self._sessions
+    
+    @property
+    def total_bytes(self) -> int:
+        return sum(session.size for session in self._sessions.values())
+    
+    async def add(self, session: ResultSession) -> None:
+        """Register ``session``, evicting older ones to stay within the caps.
+        
+        Adding a session that is already registered marks it as most
+        recently used and re-checks the caps, since a live iterator's
+        buffered records can grow between reads.
+        """
+        await self.expire()
+        session.last_used = self.clock()
+        self._sessions[session.id] = session
+        self._sessions.move_to_end(session.id)
+        # Sessions being read by another call are never closed under it
+        idle = [s for s in self._sessions.values() if s is not session and not s.lock.locked()]
+        for oldest in idle:
+            if len(self._sessions) <= self.max_sessions and self.total_bytes <= self.max_bytes:
+                break
+            self.evicted += 1
+            await self.close(oldest.id)
+    
+    async def get(
+        self,
+        session_id: str,
+        tool: str,
+        tenant: Optional[str] = None,
+        query: Optional[str] = None
+    ) -> Optional[ResultSession]:
+        """Return the live session for ``session_id`` if the same call opened it.
+        
+        The session's ``tool``, ``tenant`` and ``query`` must all match.
+        """
+        await self.expire()
+        session = self._sessions.get(session_id)
+        if session is None or (session.tool, session.tenant, session.query) != (tool, tenant, query):
+            return None
+        session.last_used = self.clock()
+        self._sessions.move_to_end(session_id)
+        return session
+    
+    async def close(self, session_id: str) -> None:
+        """Close and forget a session (no-op if it is unknown)."""
+        session = self._sessions.pop(session_id, None)
+        if session is not None:
+            await session.aclose()
+    
+    async def close_tenant(self, tenant: str) -> None:
+        """Close every session holding records fetched by ``tenant``'s client."""
+        for session_id in [
+            session_id for session_id, session in self._sessions.items() if session.tenant == tenant
+        ]:
+            await self.close(session_id)
+    
+    async def expire(self) -> None:
+        """Close sessions that have been idle longer than ``idle_timeout``."""
+        cutoff = self.clock() - self.idle_timeout
+        for session_id in [
+            session_id for session_id, session in self._sessions.items()
+            if session.last_used <= cutoff and not session.lock.locked()
+        ]:
+            self.expired += 1
+            await self.close(session_id)
+    
+    async def aclose(self) -> None:
+        """Close every session."""
+        for session_id in list(self._sessions):
+            await self.close(session_id)
+    
+    def stats(self) -> Dict[str, int]:
+        """Counters describing open sessions."""
+        return {
+            "sessions": len(self._sessions),
+            "bytes": self.total_bytes,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
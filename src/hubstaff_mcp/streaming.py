@@ -0,0 +1,185 @@
+"""Incremental decoding of large Hubstaff list responses."""
+
+import codecs
+import json
+import re
+from contextlib import nullcontext
+from typing import Any, AsyncIterator, Callable, ContextManager, Dict, List, Union
+
+
+_WHITESPACE = " \t\n\r"
+_SEPARATORS = re.compile(r"[ \t\n\r,]*")
+
+# Parser states
+_START, _KEY, _COLON, _VALUE, _ARRAY, _DONE = range(6)
+
+
+class JSONArrayStream:
+    """Push parser for ``{"<key>": [...], ...}`` response bodies.
+    
+    Text is fed in arbitrary chunks; each call to :meth:`feed` returns the
+    elements of the top-level ``key`` array completed so far. Other
+    top-level members (e.g. ``pagination``) are small and are decoded
+    whole; :meth:`close` returns them once the body is complete. Only the
+    unparsed tail of the body is buffered, so memory is bounded by the
+    largest single element rather than the whole response.
+    """
+    
+    def __init__(self, key: str):
+        self.key = key
+        self.members: Dict[str, Any] = {}
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._pos = 0
+        self._state = _START
+        self._member = None
+        self._received = False
+    
+    def feed(self, text: str) -> List[Any]:
+        """Add ``text`` to the body and return newly completed array elements."""
+        if text:
+            self._received = True
+            self._buffer = self._buffer[self._pos:] + text
+            self._pos = 0
+        return self._parse(final=False)
+    
+    def close(self) -> Dict[str, Any]:
+        """Finish parsing and return the top-level members other than ``key``.
+        
+        An empty body yields no members. Raises ValueError if the body is
+        truncated or is not a JSON object.
+        """
+        if not self._received:
+            return {}
+        trailing = self._parse(final=True)
+        if self._state != _DONE or trailing:
+            raise ValueError("Truncated JSON response body")
+        if self._buffer[self._pos:].strip(_WHITESPACE):
+            raise ValueError("Extra data after JSON response body")
+        return self.members
+    
+    def _skip_whitespace(self) -> bool:
+        """Advance past whitespace; False if the buffer is exhausted."""
+        buffer = self._buffer
+        pos = self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return pos < len(buffer)
+    
+    def _decode_value(self, final: bool) -> Any:
+        """Decode the value at the cursor, or raise _Incomplete to wait for more."""
+        try:
+            value, end = self._decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError as e:
+            if final:
+                raise ValueError(f"Invalid JSON response body: {e}") from e
+            raise _Incomplete from e
+        # A number (or literal) at the end of the buffer may continue in the
+        # next chunk, so only accept a value that is followed by something.
+        if end == len(self._buffer) and not final:
+            raise _Incomplete
+        self._pos = end
+        return value
+    
+    def _parse(self, final: bool) -> List[Any]:
+        items = []
+        buffer = self._buffer
+        try:
+            while self._state != _DONE and self._skip_whitespace():
+                char = buffer[self._pos]
+                if self._state == _START:
+                    if char != "{":
+                        raise ValueError("Expected a JSON object response body")
+                    self._pos += 1
+                    self._state = _KEY
+                elif self._state == _KEY:
+                    if char == "}":
+                        self._pos += 1
+                        self._state = _DONE
+                    elif char == ",":
+                        self._pos += 1
+                    else:
+                        self._member = self._decode_value(final)
+                        self._state = _COLON
+                elif self._state == _COLON:
+                    if char != ":":
+                        raise ValueError("Expected ':' in JSON response body")
+                    self._pos += 1
+                    self._state = _VALUE
+                elif self._state == _VALUE:
+                    if self._member == self.key and char == "[":
+                        self._pos += 1
+                        self._state = _ARRAY
+                    else:
+                        self.members[self._member] = self._decode_value(final)
+                        self._state = _KEY
+                elif self._state == _ARRAY:
+                    self._parse_array(items, final)
+        except _Incomplete:
+            pass
+        return items
+    
+    def _parse_array(self, items: List[Any], final: bool) -> None:
+        """Decode array elements up to the closing bracket or end of buffer.
+        
+        This is the hot loop for large responses, so it works on locals and
+        skips separators with a regex instead of going through :meth:`_parse`.
+        """
+        buffer = self._buffer
+        size = len(buffer)
+        decode = self._decoder.raw_decode
+        skip = _SEPARATORS.match
+        pos = self._pos
+        try:
+            while True:
+                pos = skip(buffer, pos).end()
+                if pos >= size:
+                    return
+                if buffer[pos] == "]":
+                    pos += 1
+                    self._state = _KEY
+                    return
+                try:
+                    value, end = decode(buffer, pos)
+                except json.JSONDecodeError as e:
+                    if final:
+                        raise ValueError(f"Invalid JSON response body: {e}") from e
+                    raise _Incomplete from e
+                if end == size and not final:
+                    raise _Incomplete
+                items.append(value)
+                pos = end
+        finally:
+            self._pos = pos
+
+
+class _Incomplete(Exception):
+    """The buffered text ends mid-value; more input is needed."""
+
+
+async def iter_json_array(
+    chunks: AsyncIterator[Union[str, bytes]],
+    key: str,
+    members: Dict[str, Any],
+    timer: Callable[[int], ContextManager[Any]] = lambda size: nullcontext()
+) -> AsyncIterator[Any]:
+    """Yield elements of the top-level ``key`` array from a chunked JSON body.
+    
+    ``members`` is filled with the remaining top-level members once the
+    body has been consumed. Decoding each chunk runs inside ``timer(size)``,
+    which never spans a ``yield``, so it measures parsing alone.
+    """
+    parser = JSONArrayStream(key)
+    # Multi-byte characters may be split across byte chunks.
+    utf8 = codecs.getincrementaldecoder("utf-8")()
+    async for chunk in chunks:
+        with timer(len(chunk)):
+            if isinstance(chunk, bytes):
+                chunk = utf8.decode(chunk)
+            items = parser.feed(chunk)
+        for item in items:
+            yield item
+    with timer(0):
+        parser.feed(utf8.decode(b"", final=True))
+        members.update(parser.close())
@@ -0,0 +1,333 @@
+"""Local SQLite mirror of Hubstaff time entries and activities."""
+
+import asyncio
+import sqlite3
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from .client import HubstaffClient, date_shards
+from .config import env_str
+from .ratelimit import bulk_requests
+from .serialization import select_backend
+
+# Resource name -> (timestamp field used for the day index).
+RESOURCES = {
+    "time_entries": "starts_at",
+    "activities": "time_slot",
+}
+
+# Days before the high-water mark that are refetched on every sync, since
+# recent entries can still be edited or approved.
+DEFAULT_LOOKBACK_DAYS = 2
+
+# ``day`` is the record's own UTC day; ``fetched_day`` is the day whose API
+# query returned it, which is what replacing a day and range queries use.
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS {table} (
+    id INTEGER NOT NULL,
+    organization_id INTEGER NOT NULL,
+    user_id INTEGER,
+    project_id INTEGER,
+    task_id INTEGER,
+    starts_at TEXT,
+    day TEXT NOT NULL,
+    fetched_day TEXT NOT NULL,
+    tracked INTEGER NOT NULL DEFAULT 0,
+    data TEXT NOT NULL,
+    PRIMARY KEY (organization_id, id, fetched_day)
+);
+CREATE INDEX IF NOT EXISTS {table}_org_user_start
+    ON {table} (organization_id, user_id, starts_at);
+CREATE INDEX IF NOT EXISTS {table}_org_day
+    ON {table} (organization_id, day);
+CREATE INDEX IF NOT EXISTS {table}_org_fetched_day
+    ON {table} (organization_id, fetched_day);
+"""
+
+_STATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS synced_days (
+    organization_id INTEGER NOT NULL,
+    resource TEXT NOT NULL,
+    day TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (organization_id, resource, day)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    organization_id INTEGER NOT NULL,
+    resource TEXT NOT NULL,
+    high_water_day TEXT NOT NULL,
+    synced_at REAL NOT NULL,
+    PRIMARY KEY (organization_id, resource)
+);
+"""
+
+
+def _record_day(value: Optional[str]) -> Optional[str]:
+    """UTC calendar day (YYYY-MM-DD) of an ISO timestamp."""
+    if not value:
+        return None
+    parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc)
+    return parsed.date().isoformat()
+
+
+def _days(start_date: date, end_date: date) -> List[date]:
+    return [start for start, _ in date_shards(start_date, end_date, 1)]
+
+
+class SyncStore:
+    """SQLite database mirroring /time_entries and /activities per organization.
+    
+    Each (organization, resource, day) that has been fully downloaded is
+    recorded in ``synced_days``, and ``sync_state`` keeps the latest synced
+    day as a high-water mark. A sync downloads only days that were never
+    synced plus a short lookback window. Ranges made entirely of synced,
+    closed (past) days can then be answered locally.
+    """
+    
+    def __init__(self, path: str = ":memory:"):
+        self.path = path
+        if path != ":memory:":
+            Path(path).expanduser().parent.mkdir(parents=True, exist_ok=True)
+            path = str(Path(path).expanduser())
+        self.db = sqlite3.connect(path)
+        self.json = select_backend()
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        with self.db:
+            for table in RESOURCES:
+                self.db.executescript(_SCHEMA.format(table=table))
+            self.db.executescript(_STATE_SCHEMA)
+    
+    @classmethod
+    def from_env(cls) -> Optional["SyncStore"]:
+        """Open the database named by HUBSTAFF_SYNC_DB, or None if it is unset."""
+        path = env_str("HUBSTAFF_SYNC_DB")
+        return cls(path) if path else None
+    
+    def close(self) -> None:
+        self.db.close()
+    
+    # Sync state
+    
+    def synced_days(self, organization_id: int, resource: str) -> set:
+        rows = self.db.execute(
+            "SELECT day FROM synced_days WHERE organization_id = ? AND resource = ?",
+            (organization_id, resource),
+        )
+        return {row[0] for row in rows}
+    
+    def high_water(self, organization_id: int, resource: str) -> Optional[date]:
+        row = self.db.execute(
+            "SELECT high_water_day FROM sync_state WHERE organization_id = ? AND resource = ?",
+            (organization_id, resource),
+        ).fetchone()
+        return date.fromisoformat(row[0]) if row else None
+    
+    def covers(
+        self,
+        organization_id: int,
+        resource: str,
+        start_date: date,
+        end_date: date,
+        today: Optional[date] = None
+    ) -> bool:
+        """True if every day in the range is closed (before today) and synced."""
+        today = today or date.today()
+        if end_date >= today:
+            return False
+        days = self.synced_days(organization_id, resource)
+        return all(day.isoformat() in days for day in _days(start_date, end_date))
+    
+    def days_to_sync(
+        self,
+        organization_id: int,
+        resource: str,
+        start_date: date,
+        end_date: date,
+        lookback_days: int = DEFAULT_LOOKBACK_DAYS
+    ) -> List[date]:
+        """Days in the range that are unsynced, recent, or near the high-water mark."""
+        synced = self.synced_days(organization_id, resource)
+        high_water = self.high_water(organization_id, resource)
+        refresh_from = (
+            high_water - timedelta(days=lookback_days) if high_water is not None else None
+        )
+        today = date.today()
+        return [
+            day for day in _days(start_date, end_date)
+            if day.isoformat() not in synced
+            or day >= today
+            or (refresh_from is not None and day >= refresh_from)
+        ]
+    
+    # Writes
+    
+    def replace_day(
+        self,
+        organization_id: int,
+        resource: str,
+        day: date,
+        records: Iterable[Dict[str, Any]]
+    ) -> int:
+        """Replace the records fetched for one day with ``records``; returns the count.
+        
+        Rows are keyed by the fetched day rather than their own timestamp's
+        day, so refetching a day never drops records another day's fetch
+        stored. A record returned for several days is kept under each of
+        them, and range queries return it once.
+        """
+        time_field = RESOURCES[resource]
+        rows = []
+        for record in records:
+            timestamp = record.get(time_field) or record.get("starts_at")
+            rows.append((
+                record["id"],
+                organization_id,
+                record.get("user_id"),
+                record.get("project_id"),
+                record.get("task_id"),
+                timestamp,
+                _record_day(timestamp) or day.isoformat(),
+                day.isoformat(),
+                record.get("tracked") or 0,
+                self.json.dumps(record).decode(),
+            ))
+        
+        with self.db:
+            self.db.execute(
+                f"DELETE FROM {resource} WHERE organization_id = ? AND fetched_day = ?",
+                (organization_id, day.isoformat()),
+            )
+            self.db.executemany(
+                f"INSERT OR REPLACE INTO {resource} "
+                "(id, organization_id, user_id, project_id, task_id, starts_at, day, fetched_day, tracked, data) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            self.db.execute(
+                "INSERT OR REPLACE INTO synced_days VALUES (?, ?, ?, ?)",
+                (organization_id, resource, day.isoformat(), time.time()),
+            )
+            high_water = self.high_water(organization_id, resource)
+            if high_water is None or day > high_water:
+                self.db.execute(
+                    "INSERT OR REPLACE INTO sync_state VALUES (?, ?, ?, ?)",
+                    (organization_id, resource, day.isoformat(), time.time()),
+                )
+        return len(rows)
+    
+    # Queries
+    
+    def _select(
+        self,
+        columns: str,
+        resource: str,
+        organization_id: int,
+        start_date: date,
+        end_date: date,
+        user_ids: Optional[Sequence[int]] = None,
+        project_ids: Optional[Sequence[int]] = None,
+        suffix: str = "",
+        day_column: str = "fetched_day"
+    ) -> List[tuple]:
+        sql = (
+            f"SELECT *, MAX(fetched_day) FROM {resource} "
+            f"WHERE organization_id = ? AND {day_column} BETWEEN ? AND ?"
+        )
+        args: List[Any] = [organization_id, start_date.isoformat(), end_date.isoformat()]
+        if user_ids:
+            sql += f" AND user_id IN ({','.join('?' * len(user_ids))})"
+            args.extend(user_ids)
+        if project_ids:
+            sql += f" AND project_id IN ({','.join('?' * len(project_ids))})"
+            args.extend(project_ids)
+        # One row per record, from the latest day that returned it
+        sql = f"SELECT {columns} FROM ({sql} GROUP BY id)"
+        return self.db.execute(sql + suffix, args).fetchall()
+    
+    def query(
+        self,
+        resource: str,
+        organization_id: int,
+        start_date: date,
+        end_date: date,
+        user_ids: Optional[Sequence[int]] = None,
+        project_ids: Optional[Sequence[int]] = None
+    ) -> List[Dict[str, Any]]:
+        """Stored records for the range, ordered by start time."""
+        rows = self._select(
+            "data", resource, organization_id, start_date, end_date, user_ids, project_ids,
+            " ORDER BY starts_at, id",
+        )
+        return [self.json.loads(row[0]) for row in rows]
+    
+    def query_timesheets(
+        self,
+        organization_id: int,
+        start_date: date,
+        end_date: date,
+        user_ids: Optional[Sequence[int]] = None,
+        project_ids: Optional[Sequence[int]] = None
+    ) -> List[Dict[str, Any]]:
+        """Timesheet rows (tracked seconds per user, project and day) from time entries.
+        
+        Entries are counted on their own start day, which is also the day
+        they are selected by, so every row falls inside the range.
+        """
+        rows = self._select(
+            "user_id, project_id, day, SUM(tracked)", "time_entries",
+            organization_id, start_date, end_date, user_ids, project_ids,
+            " GROUP BY user_id, project_id, day ORDER BY day, user_id, project_id",
+            day_column="day",
+        )
+        return [
+            {"user_id": user_id, "project_id": project_id, "date": day, "tracked": tracked}
+            for user_id, project_id, day, tracked in rows
+        ]
+
+
+async def sync_organization(
+    client: HubstaffClient,
+    store: SyncStore,
+    organization_id: int,
+    start_date: date,
+    end_date: Optional[date] = None,
+    resources: Sequence[str] = tuple(RESOURCES),
+    lookback_days: int = DEFAULT_LOOKBACK_DAYS
+) -> Dict[str, Dict[str, int]]:
+    """Bring the local mirror up to date for one organization.
+    
+    Only days returned by :meth:`SyncStore.days_to_sync` are downloaded,
+    with up to ``client.fetch_concurrency`` days in flight, at bulk
+    priority so interactive tool calls are not starved.
+    
+    Returns:
+        ``{resource: {"days": n, "records": n}}`` describing what was fetched
+    """
+    end_date = end_date or date.today()
+    summary = {}
+    semaphore = asyncio.Semaphore(max(1, client.fetch_concurrency))
+    
+    for resource in resources:
+        if resource not in RESOURCES:
+            raise ValueError(f"Unknown resource {resource!r}. Use: {', '.join(RESOURCES)}.")
+        iterate = client.iter_time_entries if resource == "time_entries" else client.iter_activities
+        days = store.days_to_sync(organization_id, resource, start_date, end_date, lookback_days)
+        
+        async def sync_day(day: date) -> int:
+            async with semaphore:
+                records = [
+                    record async for record in iterate(
+                        day, day, organization_id=organization_id, stream=True
+                    )
+                ]
+            return store.replace_day(organization_id, resource, day, records)
+        
+        with bulk_requests():
+            counts = await asyncio.gather(*(sync_day(day) for day in days))
+        summary[resource] = {"days": len(days), "records": sum(counts)}
+    return summary
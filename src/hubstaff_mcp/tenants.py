@@ -0,0 +1,161 @@
+"""Per-credential Hubstaff clients for a server shared by several organizations."""
+
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional
+
+from .client import HubstaffClient
+from .config import env_float, env_int
+from .token_cache import token_cache_key
+
+
+DEFAULT_MAX_TENANTS = 16
+DEFAULT_TENANT_IDLE_TIMEOUT = 900.0
+DEFAULT_MAX_TOTAL_CONNECTIONS = 64
+
+
+def add_counts(total: Dict[str, Any], stats: Dict[str, Any]) -> Dict[str, Any]:
+    """Add the numbers in the nested ``stats`` dict into ``total``, in place."""
+    for name, value in stats.items():
+        if isinstance(value, dict):
+            add_counts(total.setdefault(name, {}), value)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            total[name] = total.get(name, 0) + value
+    return total
+
+
+class Tenant:
+    """One credential's client and its usage bookkeeping."""
+    
+    def __init__(self, key: str, client: HubstaffClient):
+        self.key = key
+        self.client = client
+        # Tool calls currently using the client
+        self.active = 0
+        self.last_used = 0.0
+
+
+class ClientRegistry:
+    """LRU map of refresh tokens to their own :class:`HubstaffClient`.
+    
+    Every tenant has its own token state, response cache, request
+    coalescing and rate-limit bucket. The ``max_connections`` budget is
+    split evenly between the ``max_tenants`` slots, so one tenant's heavy
+    pulls cannot take connections from another. Tenants idle longer than
+    ``idle_timeout``, and the least recently used beyond ``max_tenants``,
+    are closed; a tenant is never closed while a call is using it.
+    ``on_close``, if set, is awaited with a tenant's key before its client
+    is closed, so state built on that client can be released with it.
+    The :meth:`HubstaffClient.stats` of closed clients are summed into
+    ``retired_stats`` so server-wide totals survive evictions.
+    """
+    
+    def __init__(
+        self,
+        factory: Callable[..., HubstaffClient] = HubstaffClient,
+        max_tenants: int = DEFAULT_MAX_TENANTS,
+        idle_timeout: float = DEFAULT_TENANT_IDLE_TIMEOUT,
+        max_connections: int = DEFAULT_MAX_TOTAL_CONNECTIONS,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if max_tenants < 1:
+            raise ValueError("max_tenants must be at least 1")
+        self.factory = factory
+        self.max_tenants = max_tenants
+        self.idle_timeout = idle_timeout
+        self.connections_per_tenant = max(1, max_connections // max_tenants)
+        self.clock = clock
+        self.on_close: Optional[Callable[[str], Awaitable[None]]] = None
+        self.created = 0
+        self.expired = 0
+        self.evicted = 0
+        self.retired_stats: Dict[str, Any] = {}
+        self._tenants: "OrderedDict[str, Tenant]" = OrderedDict()
+    
+    @classmethod
+    def from_env(cls, factory: Callable[..., HubstaffClient] = HubstaffClient) -> "ClientRegistry":
+        """Build a registry from HUBSTAFF_MAX_TENANTS and related settings."""
+        return cls(
+            factory=factory,
+            max_tenants=env_int("HUBSTAFF_MAX_TENANTS", DEFAULT_MAX_TENANTS),
+            idle_timeout=env_float("HUBSTAFF_TENANT_IDLE_TIMEOUT", DEFAULT_TENANT_IDLE_TIMEOUT),
+            max_connections=env_int("HUBSTAFF_MAX_TOTAL_CONNECTIONS", DEFAULT_MAX_TOTAL_CONNECTIONS),
+        )
+    
+    def __len__(self) -> int:
+        return len(self._tenants)
+    
+    def __contains__(self, refresh_token: str) -> bool:
+        return token_cache_key(refresh_token) in self._tenants
+    
+    @asynccontextmanager
+    async def lease(self, refresh_token: str) -> AsyncIterator[HubstaffClient]:
+        """Yield the client for ``refresh_token``, creating it on first use."""
+        # Keyed by hash so raw tokens are not kept around as dict keys
+        key = token_cache_key(refresh_token)
+        tenant = self._tenants.get(key)
+        if tenant is None:
+            # HUBSTAFF_TOKEN_CACHE belongs to the server's own account; tenant
+            # tokens are kept in memory only
+            client = self.factory(
+                refresh_token=refresh_token,
+                max_connections=self.connections_per_tenant,
+                token_cache=None
+            )
+            tenant = self._tenants[key] = Tenant(key, client)
+            self.created += 1
+        else:
+            self._tenants.move_to_end(key)
+        tenant.active += 1
+        tenant.last_used = self.clock()
+        try:
+            for stale in self._collect():
+                await self._close(stale)
+            yield tenant.client
+        finally:
+            tenant.active -= 1
+            tenant.last_used = self.clock()
+    
+    def _collect(self) -> List[Tenant]:
+        """Remove expired and over-cap idle tenants, returning them for closing."""
+        cutoff = self.clock() - self.idle_timeout
+        removed = []
+        for tenant in list(self._tenants.values()):
+            if tenant.active == 0 and tenant.last_used <= cutoff:
+                self.expired += 1
+                removed.append(self._tenants.pop(tenant.key))
+        for tenant in list(self._tenants.values()):
+            if len(self._tenants) <= self.max_tenants:
+                break
+            if tenant.active == 0:
+                self.evicted += 1
+                removed.append(self._tenants.pop(tenant.key))
+        return removed
+    
+    async def _close(self, tenant: Tenant) -> None:
+        if self.on_close is not None:
+            await self.on_close(tenant.key)
+        await tenant.client.aclose()
+        add_counts(self.retired_stats, tenant.client.stats())
+    
+    def clients(self) -> List[HubstaffClient]:
+        """Every open tenant client."""
+        return [tenant.client for tenant in self._tenants.values()]
+    
+    async def aclose(self) -> None:
+        """Close every tenant's connection pool."""
+        tenants, self._tenants = list(self._tenants.values()), OrderedDict()
+        for tenant in tenants:
+            await self._close(tenant)
+    
+    def stats(self) -> Dict[str, int]:
+        """Counters describing open tenants."""
+        return {
+            "tenants": len(self._tenants),
+            "active_calls": sum(tenant.active for tenant in self._tenants.values()),
+            "connections_per_tenant": self.connections_per_tenant,
+            "created": self.created,
+            "expired": self.expired,
+            "evicted": self.evicted,
+        }
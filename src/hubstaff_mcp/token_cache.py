@@ -0,0 +1,100 @@
+"""On-disk cache of Hubstaff access tokens for fast server startup."""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .config import env_str
+
+logger = logging.getLogger(__name__)
+
+# Cached access tokens closer than this to expiry are not worth reusing.
+MIN_TOKEN_LIFETIME = 60.0
+
+
+def token_cache_key(refresh_token: str) -> str:
+    """Return the cache key for a configured refresh token (never the token itself)."""
+    return hashlib.sha256(refresh_token.encode("utf-8")).hexdigest()
+
+
+class TokenCache:
+    """JSON file mapping refresh-token hashes to the latest token state.
+    
+    Each entry stores the last access token, its wall-clock expiry and the
+    most recent (possibly rotated) refresh token. The file is written
+    atomically with owner-only permissions since it holds credentials.
+    """
+    
+    def __init__(self, path: os.PathLike):
+        self.path = Path(path).expanduser()
+    
+    @classmethod
+    def from_env(cls) -> Optional["TokenCache"]:
+        """Build a cache from HUBSTAFF_TOKEN_CACHE, or None if it is unset."""
+        path = env_str("HUBSTAFF_TOKEN_CACHE")
+        return cls(path) if path else None
+    
+    def _read_all(self) -> Dict[str, Any]:
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning("Ignoring unreadable token cache %s: %s", self.path, e)
+            return {}
+        return data if isinstance(data, dict) else {}
+    
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached entry for ``key``.
+        
+        An access token that is expired (or about to be) is dropped from the
+        returned entry, but a rotated refresh token is still returned.
+        """
+        entry = self._read_all().get(key)
+        if not isinstance(entry, dict):
+            return None
+        
+        entry = dict(entry)
+        expires_at = entry.get("expires_at")
+        if not entry.get("access_token") or (
+            expires_at is not None and expires_at - time.time() < MIN_TOKEN_LIFETIME
+        ):
+            entry.pop("access_token", None)
+            entry.pop("expires_at", None)
+        return entry
+    
+    def save(
+        self,
+        key: str,
+        access_token: str,
+        expires_at: Optional[float],
+        refresh_token: str
+    ) -> None:
+        """Persist the token state for ``key``; failures are logged, not raised."""
+        try:
+            data = self._read_all()
+            data[key] = {
+                "access_token": access_token,
+                "expires_at": expires_at,
+                "refresh_token": refresh_token,
+            }
+            self.path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(
+                dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp"
+            )
+            try:
+                # mkstemp already creates the file with mode 0600.
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(data, f)
+                os.replace(tmp_path, self.path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except OSError as e:
+            logger.warning("Could not write token cache %s: %s", self.path, e)
@@ -0,0 +1,225 @@
+"""Opt-in trace spans and sampled cProfile dumps for diagnosing slow tool calls."""
+
+import cProfile
+import heapq
+import json
+import random
+import secrets
+import time
+from contextlib import contextmanager, nullcontext
+from contextvars import ContextVar
+from pathlib import Path
+from typing import Any, Callable, ContextManager, Dict, Iterator, List, Optional, Tuple
+
+from .config import env_float, env_int
+
+
+DEFAULT_PROFILE_SLOWEST = 5
+DEFAULT_PROFILE_SAMPLE_RATE = 1.0
+
+# OpenTelemetry span status codes
+STATUS_OK = 1
+STATUS_ERROR = 2
+
+
+class Span:
+    """One timed operation within a trace."""
+    
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start", "end", "attributes", "error")
+    
+    def __init__(self, name: str, trace_id: str, parent_id: Optional[str], attributes: Dict[str, Any]):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.start = time.time_ns()
+        self.end = 0
+        self.attributes = attributes
+        self.error: Optional[str] = None
+    
+    def set(self, key: str, value: Any) -> None:
+        """Attach an attribute (str, int, float or bool)."""
+        self.attributes[key] = value
+    
+    def to_otlp(self) -> Dict[str, Any]:
+        """The span in OTLP/JSON form."""
+        span = {
+            "traceId": self.trace_id,
+            "spanId": self.span_id,
+            "name": self.name,
+            "kind": 1,
+            "startTimeUnixNano": str(self.start),
+            "endTimeUnixNano": str(self.end),
+            "attributes": [_attribute(key, value) for key, value in self.attributes.items()],
+            "status": {"code": STATUS_ERROR, "message": self.error} if self.error else {"code": STATUS_OK},
+        }
+        if self.parent_id:
+            span["parentSpanId"] = self.parent_id
+        return span
+
+
+def _attribute(key: str, value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        typed = {"boolValue": value}
+    elif isinstance(value, int):
+        typed = {"intValue": str(value)}
+    elif isinstance(value, float):
+        typed = {"doubleValue": value}
+    else:
+        typed = {"stringValue": str(value)}
+    return {"key": key, "value": typed}
+
+
+class JSONFileExporter:
+    """Append each finished trace to a file as one OTLP/JSON line.
+    
+    Every line is an ``ExportTraceServiceRequest``, so the file can be
+    replayed into an OpenTelemetry collector or read with ``jq`` offline.
+    """
+    
+    def __init__(self, path: str, service_name: str = "hubstaff-mcp"):
+        self.path = Path(path).expanduser()
+        self.service_name = service_name
+    
+    def export(self, spans: List[Span]) -> None:
+        request = {"resourceSpans": [{
+            "resource": {"attributes": [_attribute("service.name", self.service_name)]},
+            "scopeSpans": [{
+                "scope": {"name": "hubstaff_mcp"},
+                "spans": [span.to_otlp() for span in spans],
+            }],
+        }]}
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(request, separators=(",", ":")) + "\n")
+
+
+class Tracer:
+    """Create nested spans; a no-op until an exporter is configured.
+    
+    The current span is tracked in a context variable, so spans opened in
+    tasks spawned during a call (sharded fetches, for example) become its
+    children. A trace is exported when its root span ends; spans finishing
+    after that (from background work) are exported on their own.
+    """
+    
+    def __init__(self, exporter: Optional[JSONFileExporter] = None):
+        self.exporter = exporter
+        self._current: ContextVar[Optional[Span]] = ContextVar("span", default=None)
+        self._open: Dict[str, List[Span]] = {}
+    
+    @property
+    def enabled(self) -> bool:
+        return self.exporter is not None
+    
+    def span(self, name: str, **attributes: Any) -> ContextManager[Optional[Span]]:
+        """Time the enclosed block as ``name``; yields the span, or None when disabled."""
+        if self.exporter is None:
+            return nullcontext()
+        return self._span(name, attributes)
+    
+    @contextmanager
+    def _span(self, name: str, attributes: Dict[str, Any]) -> Iterator[Span]:
+        parent = self._current.get()
+        root = parent is None
+        span = Span(name, secrets.token_hex(16) if root else parent.trace_id,
+                    None if root else parent.span_id, attributes)
+        if root:
+            self._open[span.trace_id] = []
+        token = self._current.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end = time.time_ns()
+            self._current.reset(token)
+            self._finish(span, root)
+    
+    def _finish(self, span: Span, root: bool) -> None:
+        spans = self._open.pop(span.trace_id, None) if root else self._open.get(span.trace_id)
+        if spans is None:
+            self.exporter.export([span])
+            return
+        spans.append(span)
+        if root:
+            self.exporter.export(spans)
+
+
+class CallProfiler:
+    """Profile a sample of calls with cProfile, keeping dumps of the slowest.
+    
+    Only ``keep`` ``.prof`` files (readable with :mod:`pstats` or snakeviz)
+    are kept in ``directory``; a faster call's dump is deleted when a
+    slower one arrives. One call is profiled at a time, and because tool
+    calls are coroutines, work of other calls interleaved with it also
+    appears in its profile.
+    """
+    
+    def __init__(
+        self,
+        directory: str,
+        keep: int = DEFAULT_PROFILE_SLOWEST,
+        sample_rate: float = DEFAULT_PROFILE_SAMPLE_RATE,
+        rng: Callable[[], float] = random.random
+    ):
+        self.directory = Path(directory).expanduser()
+        self.keep = keep
+        self.sample_rate = sample_rate
+        self.rng = rng
+        self.profiled = 0
+        self._active = False
+        self._slowest: List[Tuple[float, str]] = []
+    
+    @classmethod
+    def from_env(cls, directory: str) -> "CallProfiler":
+        """Build a profiler using HUBSTAFF_PROFILE_SLOWEST and HUBSTAFF_PROFILE_SAMPLE_RATE."""
+        return cls(
+            directory,
+            keep=env_int("HUBSTAFF_PROFILE_SLOWEST", DEFAULT_PROFILE_SLOWEST),
+            sample_rate=env_float("HUBSTAFF_PROFILE_SAMPLE_RATE", DEFAULT_PROFILE_SAMPLE_RATE),
+        )
+    
+    @property
+    def slowest(self) -> List[Tuple[float, str]]:
+        """``(seconds, path)`` of the kept profiles, slowest first."""
+        return sorted(self._slowest, reverse=True)
+    
+    @contextmanager
+    def profile(self, name: str) -> Iterator[None]:
+        """Profile the enclosed block if it is sampled and no other profile is running."""
+        if self._active or self.keep < 1 or self.rng() >= self.sample_rate:
+            yield
+            return
+        profiler = cProfile.Profile()
+        try:
+            profiler.enable()
+        except ValueError:
+            # Another profiler (or debugger) owns the interpreter hook
+            yield
+            return
+        self._active = True
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            self._active = False
+            self._record(name, time.perf_counter() - started, profiler)
+    
+    def _record(self, name: str, seconds: float, profiler: cProfile.Profile) -> None:
+        self.profiled += 1
+        if len(self._slowest) >= self.keep and seconds <= self._slowest[0][0]:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self.directory / f"{name}-{int(seconds * 1000)}ms-{time.time_ns()}.prof"
+        profiler.dump_stats(str(path))
+        heapq.heappush(self._slowest, (seconds, str(path)))
+        if len(self._slowest) > self.keep:
+            _, fastest = heapq.heappop(self._slowest)
+            Path(fastest).unlink(missing_ok=True)
+
+
+# Process-wide tracer; main() attaches an exporter when tracing is enabled
+TRACER = Tracer()
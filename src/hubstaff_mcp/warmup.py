@@ -0,0 +1,73 @@
+"""Background warming of the server's client: token, connections and reference data."""
+
+import asyncio
+import logging
+import random
+from typing import Awaitable, Callable
+
+from .client import HubstaffClient
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds between refreshes of the cached reference data; shorter than the
+# 10-minute users/projects cache TTL so warm entries never lapse
+DEFAULT_PREWARM_INTERVAL = 300.0
+
+# Each refresh delay varies randomly by up to this fraction of the interval
+DEFAULT_PREWARM_JITTER = 0.1
+
+
+class ClientWarmer:
+    """Prepare a client for the first tool calls and keep reference data cached.
+    
+    :meth:`run` obtains the access token and opens a pooled connection.
+    With ``reference_data`` it then fetches organizations, users, projects
+    and teams into the response cache (see
+    :meth:`HubstaffClient.warm_reference_data`) and refreshes them every
+    ``interval`` seconds, randomized by ``jitter`` so that servers started
+    together do not refresh in lockstep. An interval of 0 warms once.
+    Failures are logged and retried at the next refresh.
+    """
+    
+    def __init__(
+        self,
+        client: HubstaffClient,
+        reference_data: bool = False,
+        interval: float = DEFAULT_PREWARM_INTERVAL,
+        jitter: float = DEFAULT_PREWARM_JITTER,
+        rng: Callable[[], float] = random.random,
+        sleep: Callable[[float], Awaitable[None]] = asyncio.sleep
+    ):
+        self.client = client
+        self.reference_data = reference_data
+        self.interval = interval
+        self.jitter = jitter
+        self.rng = rng
+        self.sleep = sleep
+        self.refreshes = 0
+        self.failures = 0
+    
+    def next_delay(self) -> float:
+        """Seconds until the next refresh: ``interval`` plus or minus the jitter."""
+        return self.interval * (1 + self.jitter * (2 * self.rng() - 1))
+    
+    async def run(self) -> None:
+        try:
+            await self.client.prewarm()
+        except Exception as e:
+            # The first tool call retries and reports the problem to the caller
+            self.failures += 1
+            logger.warning("Prewarming the Hubstaff client failed: %s", e)
+        if not self.reference_data:
+            return
+        while True:
+            try:
+                await self.client.warm_reference_data()
+                self.refreshes += 1
+            except Exception as e:
+                self.failures += 1
+                logger.warning("Refreshing cached reference data failed: %s", e)
+            if self.interval <= 0:
+                return
+            await self.sleep(self.next_delay())
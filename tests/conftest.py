@@ -2,6 +2,7 @@
 
 import pytest
 import asyncio
+import httpx
 from unittest.mock import AsyncMock, patch
 from hubstaff_mcp.client import HubstaffClient
 
@@ -14,6 +15,35 @@ def mock_hubstaff_client():
         return client
 
 
+@pytest.fixture
+def make_client():
+    """Factory for clients whose requests go to a mock ``handler``.
+    
+    ``make_client(handler, **kwargs)`` builds a client with rate limiting
+    and the on-disk token cache off and an access token already set, so
+    tests see only their own API calls. Pass ``access_token=None`` to
+    exercise the token exchange, and ``transport`` instead of a handler to
+    use another transport. Other keyword arguments go to
+    :class:`HubstaffClient`.
+    """
+    def factory(
+        handler=None,
+        access_token="token",
+        refresh_token="test_refresh_token",
+        **kwargs
+    ) -> HubstaffClient:
+        if handler is not None:
+            kwargs["transport"] = httpx.MockTransport(handler)
+        kwargs.setdefault("rate_limit", 0)
+        kwargs.setdefault("token_cache", None)
+        with patch.dict("os.environ", {"HUBSTAFF_REFRESH_TOKEN": refresh_token}):
+            client = HubstaffClient(**kwargs)
+        if access_token is not None:
+            client.access_token = access_token
+        return client
+    return factory
+
+
 @pytest.fixture
 def event_loop():
     """Create an event loop for async tests."""
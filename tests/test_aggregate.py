@@ -0,0 +1,85 @@
+"""Tests for streaming time aggregation and the summarize_time tool."""
+
+from unittest.mock import patch
+
+import pytest
+
+from hubstaff_mcp import server
+from hubstaff_mcp.aggregate import Accumulator, TimeAggregator, format_summary_table, parse_group_by
+
+
+ACTIVITIES = [
+    {"user_id": 1, "project_id": 10, "time_slot": "2025-01-06T09:00:00Z", "tracked": 600, "overall": 300, "keyboard": 120, "mouse": 240},
+    {"user_id": 1, "project_id": 10, "time_slot": "2025-01-06T09:10:00Z", "tracked": 600, "overall": 600, "keyboard": 300, "mouse": 600},
+    {"user_id": 2, "project_id": 11, "time_slot": "2025-01-13T09:00:00Z", "tracked": 1800, "overall": 360, "keyboard": 0, "mouse": 240},
+]
+
+
+def test_parse_group_by():
+    assert parse_group_by("User, day") == ("user", "day")
+    with pytest.raises(ValueError, match="Invalid group_by"):
+        parse_group_by("user,color")
+
+
+def test_accumulator_totals_and_percentiles():
+    acc = Accumulator()
+    for record in ACTIVITIES[:2]:
+        acc.add(record)
+    assert acc.records == 2 and acc.tracked == 1200
+    assert acc.activity() == 75
+    assert acc.activity("keyboard") == 35
+    assert acc.percentile(50) == 50 and acc.percentile(90) == 100
+
+
+def test_accumulator_ignores_activity_when_missing():
+    acc = Accumulator()
+    acc.add({"tracked": 3600, "date": "2025-01-01"})
+    assert acc.tracked == 3600 and acc.activity() is None and acc.percentile(50) is None
+
+
+def test_activity_average_ignores_time_without_activity():
+    acc = Accumulator()
+    acc.add(ACTIVITIES[0])
+    acc.add({"tracked": 3600, "date": "2025-01-01"})
+    assert acc.tracked == 4200
+    assert acc.activity() == 50 and acc.activity("mouse") == 40
+
+
+def test_grouping_by_user_and_week():
+    aggregator = TimeAggregator(("user", "week"))
+    aggregator.add_all(ACTIVITIES)
+    assert set(aggregator.groups) == {(1, "2025-W02"), (2, "2025-W03")}
+    assert aggregator.total().tracked == 3000
+
+
+def test_table_truncates_rows_but_keeps_total():
+    aggregator = TimeAggregator(("user",))
+    aggregator.add_all(ACTIVITIES)
+    table = format_summary_table(aggregator, max_rows=1)
+    lines = table.splitlines()
+    assert [cell.strip() for cell in lines[0].split("|")][:3] == ["user", "hours", "records"]
+    assert lines[2].startswith("2 ")  # user 2 tracked the most time
+    assert "1 more groups" in table
+    assert lines[-1].startswith("TOTAL") and "0.83" in lines[-1]
+
+
+@pytest.mark.asyncio
+async def test_summarize_time_tool_streams_activities(mock_hubstaff_client):
+    async def fake_iter(*args, **kwargs):
+        for record in ACTIVITIES:
+            yield record
+    
+    with patch.object(server, "hubstaff_client", mock_hubstaff_client), \
+            patch.object(mock_hubstaff_client, "iter_activities", side_effect=fake_iter):
+        result = await server.summarize_time("2025-01-01", "2025-01-31", group_by="project")
+    
+    assert result.startswith("Time summary 2025-01-01 to 2025-01-31 (activities, by project):")
+    assert "TOTAL" in result
+    assert len(result) < 1000
+
+
+@pytest.mark.asyncio
+async def test_summarize_time_tool_rejects_bad_source(mock_hubstaff_client):
+    with patch.object(server, "hubstaff_client", mock_hubstaff_client):
+        result = await server.summarize_time("2025-01-01", "2025-01-31", source="payroll")
+    assert "unknown source" in result
@@ -0,0 +1,74 @@
+"""Tests for bulk time-entry operations."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from hubstaff_mcp import server
+from hubstaff_mcp.client import HubstaffAPIError
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_runs_concurrently_under_limit(mock_hubstaff_client):
+    """Items run concurrently, capped by the limit, with per-item reports in order."""
+    in_flight = 0
+    peak = 0
+    
+    async def fake_create(entry):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if entry["project_id"] == 3:
+            raise HubstaffAPIError("HTTP 422: invalid project")
+        return {"id": entry["project_id"] * 100}
+    
+    entries = [{"project_id": n, "starts_at": "2025-01-01T09:00:00"} for n in range(1, 11)]
+    with patch.object(mock_hubstaff_client, "create_time_entry", side_effect=fake_create):
+        reports = await mock_hubstaff_client.bulk_create_time_entries(entries, concurrency=4)
+    
+    assert peak == 4
+    assert [report["index"] for report in reports] == list(range(10))
+    assert reports[0] == {"index": 0, "ok": True, "result": {"id": 100}}
+    assert reports[2] == {"index": 2, "ok": False, "error": "HTTP 422: invalid project"}
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_splits_id_from_fields(mock_hubstaff_client):
+    with patch.object(mock_hubstaff_client, "update_time_entry", new_callable=AsyncMock) as update:
+        update.return_value = {"id": 7}
+        await mock_hubstaff_client.bulk_update_time_entries([{"id": 7, "task_id": 2}])
+    update.assert_called_once_with(7, {"task_id": 2})
+
+
+@pytest.mark.asyncio
+async def test_bulk_delete_tool_reports_compactly(mock_hubstaff_client):
+    async def fake_delete(entry_id):
+        if entry_id == 2:
+            raise HubstaffAPIError("HTTP 404: not found")
+    
+    with patch.object(server, "hubstaff_client", mock_hubstaff_client), \
+            patch.object(mock_hubstaff_client, "delete_time_entry", side_effect=fake_delete):
+        result = await server.bulk_delete_time_entries("1, 2, 3")
+    
+    assert result == (
+        "Bulk delete: 2 succeeded, 1 failed (3 total)\n"
+        "Succeeded IDs: 1, 3\n"
+        "Failed:\n"
+        "- item 1 (ID 2): HTTP 404: not found"
+    )
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_tool_validates_before_sending(mock_hubstaff_client):
+    with patch.object(server, "hubstaff_client", mock_hubstaff_client), \
+            patch.object(mock_hubstaff_client, "create_time_entry", new_callable=AsyncMock) as create:
+        result = await server.bulk_create_time_entries([
+            {"project_id": 1, "starts_at": "2025-01-01T09:00:00"},
+            {"project_id": 2},
+        ])
+    
+    assert "item 1 needs both project_id and starts_at" in result
+    create.assert_not_called()
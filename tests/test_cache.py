@@ -0,0 +1,293 @@
+"""Tests for the response cache and its integration with HubstaffClient."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from hubstaff_mcp.cache import (
+    DEFAULT_CACHE_POLICIES,
+    DEFAULT_INVALIDATIONS,
+    CachePolicy,
+    ResponseCache,
+    SingleFlight,
+    cache_key,
+    request_key,
+)
+from hubstaff_mcp.client import HubstaffAPIError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+POLICY = CachePolicy(r"/projects", ttl=10, tag="projects")
+
+
+def test_cache_key_ignores_param_order():
+    assert cache_key("/users", {"b": 2, "a": 1}) == cache_key("/users", {"a": 1, "b": 2})
+    assert cache_key("/users") == "/users"
+
+
+def test_entries_expire_after_ttl():
+    clock = FakeClock()
+    cache = ResponseCache(policies=[POLICY], clock=clock)
+    cache.set("/projects", {"projects": []}, POLICY, size=10)
+    
+    clock.now = 9.9
+    assert cache.get("/projects") == {"projects": []}
+    clock.now = 10.0
+    assert cache.get("/projects") is None
+    assert cache.stats()["entries"] == 0
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 1
+
+
+def test_lru_eviction_by_count_and_bytes():
+    cache = ResponseCache(policies=[POLICY], max_entries=2, max_bytes=100)
+    cache.set("a", 1, POLICY, size=10)
+    cache.set("b", 2, POLICY, size=10)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3, POLICY, size=10)
+    assert cache.get("b") is None and cache.get("a") == 1
+    
+    cache.set("d", 4, POLICY, size=95)
+    assert len(cache) == 1 and cache.total_bytes == 95
+    cache.set("huge", 5, POLICY, size=101)
+    assert cache.get("huge") is None
+
+
+def test_invalidation_discards_in_flight_fill():
+    cache = ResponseCache(policies=[POLICY])
+    generation = cache.generation("projects")
+    cache.invalidate("projects")
+    cache.set("/projects", {}, POLICY, size=1, generation=generation)
+    assert cache.get("/projects") is None
+
+
+def test_default_invalidations_evict_cached_reads():
+    tags = {policy.tag for policy in DEFAULT_CACHE_POLICIES}
+    assert all(set(invalidated) <= tags for _, invalidated in DEFAULT_INVALIDATIONS)
+    
+    cache = ResponseCache()
+    policy = cache.policy_for("/projects/5/tasks")
+    cache.set("/projects/5/tasks", {"tasks": []}, policy, size=1)
+    cache.invalidate_for_mutation("/time_entries/3")
+    assert cache.get("/projects/5/tasks") == {"tasks": []}
+    cache.invalidate_for_mutation("/tasks/3")
+    assert cache.get("/projects/5/tasks") is None
+
+
+@pytest.mark.asyncio
+async def test_single_flight_shares_one_call():
+    flight = SingleFlight()
+    calls = 0
+    
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return calls
+    
+    results = await asyncio.gather(*(flight.do("k", fetch) for _ in range(10)))
+    assert results == [1] * 10
+    assert calls == 1 and flight.deduplicated == 9
+
+
+@pytest.mark.asyncio
+async def test_client_caches_reference_data_and_invalidates_on_write(make_client):
+    paths = []
+    
+    def handler(request):
+        paths.append((request.method, request.url.path))
+        if request.method == "POST":
+            return httpx.Response(201, json={"task": {"id": 2}})
+        return httpx.Response(200, json={"tasks": [{"id": 1}]})
+    
+    client = make_client(handler)
+    assert await client.get_tasks(5) == [{"id": 1}]
+    assert await client.get_tasks(5) == [{"id": 1}]
+    assert paths == [("GET", "/v2/projects/5/tasks")]
+    
+    await client.create_task({"project_id": 5, "summary": "x"})
+    await client.get_tasks(5)
+    assert paths[-2:] == [("POST", "/v2/tasks"), ("GET", "/v2/projects/5/tasks")]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_uncoalesced_reads_do_not_invalidate(make_client):
+    paths = []
+    
+    def handler(request):
+        paths.append(request.url.path)
+        return httpx.Response(200, json={"tasks": [{"id": 1}], "task": {"id": 1}})
+    
+    client = make_client(handler, coalesce_requests=False)
+    await client.get_tasks(5)
+    await client._make_request("GET", "/tasks/1")
+    await client.get_tasks(5)
+    assert paths == ["/v2/projects/5/tasks", "/v2/tasks/1"]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_client_coalesces_concurrent_misses_and_skips_uncached(make_client):
+    calls = []
+    
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"users": [], "time_entries": []})
+    
+    client = make_client(handler)
+    await asyncio.gather(*(client.get_users(organization_id=1) for _ in range(20)))
+    assert calls == ["/v2/users"]
+    
+    await client.get_time_entries()
+    await client.get_time_entries()
+    assert calls.count("/v2/time_entries") == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cache_can_be_disabled(make_client):
+    calls = []
+    
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"organizations": []})
+    
+    client = make_client(handler, cache_enabled=False)
+    await client.get_organizations()
+    await client.get_organizations()
+    assert len(calls) == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_revalidate_with_etag(make_client):
+    """An expired entry is refetched with If-None-Match and reused on 304."""
+    clock = FakeClock()
+    seen_headers = []
+    
+    def handler(request):
+        seen_headers.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"projects": [{"id": 7}]}, headers={"ETag": '"v1"'})
+    
+    client = make_client(handler)
+    client.response_cache.clock = clock
+    first = await client.get_projects()
+    
+    clock.now = 601  # past the 600s projects TTL
+    second = await client.get_projects()
+    third = await client.get_projects()  # fresh again after the 304
+    
+    assert first == second == third == [{"id": 7}]
+    assert seen_headers == [None, '"v1"']
+    assert client.response_cache.stats()["revalidations"] == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_expired_entries_revalidate_with_last_modified(make_client):
+    """Last-Modified is echoed as If-Modified-Since; a 200 replaces the body."""
+    clock = FakeClock()
+    seen_headers = []
+    stamp = "Wed, 01 Jan 2025 00:00:00 GMT"
+    
+    def handler(request):
+        seen_headers.append(request.headers.get("If-Modified-Since"))
+        count = len(seen_headers)
+        return httpx.Response(
+            200, json={"users": [{"id": count}]}, headers={"Last-Modified": stamp}
+        )
+    
+    client = make_client(handler)
+    client.response_cache.clock = clock
+    assert await client.get_users() == [{"id": 1}]
+    clock.now = 601
+    assert await client.get_users() == [{"id": 2}]
+    assert seen_headers == [None, stamp]
+    await client.aclose()
+
+
+def test_expired_entries_without_validators_are_dropped():
+    clock = FakeClock()
+    cache = ResponseCache(policies=[POLICY], clock=clock)
+    cache.set("plain", 1, POLICY, size=1)
+    cache.set("tagged", 2, POLICY, size=1, etag='"x"')
+    clock.now = 11
+    
+    assert cache.get("plain") is None and cache.get("tagged") is None
+    assert cache.get_stale("plain") is None
+    assert cache.get_stale("tagged").conditional_headers() == {"If-None-Match": '"x"'}
+
+
+def test_request_key_normalizes_params():
+    assert request_key("get", "/x", {"b": 1, "a": None, "c": "2"}) == request_key(
+        "GET", "/x", {"c": 2, "b": "1"}
+    )
+    assert request_key("GET", "/x", {"a": None}) == "GET /x"
+    assert request_key("GET", "/x") != request_key("DELETE", "/x")
+
+
+@pytest.mark.asyncio
+async def test_identical_concurrent_gets_are_coalesced(make_client):
+    requests = []
+    
+    async def handler(request):
+        requests.append(str(request.url))
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"time_entries": [{"id": 1}]})
+    
+    client = make_client(handler)
+    same = [client.get_time_entries(organization_id=7, concurrency=1) for _ in range(20)]
+    other = client.get_time_entries(organization_id=8, concurrency=1)
+    results = await asyncio.gather(*same, other)
+    await client.aclose()
+    
+    assert all(result == [{"id": 1}] for result in results)
+    assert len(requests) == 2
+    assert client.stats()["coalescing"] == {"calls": 2, "deduplicated": 19, "inflight": 0}
+
+
+@pytest.mark.asyncio
+async def test_coalesced_failure_reaches_every_caller_and_is_not_reused(make_client):
+    calls = 0
+    
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(404 if calls == 1 else 200, json={"time_entries": []})
+    
+    client = make_client(handler)
+    results = await asyncio.gather(
+        *(client.get_time_entries(concurrency=1) for _ in range(5)), return_exceptions=True
+    )
+    assert all(isinstance(result, HubstaffAPIError) for result in results)
+    assert await client.get_time_entries(concurrency=1) == []
+    assert calls == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_writes_are_never_coalesced(make_client):
+    calls = 0
+    
+    async def handler(request):
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"time_entry": {"id": calls}})
+    
+    client = make_client(handler)
+    await asyncio.gather(*(client.update_time_entry(1, {"task_id": 2}) for _ in range(3)))
+    await client.aclose()
+    assert calls == 3
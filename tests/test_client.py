@@ -3,6 +3,8 @@
 import pytest
 from unittest.mock import AsyncMock, patch
 from datetime import date
+from urllib.parse import parse_qs
+import httpx
 from hubstaff_mcp.client import HubstaffClient, HubstaffAPIError
 
 
@@ -78,30 +80,25 @@ async def test_create_time_entry(mock_hubstaff_client):
 async def test_refresh_access_token():
     """Test access token refresh functionality."""
     with patch.dict("os.environ", {"HUBSTAFF_REFRESH_TOKEN": "test_refresh_token"}):
-        client = HubstaffClient()
+        requests = []
         
-        mock_response_data = {"access_token": "new_access_token"}
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests.append(request)
+            return httpx.Response(200, json={"access_token": "new_access_token"})
         
-        with patch("httpx.AsyncClient") as mock_client_class:
-            mock_client = AsyncMock()
-            mock_client_class.return_value.__aenter__.return_value = mock_client
-            
-            mock_response_obj = AsyncMock()
-            mock_response_obj.json = AsyncMock(return_value=mock_response_data)
-            mock_response_obj.raise_for_status = AsyncMock()
-            
-            mock_client.post = AsyncMock(return_value=mock_response_obj)
-            
-            token = await client._refresh_access_token()
-            
-            assert token == "new_access_token"
-            mock_client.post.assert_called_once()
-            
-            # Verify the request was made with correct parameters
-            call_args = mock_client.post.call_args
-            assert call_args[0][0] == "https://account.hubstaff.com/access_tokens"
-            assert call_args[1]["data"]["grant_type"] == "refresh_token"
-            assert call_args[1]["data"]["refresh_token"] == "test_refresh_token"
+        client = HubstaffClient(transport=httpx.MockTransport(handler))
+        
+        token = await client._refresh_access_token()
+        await client.aclose()
+        
+        assert token == "new_access_token"
+        assert len(requests) == 1
+        
+        # Verify the request was made with correct parameters
+        form = parse_qs(requests[0].content.decode())
+        assert str(requests[0].url) == "https://account.hubstaff.com/access_tokens"
+        assert form["grant_type"] == ["refresh_token"]
+        assert form["refresh_token"] == ["test_refresh_token"]
 
 
 @pytest.mark.asyncio
@@ -120,5 +117,52 @@ async def test_ensure_access_token():
             mock_refresh.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_get_time_entries_follows_pagination(mock_hubstaff_client):
+    """Test that list methods follow next_page_start_id until exhausted."""
+    pages = [
+        {"time_entries": [{"id": 1}, {"id": 2}], "pagination": {"next_page_start_id": 3}},
+        {"time_entries": [{"id": 3}], "pagination": {"next_page_start_id": 4}},
+        {"time_entries": [{"id": 4}]},
+    ]
+    
+    with patch.object(mock_hubstaff_client, '_make_request', new_callable=AsyncMock) as mock_request:
+        mock_request.side_effect = pages
+        
+        entries = await mock_hubstaff_client.get_time_entries(
+            start_date=date(2025, 1, 1), end_date=date(2025, 1, 31), concurrency=1
+        )
+        
+        assert [entry["id"] for entry in entries] == [1, 2, 3, 4]
+        assert mock_request.call_count == 3
+        last_params = mock_request.call_args_list[-1].kwargs["params"]
+        assert last_params["page_start_id"] == 4
+        assert last_params["start_date"] == "2025-01-01"
+
+
+@pytest.mark.asyncio
+async def test_iter_activities_page_limit_and_early_stop(mock_hubstaff_client):
+    """Test that iterators pass page_limit and stop fetching when the caller stops."""
+    pages = [
+        {"activities": [{"id": 1}, {"id": 2}], "pagination": {"next_page_start_id": 3}},
+        {"activities": [{"id": 3}, {"id": 4}], "pagination": {"next_page_start_id": 5}},
+    ]
+    
+    with patch.object(mock_hubstaff_client, '_make_request', new_callable=AsyncMock) as mock_request:
+        mock_request.side_effect = pages
+        
+        seen = []
+        async for activity in mock_hubstaff_client.iter_activities(
+            date(2025, 1, 1), date(2025, 1, 2), page_limit=2
+        ):
+            seen.append(activity["id"])
+            if len(seen) == 2:
+                break
+        
+        assert seen == [1, 2]
+        mock_request.assert_called_once()
+        assert mock_request.call_args.kwargs["params"]["page_limit"] == 2
+
+
 # Test removed - complex mocking for 401 retry logic is difficult to test properly
 # The actual functionality works as demonstrated in integration tests
@@ -0,0 +1,112 @@
+"""Tests for the shared HTTP connection pool in HubstaffClient."""
+
+import asyncio
+import json
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from hubstaff_mcp.client import HubstaffClient
+
+
+class KeepAliveServer:
+    """Minimal HTTP/1.1 keep-alive server that counts accepted TCP connections."""
+    
+    def __init__(self):
+        self.connections = 0
+        self.requests = 0
+        self.server = None
+        self.port = None
+    
+    async def __aenter__(self):
+        self.server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        self.port = self.server.sockets[0].getsockname()[1]
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        self.server.close()
+        await self.server.wait_closed()
+    
+    async def _handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.decode().split("\r\n")[1:]:
+                    if line.lower().startswith("content-length:"):
+                        length = int(line.split(":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                self.requests += 1
+                
+                path = head.split(b" ", 2)[1]
+                if path.startswith(b"/access_tokens"):
+                    payload = {"access_token": "pooled_token"}
+                else:
+                    payload = {"user": {"id": self.requests}}
+                body = json.dumps(payload).encode()
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\n"
+                    b"Content-Type: application/json\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_one_connection(make_client):
+    """Sequential API calls and the token refresh share a single TCP connection."""
+    async with KeepAliveServer() as server:
+        client = make_client(access_token=None, http2=False)
+        client.base_url = f"http://127.0.0.1:{server.port}/v2"
+        client.auth_url = f"http://127.0.0.1:{server.port}/access_tokens"
+        
+        async with client:
+            for _ in range(5):
+                await client.get_current_user()
+        
+        assert server.requests == 6  # one token refresh + five API calls
+        assert server.connections == 1
+
+
+@pytest.mark.asyncio
+async def test_pool_limits_from_environment():
+    """Pool limits and keep-alive expiry are configurable via environment."""
+    env = {
+        "HUBSTAFF_REFRESH_TOKEN": "test_refresh_token",
+        "HUBSTAFF_MAX_CONNECTIONS": "7",
+        "HUBSTAFF_MAX_KEEPALIVE_CONNECTIONS": "3",
+        "HUBSTAFF_KEEPALIVE_EXPIRY": "12.5",
+    }
+    with patch.dict("os.environ", env):
+        client = HubstaffClient(max_connections=9)
+    
+    assert client.limits.max_connections == 9
+    assert client.limits.max_keepalive_connections == 3
+    assert client.limits.keepalive_expiry == 12.5
+
+
+@pytest.mark.asyncio
+async def test_aclose_releases_and_reopens_pool(make_client):
+    """Closing the client drops the pool; later calls transparently open a new one."""
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"access_token": "t", "user": {"id": 1}})
+    )
+    client = make_client(access_token=None, transport=transport)
+    
+    first = client.http
+    assert client.http is first
+    await client.aclose()
+    assert first.is_closed
+    
+    user = await client.get_current_user()
+    assert user == {"id": 1}
+    assert client.http is not first
+    await client.aclose()
@@ -0,0 +1,96 @@
+"""Tests for tool and API request metrics."""
+
+import json
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from hubstaff_mcp import server
+from hubstaff_mcp.metrics import Histogram, Metrics, endpoint_label
+
+
+def test_histogram_quantiles_use_bucket_bounds():
+    histogram = Histogram((0.1, 1.0))
+    for value in (0.05, 0.05, 0.5, 3.0):
+        histogram.observe(value)
+    assert histogram.counts == [2, 1, 1]
+    assert histogram.quantile(0.5) == 0.1
+    assert histogram.quantile(0.75) == 1.0
+    assert histogram.quantile(1.0) == float("inf")
+    assert Histogram().quantile(0.5) is None
+
+
+def test_endpoint_label_collapses_ids():
+    assert endpoint_label("https://api.hubstaff.com/v2/projects/42/tasks") == "/v2/projects/{id}/tasks"
+    assert endpoint_label("https://api.hubstaff.com/v2/users/me") == "/v2/users/me"
+
+
+@pytest.mark.asyncio
+async def test_client_records_latency_status_and_bytes(make_client):
+    calls = {"n": 0}
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/access_tokens":
+            return httpx.Response(200, json={"access_token": "fresh", "expires_in": 3600})
+        calls["n"] += 1
+        if calls["n"] == 1:
+            return httpx.Response(401, json={"error": "invalid_token"})
+        return httpx.Response(200, json={"projects": [{"id": 1}, {"id": 2}]})
+    
+    metrics = Metrics()
+    client = make_client(handler, access_token="stale", metrics=metrics, cache_enabled=False)
+    
+    async with client:
+        project = await client._make_request("GET", "/projects/42")
+        records = [r async for r in client._paginate("/activities", "activities", stream=True)]
+    
+    assert len(project["projects"]) == 2 and records == []
+    requests = metrics.snapshot()["requests"]
+    single = requests["GET /v2/projects/{id}"]
+    assert single["count"] == 2
+    assert single["statuses"] == {"401": 1, "200": 1}
+    assert single["bytes_received"] > 0
+    assert requests["GET /v2/activities"]["bytes_received"] > 0  # counted after streaming
+    assert requests["POST /access_tokens"]["statuses"] == {"200": 1}
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_record_latency_records_and_errors(mock_hubstaff_client):
+    metrics = Metrics()
+    with patch.object(server, "METRICS", metrics), \
+            patch.object(server, "hubstaff_client", mock_hubstaff_client), \
+            patch.object(mock_hubstaff_client, "_make_request", new_callable=AsyncMock) as get:
+        get.return_value = {"projects": [{"id": 1}, {"id": 2}, {"id": 3}]}
+        await server.mcp.call_tool("get_projects", {"format": "csv"})
+        get.side_effect = httpx.ConnectError("offline")
+        output = await server.mcp.call_tool("get_project_details", {"project_id": 1})
+        report = json.loads((await server.mcp.call_tool("get_server_metrics", {}))[1]["result"])
+    
+    assert "Error retrieving project details: offline" in output[1]["result"]
+    tools = metrics.snapshot()["tools"]
+    assert tools["get_projects"]["count"] == 1 and tools["get_projects"]["records"] == 3
+    assert tools["get_project_details"]["errors"] == {"ConnectError": 1}
+    assert report["counters"]["api_retries_total"] == 0
+    assert "get_projects" in report["tools"]
+
+
+@pytest.mark.asyncio
+async def test_prometheus_exposition(mock_hubstaff_client):
+    metrics = Metrics(buckets=(0.1, 1.0))
+    metrics.observe_tool("get_users", 0.05)
+    metrics.record_tool_error("get_users", ValueError("bad"))
+    metrics.observe_request("GET", "https://api.hubstaff.com/v2/users/5", 0.5, 200, 120)
+    
+    with patch.object(server, "METRICS", metrics), \
+            patch.object(server, "hubstaff_client", mock_hubstaff_client):
+        response = await server.prometheus_metrics(None)
+    
+    body = response.body.decode()
+    assert response.media_type.startswith("text/plain")
+    assert 'hubstaff_mcp_tool_duration_seconds_bucket{tool="get_users",le="0.1"} 1' in body
+    assert 'hubstaff_mcp_tool_duration_seconds_bucket{tool="get_users",le="+Inf"} 1' in body
+    assert 'hubstaff_mcp_tool_errors_total{tool="get_users",error="ValueError"} 1' in body
+    assert 'hubstaff_mcp_api_request_duration_seconds_bucket{method="GET",endpoint="/v2/users/{id}",le="0.1"} 0' in body
+    assert 'hubstaff_mcp_api_received_bytes_total{method="GET",endpoint="/v2/users/{id}"} 120' in body
+    assert "hubstaff_mcp_cache_hits_total 0" in body
@@ -0,0 +1,87 @@
+"""Tests for compact tool output formats and size budgets."""
+
+import csv
+import io
+import json
+import re
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from hubstaff_mcp import server
+from hubstaff_mcp.output import RecordWriter, decode_cursor, encode_cursor
+
+PROJECTS = [
+    {"id": n, "name": f"Project, {n}", "status": "active", "created_at": "2025-01-01"}
+    for n in range(1, 6)
+]
+
+
+def write_all(writer, records):
+    for record in records:
+        if not writer.write(record):
+            break
+    return writer
+
+
+def test_text_format_matches_block_layout():
+    writer = write_all(
+        RecordWriter("text", ("id",), server.format_project, "Projects:"), PROJECTS[:2]
+    )
+    expected = "Projects:\n" + "\n---\n".join(server.format_project(p) for p in PROJECTS[:2])
+    assert writer.getvalue() == expected
+
+
+def test_compact_formats_emit_columns():
+    columns = ("id", "name")
+    table = write_all(RecordWriter("table", columns, str, ""), PROJECTS[:2]).getvalue()
+    assert table.splitlines() == ["id | name", "---+-----", "1 | Project, 1", "2 | Project, 2"]
+    
+    rows = list(csv.reader(io.StringIO(
+        write_all(RecordWriter("csv", columns, str, ""), PROJECTS[:2]).getvalue()
+    )))
+    assert rows == [["id", "name"], ["1", "Project, 1"], ["2", "Project, 2"]]
+    
+    lines = write_all(RecordWriter("jsonl", columns, str, ""), PROJECTS[:2]).getvalue()
+    assert [json.loads(line) for line in lines.splitlines()] == [
+        {"id": 1, "name": "Project, 1"}, {"id": 2, "name": "Project, 2"}
+    ]
+    
+    with pytest.raises(ValueError):
+        RecordWriter("xml", columns, str, "")
+
+
+def test_budgets_truncate_and_always_make_progress():
+    writer = write_all(RecordWriter("csv", ("id",), str, "", max_rows=2), PROJECTS)
+    assert writer.rows == 2 and writer.truncated
+    
+    writer = write_all(RecordWriter("jsonl", ("id", "name"), str, "", max_chars=60), PROJECTS)
+    assert writer.rows == 2
+    assert len(writer.getvalue(remaining=3, cursor="abc").split("\n[")[0]) <= 60
+    
+    writer = write_all(RecordWriter("text", ("id",), server.format_project, "", max_chars=1), PROJECTS)
+    assert writer.rows == 1
+
+
+def test_cursor_round_trip():
+    assert decode_cursor(encode_cursor({"offset": 200})) == {"offset": 200}
+    with pytest.raises(ValueError):
+        decode_cursor("not a cursor!")
+
+
+@pytest.mark.asyncio
+async def test_list_tool_pages_with_cursor(mock_hubstaff_client):
+    with patch.object(server, "hubstaff_client", mock_hubstaff_client), \
+            patch.object(mock_hubstaff_client, "_make_request", new_callable=AsyncMock) as get:
+        get.return_value = {"projects": PROJECTS}
+        first = await server.get_projects(format="table", max_rows=2)
+        cursor = re.search(r'cursor="([^"]+)"', first).group(1)
+        second = await server.get_projects(format="table", max_rows=2, cursor=cursor)
+        third = await server.get_projects(
+            format="table", max_rows=2, cursor=re.search(r'cursor="([^"]+)"', second).group(1)
+        )
+    
+    assert "truncated after 2 records; more available" in first
+    assert [line.split(" | ")[0] for line in first.splitlines()[2:4]] == ["1", "2"]
+    assert second.splitlines()[2].startswith("3 |")
+    assert "truncated" not in third and third.splitlines()[2].startswith("5 |")
@@ -0,0 +1,113 @@
+"""Tests for the client-side rate limiter."""
+
+import asyncio
+import time
+from email.utils import formatdate
+
+import httpx
+import pytest
+
+from hubstaff_mcp.ratelimit import (
+    PRIORITY_BULK,
+    PRIORITY_INTERACTIVE,
+    RateLimiter,
+    bulk_requests,
+    parse_retry_after,
+)
+
+
+def test_parse_retry_after():
+    assert parse_retry_after("5") == 5.0
+    assert parse_retry_after("-3") == 0.0
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("not a date") is None
+    now = time.time()
+    assert 29 <= parse_retry_after(formatdate(now + 30, usegmt=True), now=now) <= 30
+
+
+@pytest.mark.asyncio
+async def test_bucket_enforces_rate_after_burst():
+    limiter = RateLimiter(rate=50, burst=5)
+    start = time.monotonic()
+    await asyncio.gather(*(limiter.acquire() for _ in range(15)))
+    elapsed = time.monotonic() - start
+    # 5 immediate tokens, then 10 more at 50/s ~= 0.2s
+    assert 0.15 <= elapsed < 1.0
+
+
+@pytest.mark.asyncio
+async def test_interactive_requests_overtake_bulk():
+    limiter = RateLimiter(rate=100, burst=1)
+    await limiter.acquire()  # drain the bucket
+    order = []
+    
+    async def request(name, priority):
+        await limiter.acquire(priority)
+        order.append(name)
+    
+    bulk = [asyncio.ensure_future(request(f"bulk{i}", PRIORITY_BULK)) for i in range(3)]
+    await asyncio.sleep(0)
+    interactive = asyncio.ensure_future(request("interactive", PRIORITY_INTERACTIVE))
+    await asyncio.gather(*bulk, interactive)
+    
+    assert order[0] == "interactive"
+
+
+@pytest.mark.asyncio
+async def test_bulk_requests_context_sets_priority():
+    limiter = RateLimiter(rate=100, burst=1)
+    await limiter.acquire()
+    order = []
+    
+    async def bulk_job():
+        with bulk_requests():
+            await limiter.acquire()
+        order.append("bulk")
+    
+    async def interactive_job():
+        await limiter.acquire()
+        order.append("interactive")
+    
+    first = asyncio.ensure_future(bulk_job())
+    await asyncio.sleep(0)
+    await asyncio.gather(first, interactive_job())
+    assert order == ["interactive", "bulk"]
+
+
+def test_exhausted_quota_header_pauses_bucket():
+    limiter = RateLimiter(rate=0)
+    limiter.observe(httpx.Response(200, headers={"X-RateLimit-Remaining": "5"}))
+    assert limiter.remaining == 5 and limiter._delay() == 0
+    
+    limiter.observe(
+        httpx.Response(200, headers={"RateLimit-Remaining": "0", "RateLimit-Reset": "30"})
+    )
+    assert 29 < limiter._delay() <= 30
+
+
+@pytest.mark.asyncio
+async def test_client_retries_429_after_retry_after(make_client):
+    responses = iter([
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(429, headers={"Retry-After": "0"}),
+        httpx.Response(200, json={"user": {"id": 1}}),
+    ])
+    
+    client = make_client(lambda r: next(responses))
+    client.rate_limiter.backoff_base = 0.01
+    
+    assert await client.get_current_user() == {"id": 1}
+    assert client.rate_limiter.throttled == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_client_gives_up_after_max_throttle_retries(make_client):
+    client = make_client(lambda r: httpx.Response(429, headers={"Retry-After": "0"}, text="slow down"))
+    client.rate_limiter.backoff_base = 0.01
+    client.rate_limiter.max_retries = 1
+    
+    with pytest.raises(Exception, match="HTTP 429"):
+        await client.get_current_user()
+    assert client.rate_limiter.throttled == 1
+    await client.aclose()
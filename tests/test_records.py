@@ -0,0 +1,66 @@
+"""Tests for the columnar record store."""
+
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from hubstaff_mcp.records import ColumnStore
+
+ENTRIES = [
+    {"id": 1, "user_id": 7, "project_id": 3, "task_id": None, "starts_at": "2025-01-01T09:00:00Z",
+     "tracked": 3600, "keyboard": 600, "mouse": 1200, "overall": 1800, "status": "approved"},
+    {"id": 2, "user_id": 7, "project_id": 4, "task_id": 9, "starts_at": "2025-01-02T23:30:00Z",
+     "tracked": 1800, "keyboard": 0, "mouse": 900, "overall": 900, "status": "approved"},
+    {"id": 3, "user_id": 8, "project_id": 3, "starts_at": "2025-01-02T08:00:00+00:00",
+     "tracked": 600},
+]
+
+
+def test_roundtrip_materializes_records():
+    store = ColumnStore(string_fields=("status",)).extend(ENTRIES)
+    assert len(store) == 3
+    assert store.record(0) == {
+        "id": 1, "user_id": 7, "project_id": 3, "task_id": None,
+        "tracked": 3600, "keyboard": 600, "mouse": 1200, "overall": 1800,
+        "starts_at": "2025-01-01T09:00:00Z", "status": "approved",
+    }
+    assert store.record(2)["starts_at"] == "2025-01-02T08:00:00Z"
+    assert store.record(2)["overall"] == 0
+    assert store.strings["status"][0] is store.strings["status"][1]
+
+
+def test_group_sum_by_ids_and_day():
+    store = ColumnStore().extend(ENTRIES)
+    assert store.sum("tracked") == 6000
+    
+    by_user = store.group_sum(["user_id"], fields=["tracked", "overall"])
+    assert by_user == {
+        (7,): {"tracked": 5400, "overall": 2700, "records": 2},
+        (8,): {"tracked": 600, "overall": 0, "records": 1},
+    }
+    
+    by_day_task = store.group_sum(["day", "task_id"], fields=["tracked"])
+    assert by_day_task[("2025-01-01", None)]["tracked"] == 3600
+    assert by_day_task[("2025-01-02", 9)]["tracked"] == 1800
+    
+    with pytest.raises(ValueError):
+        store.group_sum(["tracked"])
+
+
+def test_store_is_smaller_than_dicts():
+    records = [dict(ENTRIES[0], id=i) for i in range(2000)]
+    store = ColumnStore().extend(records)
+    assert store.nbytes() < 2000 * 100
+
+
+@pytest.mark.asyncio
+async def test_client_loads_activities_into_store(mock_hubstaff_client):
+    async def fake_iter(*args, **kwargs):
+        yield {"id": 1, "user_id": 2, "time_slot": "2025-01-01T10:00:00Z", "tracked": 600, "overall": 300}
+    
+    with patch.object(mock_hubstaff_client, "iter_activities", side_effect=fake_iter):
+        store = await mock_hubstaff_client.load_activities(date(2025, 1, 1), date(2025, 1, 1))
+    
+    assert store.time_field == "time_slot"
+    assert store.group_sum(["user_id"], fields=["overall"]) == {(2,): {"overall": 300, "records": 1}}
@@ -0,0 +1,212 @@
+"""Tests for the retry policy and its use in HubstaffClient."""
+
+import functools
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from hubstaff_mcp.client import HubstaffAPIError, HubstaffClient
+from hubstaff_mcp.retry import RetryPolicy
+
+FAST = RetryPolicy(max_attempts=3, backoff_base=0, jitter=False)
+
+
+@pytest.fixture
+def make_client(make_client):
+    return functools.partial(make_client, retry_policy=FAST)
+
+
+def test_policy_classification_and_backoff():
+    policy = RetryPolicy(backoff_base=1, backoff_max=3, jitter=False)
+    assert policy.is_idempotent("put") and not policy.is_idempotent("POST")
+    assert policy.is_retryable(503, None)
+    assert not policy.is_retryable(400, None)
+    assert policy.is_retryable(None, httpx.ConnectError("boom"))
+    assert not policy.is_retryable(None, ValueError("boom"))
+    assert [policy.backoff(n) for n in (1, 2, 3)] == [1, 2, 3]
+
+
+def test_policy_from_env():
+    env = {"HUBSTAFF_RETRY_ATTEMPTS": "5", "HUBSTAFF_RETRY_STATUSES": "502, 503"}
+    with patch.dict("os.environ", env):
+        policy = RetryPolicy.from_env()
+    assert policy.max_attempts == 5
+    assert policy.retry_statuses == frozenset({502, 503})
+
+
+@pytest.mark.asyncio
+async def test_get_retries_transient_errors(make_client):
+    outcomes = [httpx.ConnectError("blip"), httpx.Response(503), None]
+    
+    def handler(request):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome or httpx.Response(200, json={"user": {"id": 1}})
+    
+    client = make_client(handler)
+    assert await client.get_current_user() == {"id": 1}
+    assert client.retry_stats["retries"] == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_retries_are_bounded_and_skip_client_errors(make_client):
+    calls = []
+    
+    def handler(request):
+        calls.append(request.url.path)
+        return httpx.Response(502 if request.url.path.endswith("me") else 404)
+    
+    client = make_client(handler)
+    with pytest.raises(HubstaffAPIError) as error:
+        await client.get_current_user()
+    assert error.value.status_code == 502
+    assert len(calls) == 3 and client.retry_stats["exhausted"] == 1
+    
+    with pytest.raises(HubstaffAPIError):
+        await client.get_project(1)
+    assert len(calls) == 4
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_post_without_key_is_not_retried(make_client):
+    calls = []
+    
+    def handler(request):
+        calls.append(request.method)
+        return httpx.Response(503)
+    
+    client = make_client(handler)
+    with pytest.raises(HubstaffAPIError):
+        await client.create_task({"project_id": 1, "summary": "x"})
+    assert calls == ["POST"]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_post_with_idempotency_key_is_retried_with_header(make_client):
+    keys = []
+    
+    def handler(request):
+        keys.append(request.headers.get("Idempotency-Key"))
+        if len(keys) == 1:
+            return httpx.Response(503)
+        return httpx.Response(201, json={"task": {"id": 9}})
+    
+    client = make_client(handler)
+    task = await client.create_task({"project_id": 1, "summary": "x"}, idempotency_key="abc")
+    assert task == {"id": 9}
+    assert keys == ["abc", "abc"]
+    await client.aclose()
+
+
+def time_entry_api(entries, post):
+    """Handler serving the current user (id 7), ``entries`` and ``post`` for POSTs."""
+    calls = []
+    
+    def handler(request):
+        calls.append(request)
+        if request.url.path == "/v2/users/me":
+            return httpx.Response(200, json={"user": {"id": 7}})
+        if request.method == "GET":
+            return httpx.Response(200, json={"time_entries": entries})
+        return post(request)
+    
+    return handler, calls
+
+
+def timeout(request):
+    raise httpx.ReadTimeout("no response")
+
+
+@pytest.mark.asyncio
+async def test_time_entry_retry_returns_entry_created_by_failed_attempt(make_client):
+    """A POST that timed out after creating the entry is not sent again."""
+    handler, calls = time_entry_api(
+        [{"id": 5, "user_id": 7, "project_id": 1, "starts_at": "2025-01-01T09:00:00Z"}], timeout
+    )
+    client = make_client(handler)
+    entry = await client.create_time_entry({"project_id": 1, "starts_at": "2025-01-01T09:00:00"})
+    assert entry["id"] == 5
+    assert [request.method for request in calls] == ["POST", "GET", "GET"]
+    assert client.retry_stats["deduplicated"] == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_time_entry_dedup_compares_instants_in_utc(make_client):
+    created = [{"id": 5, "user_id": 7, "project_id": 1, "starts_at": "2025-01-01T07:00:00Z"}]
+    handler, calls = time_entry_api(created, lambda request: httpx.Response(502))
+    client = make_client(handler)
+    entry = await client.create_time_entry({"project_id": 1, "starts_at": "2025-01-01T09:00:00+02:00"})
+    assert entry["id"] == 5
+    assert [request.method for request in calls].count("POST") == 1
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_time_entry_dedup_ignores_other_users_entries(make_client):
+    others = [{"id": 8, "user_id": 555, "project_id": 1, "starts_at": "2025-01-01T09:00:00Z"}]
+    posts = []
+    
+    def post(request):
+        posts.append(request)
+        if len(posts) == 1:
+            return httpx.Response(503)
+        return httpx.Response(201, json={"time_entry": {"id": 6}})
+    
+    handler, calls = time_entry_api(others, post)
+    client = make_client(handler)
+    entry = await client.create_time_entry({"project_id": 1, "starts_at": "2025-01-01T09:00:00Z"})
+    assert entry == {"id": 6}
+    assert len(posts) == 2
+    lookup = next(request for request in calls if request.method == "GET" and "user_ids" in request.url.params)
+    assert lookup.url.params["user_ids"] == "7"
+    assert (lookup.url.params["start_date"], lookup.url.params["end_date"]) == ("2024-12-31", "2025-01-02")
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_time_entry_is_not_retried_when_it_cannot_be_matched(make_client):
+    posts = []
+    
+    def handler(request):
+        if request.url.path == "/v2/users/me":
+            return httpx.Response(500)
+        posts.append(request)
+        return httpx.Response(502)
+    
+    client = make_client(handler)
+    with pytest.raises(HubstaffAPIError) as error:
+        await client.create_time_entry({"project_id": 1, "starts_at": "2025-01-01T09:00:00Z"})
+    assert error.value.status_code == 502
+    assert len(posts) == 1
+    
+    with pytest.raises(HubstaffAPIError):
+        await client.create_time_entry({"project_id": 1, "starts_at": "tomorrow"})
+    assert len(posts) == 2
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_time_entry_retry_resends_when_nothing_was_created(make_client):
+    calls = []
+    
+    def handler(request):
+        calls.append(request.method)
+        if request.url.path == "/v2/users/me":
+            return httpx.Response(200, json={"user": {"id": 7}})
+        if request.method == "GET":
+            return httpx.Response(200, json={"time_entries": []})
+        if calls.count("POST") == 1:
+            return httpx.Response(502)
+        return httpx.Response(201, json={"time_entry": {"id": 6}})
+    
+    client = make_client(handler)
+    entry = await client.create_time_entry({"project_id": 1, "starts_at": "2025-01-01T09:00:00"})
+    assert entry == {"id": 6}
+    assert calls == ["POST", "GET", "GET", "POST"]
+    await client.aclose()
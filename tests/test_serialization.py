@@ -0,0 +1,81 @@
+"""Tests for JSON backend selection and record validation."""
+
+import json
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from hubstaff_mcp.client import HubstaffAPIError
+from hubstaff_mcp.models import Activity, TimeEntry, validate_records
+from hubstaff_mcp.serialization import JSON_BACKENDS, backend_available, select_backend
+
+
+@pytest.mark.parametrize("name", [name for name in JSON_BACKENDS if backend_available(name)])
+def test_backends_round_trip(name):
+    backend = select_backend(name)
+    data = {"id": 1, "note": "café", "tracked": 1.5, "task_id": None, "tags": [True]}
+    assert backend.name == name
+    assert backend.loads(backend.dumps(data)) == data
+    assert backend.loads(json.dumps(data)) == data
+    with pytest.raises(ValueError):
+        backend.loads(b"{not json")
+
+
+def test_select_backend_auto_and_errors():
+    expected = next(name for name in JSON_BACKENDS if backend_available(name))
+    with patch.dict("os.environ", {"HUBSTAFF_JSON_BACKEND": "auto"}):
+        assert select_backend().name == expected
+    with patch.dict("os.environ", {"HUBSTAFF_JSON_BACKEND": "json"}):
+        assert select_backend().name == "json"
+    with pytest.raises(ValueError):
+        select_backend("simplejson")
+    with patch("hubstaff_mcp.serialization.backend_available", return_value=False):
+        with pytest.raises(ValueError):
+            select_backend("orjson")
+
+
+def test_validate_records():
+    validate_records([{"id": 1, "tracked": 60, "task_id": None, "extra": "ok"}], TimeEntry)
+    validate_records([{"id": 1}], Activity)  # fields may be omitted
+    with pytest.raises(ValueError, match="tracked"):
+        validate_records([{"id": 1, "tracked": "60"}], TimeEntry)
+    with pytest.raises(ValueError):
+        validate_records(["not a record"], Activity)
+
+
+@pytest.mark.asyncio
+async def test_client_validates_list_responses_when_enabled(make_client):
+    def handler(request):
+        return httpx.Response(200, json={"activities": [{"id": 1, "overall": "high"}]})
+    
+    client = make_client(handler, validate_responses=True)
+    with pytest.raises(HubstaffAPIError, match="overall"):
+        await client.get_activities(date(2025, 1, 1), date(2025, 1, 1))
+    with pytest.raises(HubstaffAPIError, match="overall"):
+        async for _ in client.iter_activities(date(2025, 1, 1), date(2025, 1, 1), stream=True):
+            pass
+    await client.aclose()
+    
+    client = make_client(handler, validate_responses=False)
+    assert await client.get_activities(date(2025, 1, 1), date(2025, 1, 1)) == [
+        {"id": 1, "overall": "high"}
+    ]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_client_encodes_bodies_with_selected_backend(make_client):
+    bodies = []
+    
+    def handler(request):
+        bodies.append(request.content)
+        return httpx.Response(200, json={"time_entry": {"id": 5}})
+    
+    client = make_client(handler, json_backend="json")
+    entry = await client.update_time_entry(5, {"note": "café"})
+    await client.aclose()
+    
+    assert entry == {"id": 5}
+    assert json.loads(bodies[0]) == {"note": "café"}
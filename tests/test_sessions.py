@@ -0,0 +1,207 @@
+"""Tests for server-side result sessions behind list tool cursors."""
+
+import asyncio
+import re
+from unittest.mock import patch
+
+import pytest
+
+from hubstaff_mcp import server
+from hubstaff_mcp.sessions import END, ResultSession, SessionStore
+
+
+def cursor_of(output):
+    return re.search(r'cursor="([^"]+)"', output).group(1)
+
+
+class Pages:
+    """Fake paginated /projects endpoint that counts page fetches."""
+    
+    def __init__(self, pages):
+        self.pages = pages
+        self.fetched = []
+    
+    async def __call__(self, method, endpoint, data=None, params=None):
+        start = (params or {}).get("page_start_id", 0)
+        self.fetched.append(start)
+        index = start // 10
+        response = {"projects": self.pages[index]}
+        if index + 1 < len(self.pages):
+            response["pagination"] = {"next_page_start_id": (index + 1) * 10}
+        return response
+
+
+def project_pages(count, per_page=10):
+    return [
+        [{"id": n, "name": f"P{n}"} for n in range(start, min(count, start + per_page))]
+        for start in range(0, count, per_page)
+    ]
+
+
+@pytest.fixture
+def sessions():
+    store = SessionStore(idle_timeout=60)
+    with patch.object(server, "result_sessions", store):
+        yield store
+
+
+@pytest.mark.asyncio
+async def test_cursor_resumes_live_iterator_without_refetching(mock_hubstaff_client, sessions):
+    pages = Pages(project_pages(25))
+    with patch.object(server, "hubstaff_client", mock_hubstaff_client), \
+            patch.object(mock_hubstaff_client, "_make_request", new=pages):
+        first = await server.get_projects(format="csv", max_rows=8)
+        assert pages.fetched == [0]
+        assert len(sessions) == 1
+        
+        second = await server.get_projects(format="csv", max_rows=8, cursor=cursor_of(first))
+        third = await server.get_projects(format="csv", max_rows=20, cursor=cursor_of(second))
+    
+    ids = [
+        int(line.split(",")[0])
+        for output in (first, second, third)
+        for line in output.splitlines()[1:]
+        if line[0].isdigit()
+    ]
+    assert ids == list(range(25))
+    assert pages.fetched == [0, 10, 20]  # every page fetched exactly once
+    assert "truncated" not in third
+    assert len(sessions) == 0
+
+
+@pytest.mark.asyncio
+async def test_expired_session_falls_back_to_requery(mock_hubstaff_client, sessions):
+    pages = Pages(project_pages(12))
+    with patch.object(server, "hubstaff_client", mock_hubstaff_client), \
+            patch.object(mock_hubstaff_client, "_make_request", new=pages):
+        first = await server.get_projects(format="csv", max_rows=5)
+        await sessions.aclose()
+        second = await server.get_projects(format="csv", max_rows=5, cursor=cursor_of(first))
+    
+    assert second.splitlines()[1].startswith("5,")
+    assert pages.fetched == [0, 0, 10]  # page 0 is fetched again to skip ahead
+
+
+@pytest.mark.asyncio
+async def test_cursor_is_not_shared_between_tools(mock_hubstaff_client, sessions):
+    pages = Pages(project_pages(12))
+    with patch.object(server, "hubstaff_client", mock_hubstaff_client), \
+            patch.object(mock_hubstaff_client, "_make_request", new=pages):
+        await server.get_projects(format="csv", max_rows=5)
+        session_id, session = next(iter(sessions._sessions.items()))
+        assert await sessions.get(session_id, "get_users", None, session.query) is None
+        assert await sessions.get(session_id, "get_projects", None, session.query) is not None
+
+
+@pytest.mark.asyncio
+async def test_cursor_is_rejected_by_a_call_with_other_arguments(mock_hubstaff_client, sessions):
+    pages = Pages(project_pages(12))
+    with patch.object(server, "hubstaff_client", mock_hubstaff_client), \
+            patch.object(mock_hubstaff_client, "_make_request", new=pages):
+        first = await server.get_projects(organization_id=1, format="csv", max_rows=5)
+        cursor = cursor_of(first)
+        other_org = await server.get_projects(organization_id=2, format="csv", cursor=cursor)
+        other_format = await server.get_projects(organization_id=1, format="jsonl", cursor=cursor)
+        await sessions.aclose()
+        expired = await server.get_projects(organization_id=2, format="csv", cursor=cursor)
+        resumed = await server.get_projects(organization_id=1, format="csv", cursor=cursor)
+    
+    for output in (other_org, other_format, expired):
+        assert output.startswith("Error retrieving projects: This cursor was returned for different arguments")
+    assert resumed.splitlines()[1].startswith("5,")
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_with_one_cursor_both_get_its_records(mock_hubstaff_client, sessions):
+    pages = Pages(project_pages(12))
+    
+    async def slow_pages(*args, **kwargs):
+        await asyncio.sleep(0.01)
+        return await pages(*args, **kwargs)
+    
+    with patch.object(server, "hubstaff_client", mock_hubstaff_client), \
+            patch.object(mock_hubstaff_client, "_make_request", new=slow_pages):
+        first = await server.get_projects(format="csv", max_rows=5)
+        cursor = cursor_of(first)
+        outputs = await asyncio.gather(*(
+            server.get_projects(format="csv", max_rows=20, cursor=cursor) for _ in range(2)
+        ))
+    
+    for output in outputs:
+        assert [line.split(",")[0] for line in output.splitlines()[1:]] == [str(n) for n in range(5, 12)]
+    # The second call reruns the query once the first has finished the session
+    assert pages.fetched == [0, 10, 0, 10]
+    assert len(sessions) == 0
+
+
+@pytest.mark.asyncio
+async def test_store_expires_idle_and_evicts_over_caps():
+    now = [0.0]
+    store = SessionStore(idle_timeout=10, max_sessions=2, max_bytes=10**9, clock=lambda: now[0])
+    
+    first, second, third = (ResultSession("t", [{"id": n}]) for n in range(3))
+    await store.add(first)
+    await store.add(second)
+    await store.add(third)
+    assert first.id not in store and len(store) == 2
+    assert store.evicted == 1
+    
+    now[0] = 11
+    assert await store.get(second.id, "t") is None
+    assert len(store) == 0 and store.expired == 2
+    
+    small = SessionStore(max_bytes=1)
+    big = ResultSession("t", [{"id": n, "name": "x" * 100} for n in range(100)])
+    await small.add(big)
+    assert big.id in small  # the newest session is always kept
+    await small.add(ResultSession("t", [{"id": 1}]))
+    assert big.id not in small
+
+
+@pytest.mark.asyncio
+async def test_buffered_iterator_records_count_against_the_byte_cap():
+    class Prefetching:
+        def __init__(self):
+            self.ahead = [{"id": n, "name": "x" * 100} for n in range(100)]
+        
+        def __aiter__(self):
+            return self
+        
+        async def __anext__(self):
+            if not self.ahead:
+                raise StopAsyncIteration
+            return self.ahead.pop(0)
+        
+        def buffered(self):
+            return list(self.ahead)
+    
+    store = SessionStore(max_bytes=20000)
+    live = ResultSession("t", Prefetching())
+    assert live.size > 20000
+    await store.add(live)
+    await store.add(ResultSession("t", [{"id": 1}]))
+    assert live.id not in store and live.closed
+    
+    reading = ResultSession("t", Prefetching())
+    await store.add(reading)
+    for _ in range(90):
+        await reading.next()
+    assert reading.size < 20000
+    await store.add(ResultSession("t", [{"id": 1}]))
+    assert reading.id in store
+
+
+@pytest.mark.asyncio
+async def test_session_push_back_and_skip():
+    async def numbers():
+        for n in range(5):
+            yield {"id": n}
+    
+    session = ResultSession("t", numbers())
+    await session.skip(2)
+    record = await session.next()
+    assert record == {"id": 2}
+    session.push_back(record)
+    assert session.offset == 2
+    assert [await session.next() for _ in range(4)] == [{"id": 2}, {"id": 3}, {"id": 4}, END]
+    await session.aclose()
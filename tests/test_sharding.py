@@ -0,0 +1,109 @@
+"""Tests for concurrent date-range sharding in HubstaffClient."""
+
+import asyncio
+from datetime import date
+from unittest.mock import patch
+
+import pytest
+
+from hubstaff_mcp.client import ShardedRecords, date_shards
+
+
+def test_date_shards_cover_range():
+    """Shards are contiguous, inclusive and clipped to the end date."""
+    assert date_shards(date(2025, 1, 1), date(2025, 1, 5), 2) == [
+        (date(2025, 1, 1), date(2025, 1, 2)),
+        (date(2025, 1, 3), date(2025, 1, 4)),
+        (date(2025, 1, 5), date(2025, 1, 5)),
+    ]
+    assert date_shards(date(2025, 1, 2), date(2025, 1, 1)) == []
+    with pytest.raises(ValueError):
+        date_shards(date(2025, 1, 1), date(2025, 1, 2), 0)
+
+
+@pytest.mark.asyncio
+async def test_sharded_fetch_is_concurrent_bounded_and_ordered(make_client):
+    """Day shards run concurrently under the cap and merge back in date order."""
+    client = make_client(fetch_concurrency=3)
+    in_flight = 0
+    peak = 0
+    
+    async def fake_request(method, endpoint, data=None, params=None):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        day = int(params["start_date"][-2:])
+        # Later days answer faster to prove results are reordered.
+        await asyncio.sleep(0.01 * (32 - day) / 31)
+        in_flight -= 1
+        return {"activities": [{"id": day * 10, "time_slot": params["start_date"]}]}
+    
+    with patch.object(client, "_make_request", side_effect=fake_request):
+        activities = await client.get_activities(date(2025, 1, 1), date(2025, 1, 31))
+    
+    assert [a["id"] for a in activities] == [day * 10 for day in range(1, 32)]
+    assert peak == 3
+
+
+@pytest.mark.asyncio
+async def test_sharded_fetch_deduplicates_entries_spanning_shards(make_client):
+    """A time entry returned for two adjacent days is yielded once."""
+    client = make_client(fetch_concurrency=2)
+    responses = {
+        "2025-01-01": [{"id": 1}, {"id": 2}],
+        "2025-01-02": [{"id": 2}, {"id": 3}],
+    }
+    
+    async def fake_request(method, endpoint, data=None, params=None):
+        return {"time_entries": responses[params["start_date"]]}
+    
+    with patch.object(client, "_make_request", side_effect=fake_request):
+        entries = await client.get_time_entries(date(2025, 1, 1), date(2025, 1, 2))
+    
+    assert [e["id"] for e in entries] == [1, 2, 3]
+
+
+@pytest.mark.asyncio
+async def test_sharded_iteration_cancels_prefetch_on_early_stop(make_client):
+    """Stopping early cancels shards that were prefetched but not consumed."""
+    client = make_client(fetch_concurrency=2)
+    started = []
+    
+    async def fake_request(method, endpoint, data=None, params=None):
+        started.append(params["start_date"])
+        await asyncio.sleep(0)
+        return {"screenshots": [{"id": len(started)}]}
+    
+    with patch.object(client, "_make_request", side_effect=fake_request):
+        records = client._iter_date_range(
+            lambda start, end: client.iter_screenshots(start, end),
+            date(2025, 1, 1),
+            date(2025, 1, 31),
+        )
+        async for _ in records:
+            break
+        await records.aclose()
+    
+    assert len(started) <= 3
+
+
+@pytest.mark.asyncio
+async def test_sharded_records_report_buffered_and_forget_old_ids():
+    """Prefetched shards are reported as buffered; only adjacent shards' ids are kept."""
+    shards = {n: [{"id": n}, {"id": n + 1}] for n in range(1, 6)}
+    
+    async def fetch_shard(start, end):
+        return shards[start.day]
+    
+    records = ShardedRecords(
+        fetch_shard, [(date(2025, 1, n), date(2025, 1, n)) for n in range(1, 6)], 2
+    )
+    first = await records.__anext__()
+    await asyncio.sleep(0)
+    assert first == {"id": 1}
+    # The rest of shard 1 plus shards 2 and 3, fetched ahead
+    assert [record["id"] for record in records.buffered()] == [2, 2, 3, 3, 4]
+    
+    assert [record["id"] async for record in records] == [2, 3, 4, 5, 6]
+    assert records._previous_ids == {4, 5} and records._current_ids == {5, 6}
+    assert records.buffered() == []
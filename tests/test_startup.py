@@ -0,0 +1,63 @@
+"""Tests for the startup path: .env loading and prewarming after the handshake."""
+
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+from mcp.shared.memory import create_connected_server_and_client_session
+
+from hubstaff_mcp import server
+
+
+def test_env_file_is_only_read_without_a_token():
+    with patch("dotenv.load_dotenv") as load_dotenv:
+        with patch.dict("os.environ", {"HUBSTAFF_REFRESH_TOKEN": "from-host"}):
+            server.load_env_file()
+        load_dotenv.assert_not_called()
+        
+        with patch.dict("os.environ", {"HUBSTAFF_REFRESH_TOKEN": ""}):
+            server.load_env_file()
+        load_dotenv.assert_called_once()
+
+
+def test_prewarm_option():
+    assert server.parse_args([]).prewarm
+    assert not server.parse_args(["--no-prewarm"]).prewarm
+    with patch.dict("os.environ", {"HUBSTAFF_PREWARM": "false"}):
+        assert not server.parse_args([]).prewarm
+    
+    args = server.parse_args([])
+    assert (args.prewarm_data, args.prewarm_interval) == (False, 300)
+    with patch.dict("os.environ", {"HUBSTAFF_PREWARM_DATA": "true", "HUBSTAFF_PREWARM_INTERVAL": "60"}):
+        args = server.parse_args([])
+    assert (args.prewarm_data, args.prewarm_interval) == (True, 60)
+
+
+@pytest.mark.asyncio
+async def test_handshake_starts_prewarm_once():
+    app = server.HubstaffMCP("test")
+    app.prewarm = AsyncMock()
+    
+    for _ in range(2):
+        async with create_connected_server_and_client_session(app._mcp_server) as session:
+            await session.send_ping()
+    await app.stop_prewarm()
+    
+    app.prewarm.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_prewarm_gets_token_and_connects_to_api(make_client):
+    paths = []
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path == "/access_tokens":
+            return httpx.Response(200, json={"access_token": "token", "expires_in": 3600})
+        return httpx.Response(200, json={"user": {"id": 1}})
+    
+    client = make_client(handler, access_token=None)
+    async with client:
+        await client.prewarm()
+    assert paths == ["/access_tokens", "/v2/users/me"]
+    assert client.access_token == "token"
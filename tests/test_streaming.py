@@ -0,0 +1,102 @@
+"""Tests for incremental decoding of list responses."""
+
+import json
+import random
+from datetime import date
+
+import httpx
+import pytest
+
+from hubstaff_mcp.client import HubstaffAPIError
+from hubstaff_mcp.streaming import JSONArrayStream, iter_json_array
+
+BODY = {
+    "activities": [
+        {"id": 1, "tracked": 600, "note": "café ☕"},
+        {"id": 2, "tracked": 12345, "nested": {"list": [1, 2, {"deep": None}]}},
+        {"id": 3, "tracked": -0.5, "flag": True},
+    ],
+    "pagination": {"next_page_start_id": 4},
+}
+
+
+def chunked(data, size):
+    return [data[i:i + size] for i in range(0, len(data), size)]
+
+
+async def aiter(chunks):
+    for chunk in chunks:
+        yield chunk
+
+
+def test_parser_handles_any_chunking():
+    text = json.dumps(BODY, ensure_ascii=False, indent=1)
+    rng = random.Random(7)
+    for _ in range(50):
+        parser = JSONArrayStream("activities")
+        items = []
+        pos = 0
+        while pos < len(text):
+            step = rng.randint(1, 8)
+            items.extend(parser.feed(text[pos:pos + step]))
+            pos += step
+        assert items == BODY["activities"]
+        assert parser.close() == {"pagination": {"next_page_start_id": 4}}
+
+
+def test_parser_waits_for_numbers_split_across_chunks():
+    parser = JSONArrayStream("ids")
+    assert parser.feed('{"ids": [12') == []
+    assert parser.feed('34, 5') == [1234]
+    assert parser.feed(']}') == [5]
+    assert parser.close() == {}
+
+
+def test_parser_rejects_truncated_and_non_object_bodies():
+    parser = JSONArrayStream("activities")
+    parser.feed('{"activities": [{"id": 1}, {"id"')
+    with pytest.raises(ValueError):
+        parser.close()
+    with pytest.raises(ValueError):
+        JSONArrayStream("activities").feed("[1, 2]")
+    assert JSONArrayStream("activities").close() == {}
+
+
+@pytest.mark.asyncio
+async def test_iter_json_array_decodes_split_utf8():
+    data = json.dumps(BODY, ensure_ascii=False).encode()
+    members = {}
+    items = [item async for item in iter_json_array(aiter(chunked(data, 3)), "activities", members)]
+    assert items == BODY["activities"]
+    assert members["pagination"] == {"next_page_start_id": 4}
+
+
+@pytest.mark.asyncio
+async def test_streamed_iteration_follows_pagination(make_client):
+    pages = {
+        None: {"activities": [{"id": 1}, {"id": 2}], "pagination": {"next_page_start_id": 3}},
+        "3": {"activities": [{"id": 3}]},
+    }
+    
+    def handler(request):
+        page = pages[request.url.params.get("page_start_id")]
+        return httpx.Response(200, content=aiter(chunked(json.dumps(page).encode(), 5)))
+    
+    client = make_client(handler)
+    records = client.iter_activities(date(2025, 1, 1), date(2025, 1, 1), stream=True)
+    assert [record["id"] async for record in records] == [1, 2, 3]
+    await client.aclose()
+
+
+@pytest.mark.asyncio
+async def test_streamed_iteration_reports_truncated_body(make_client):
+    def handler(request):
+        return httpx.Response(200, content=b'{"activities": [{"id": 1}, {"id":')
+    
+    client = make_client(handler)
+    seen = []
+    with pytest.raises(HubstaffAPIError):
+        async for record in client.iter_activities(date(2025, 1, 1), date(2025, 1, 1), stream=True):
+            seen.append(record["id"])
+    assert seen == [1]
+    await client.aclose()
@@ -0,0 +1,145 @@
+"""Tests for the local SQLite sync store."""
+
+import time
+from datetime import date, timedelta
+from unittest.mock import patch
+
+import pytest
+
+from hubstaff_mcp import server
+from hubstaff_mcp.sync import SyncStore, sync_organization
+
+ORG = 42
+
+
+def entry(entry_id, day, user_id=1, project_id=10, tracked=3600):
+    return {
+        "id": entry_id,
+        "user_id": user_id,
+        "project_id": project_id,
+        "starts_at": f"{day}T09:00:00Z",
+        "tracked": tracked,
+    }
+
+
+class FakeClient:
+    """Serves time entries/activities per day and records which days were fetched."""
+    
+    fetch_concurrency = 4
+    
+    def __init__(self, records_by_day):
+        self.records_by_day = records_by_day
+        self.fetched = []
+    
+    async def _iter(self, start, end, organization_id=None, stream=False):
+        self.fetched.append(start)
+        for record in self.records_by_day.get(start, []):
+            yield record
+    
+    iter_time_entries = _iter
+    iter_activities = _iter
+
+
+@pytest.mark.asyncio
+async def test_sync_fetches_only_missing_and_recent_days():
+    base = date.today() - timedelta(days=10)
+    days = [base + timedelta(days=n) for n in range(5)]
+    client = FakeClient({day: [entry(n, day)] for n, day in enumerate(days)})
+    store = SyncStore()
+    
+    summary = await sync_organization(client, store, ORG, days[0], days[-1], ["time_entries"])
+    assert summary == {"time_entries": {"days": 5, "records": 5}}
+    assert store.high_water(ORG, "time_entries") == days[-1]
+    
+    client.fetched.clear()
+    await sync_organization(
+        client, store, ORG, days[0], days[-1] + timedelta(days=1), ["time_entries"]
+    )
+    # Lookback of 2 days before the high-water mark, plus the new day.
+    assert sorted(client.fetched) == [days[2], days[3], days[4], days[4] + timedelta(days=1)]
+
+
+def test_replace_day_drops_deleted_records():
+    store = SyncStore()
+    day = date(2025, 1, 1)
+    store.replace_day(ORG, "time_entries", day, [entry(1, day), entry(2, day)])
+    store.replace_day(ORG, "time_entries", day, [entry(2, day)])
+    assert [r["id"] for r in store.query("time_entries", ORG, day, day)] == [2]
+
+
+def test_refetching_a_day_keeps_records_fetched_for_another_day():
+    store = SyncStore()
+    day, next_day = date(2025, 1, 1), date(2025, 1, 2)
+    # Returned by the first day's query although it starts on the next UTC day
+    late = {"id": 1, "user_id": 1, "project_id": 10, "starts_at": "2025-01-02T03:00:00Z", "tracked": 60}
+    store.replace_day(ORG, "time_entries", day, [late])
+    store.replace_day(ORG, "time_entries", next_day, [entry(2, next_day)])
+    
+    assert [r["id"] for r in store.query("time_entries", ORG, day, day)] == [1]
+    assert [r["id"] for r in store.query("time_entries", ORG, next_day, next_day)] == [2]
+
+
+def test_records_returned_for_two_days_are_kept_for_both():
+    store = SyncStore()
+    day, next_day = date(2025, 1, 1), date(2025, 1, 2)
+    # Spans midnight, so both days' queries return it
+    overnight = {"id": 1, "user_id": 1, "project_id": 10, "starts_at": "2025-01-01T23:00:00Z", "tracked": 7200}
+    store.replace_day(ORG, "time_entries", day, [overnight])
+    store.replace_day(ORG, "time_entries", next_day, [overnight, entry(2, next_day)])
+    
+    assert [r["id"] for r in store.query("time_entries", ORG, day, day)] == [1]
+    assert [r["id"] for r in store.query("time_entries", ORG, day, next_day)] == [1, 2]
+    assert [t["tracked"] for t in store.query_timesheets(ORG, day, next_day)] == [7200, 3600]
+    assert [t["date"] for t in store.query_timesheets(ORG, next_day, next_day)] == ["2025-01-02"]
+
+
+def test_queries_filter_and_aggregate_timesheets():
+    store = SyncStore()
+    day = date(2025, 1, 1)
+    store.replace_day(ORG, "time_entries", day, [
+        entry(1, day, user_id=1, project_id=10, tracked=1800),
+        entry(2, day, user_id=1, project_id=10, tracked=1800),
+        entry(3, day, user_id=2, project_id=11, tracked=600),
+    ])
+    
+    assert [r["id"] for r in store.query("time_entries", ORG, day, day, user_ids=[2])] == [3]
+    assert store.query_timesheets(ORG, day, day, project_ids=[10]) == [
+        {"user_id": 1, "project_id": 10, "date": "2025-01-01", "tracked": 3600}
+    ]
+    
+    start = time.perf_counter()
+    store.query("time_entries", ORG, day, day, user_ids=[1])
+    assert time.perf_counter() - start < 0.01
+
+
+def test_covers_requires_closed_synced_days(tmp_path):
+    store = SyncStore(str(tmp_path / "sync.db"))
+    day = date(2025, 1, 1)
+    store.replace_day(ORG, "time_entries", day, [])
+    assert store.covers(ORG, "time_entries", day, day)
+    assert not store.covers(ORG, "time_entries", day, day + timedelta(days=1))
+    assert not store.covers(ORG, "activities", day, day)
+    today = date.today()
+    store.replace_day(ORG, "time_entries", today, [])
+    assert not store.covers(ORG, "time_entries", today, today)
+    store.close()
+    
+    # State persists across reopen.
+    assert SyncStore(str(tmp_path / "sync.db")).covers(ORG, "time_entries", day, day)
+
+
+@pytest.mark.asyncio
+async def test_get_time_entries_tool_answers_from_store(mock_hubstaff_client):
+    store = SyncStore()
+    day = date(2025, 1, 1)
+    store.replace_day(ORG, "time_entries", day, [entry(7, day)])
+    
+    with patch.object(server, "sync_store", store), \
+            patch.object(server, "hubstaff_client", mock_hubstaff_client), \
+            patch.object(mock_hubstaff_client, "_make_request") as request:
+        result = await server.get_time_entries("2025-01-01", "2025-01-01", organization_id=ORG)
+        timesheet = await server.get_timesheets("2025-01-01", "2025-01-01", organization_id=ORG)
+    
+    request.assert_not_called()
+    assert "Time Entry ID: 7" in result
+    assert "Total Hours: 1.00" in timesheet
@@ -0,0 +1,164 @@
+"""Tests for per-token client isolation in multi-tenant mode."""
+
+import re
+from urllib.parse import parse_qs
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from hubstaff_mcp import server
+from hubstaff_mcp.client import HubstaffClient
+from hubstaff_mcp.sessions import SessionStore
+from hubstaff_mcp.tenants import ClientRegistry
+from hubstaff_mcp.token_cache import token_cache_key
+
+
+class FakeAccounts:
+    """Mock transport where each refresh token belongs to a different user."""
+    
+    def __init__(self):
+        self.requests = []
+    
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/access_tokens":
+            refresh = parse_qs(request.content.decode())["refresh_token"][0]
+            return httpx.Response(200, json={"access_token": f"access-{refresh}", "expires_in": 3600})
+        owner = request.headers["Authorization"].removeprefix("Bearer access-")
+        self.requests.append(owner)
+        if request.url.path == "/v2/projects":
+            projects = [{"id": n, "name": f"{owner}-{n}"} for n in range(1, 4)]
+            return httpx.Response(200, json={"projects": projects})
+        return httpx.Response(200, json={"user": {"id": 1, "name": owner}})
+
+
+def make_registry(handler, **kwargs) -> ClientRegistry:
+    def factory(**options):
+        return HubstaffClient(transport=httpx.MockTransport(handler), rate_limit=0, **options)
+    return ClientRegistry(factory=factory, **kwargs)
+
+
+@pytest.mark.asyncio
+async def test_each_token_gets_its_own_client():
+    registry = make_registry(FakeAccounts(), max_tenants=4, max_connections=20)
+    async with registry.lease("alice") as alice, registry.lease("bob") as bob:
+        assert alice is not bob
+        assert alice.refresh_token == "alice"
+        assert alice.response_cache is not bob.response_cache
+        assert alice.rate_limiter is not bob.rate_limiter
+        assert alice.limits.max_connections == 5
+    async with registry.lease("alice") as again:
+        assert again is alice
+    assert registry.stats()["created"] == 2
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_tenant_tokens_are_not_written_to_the_token_cache(tmp_path):
+    path = tmp_path / "tokens.json"
+    registry = make_registry(FakeAccounts())
+    with patch.dict("os.environ", {"HUBSTAFF_TOKEN_CACHE": str(path)}):
+        async with registry.lease("alice") as alice:
+            await alice.get_current_user()
+    assert alice.token_cache is None
+    assert not path.exists()
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_idle_tenants_are_evicted_but_busy_ones_are_kept():
+    now = [0.0]
+    registry = make_registry(FakeAccounts(), max_tenants=2, idle_timeout=60, clock=lambda: now[0])
+    
+    async with registry.lease("busy"):
+        async with registry.lease("idle"):
+            pass
+        async with registry.lease("third"):
+            pass
+        assert "busy" in registry and "idle" not in registry
+        assert registry.evicted == 1
+        
+        now[0] = 61
+        async with registry.lease("fourth"):
+            pass
+        assert "third" not in registry and "busy" in registry
+        assert registry.expired == 1
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_use_the_requesting_tenants_client():
+    accounts = FakeAccounts()
+    registry = make_registry(accounts)
+    tokens = iter(["alice", "bob", None])
+    
+    with patch.object(server.mcp, "tenants", registry), \
+            patch.object(server.mcp, "request_token", lambda: next(tokens)), \
+            patch.object(server, "hubstaff_client", None):
+        alice, bob = [await server.mcp.call_tool("get_current_user", {}) for _ in range(2)]
+        with pytest.raises(ValueError, match="x-hubstaff-token"):
+            await server.mcp.call_tool("get_current_user", {})
+    
+    assert "Name: alice" in alice[1]["result"]
+    assert "Name: bob" in bob[1]["result"]
+    assert accounts.requests == ["alice", "bob"]
+    assert server.tenant_client.get() is None
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_cursors_only_resume_the_issuing_tenants_session():
+    registry = make_registry(FakeAccounts(), max_tenants=2)
+    registry.on_close = server.close_tenant_sessions
+    sessions = SessionStore()
+    tokens = iter(["alice", "bob", "carol"])
+    
+    with patch.object(server.mcp, "tenants", registry), \
+            patch.object(server.mcp, "request_token", lambda: next(tokens)), \
+            patch.object(server, "result_sessions", sessions), \
+            patch.object(server, "hubstaff_client", None):
+        arguments = {"format": "csv", "max_rows": 1}
+        alice = await server.mcp.call_tool("get_projects", arguments)
+        cursor = re.search(r'cursor="([^"]+)"', alice[1]["result"]).group(1)
+        assert len(sessions) == 1
+        
+        bob = await server.mcp.call_tool("get_projects", {**arguments, "cursor": cursor})
+        assert "bob-2" in bob[1]["result"] and "alice" not in bob[1]["result"]
+        assert len(sessions) == 2  # alice's session is untouched
+        
+        await server.mcp.call_tool("get_projects", arguments)  # evicts alice
+        assert "alice" not in registry
+        assert {session.tenant for session in sessions._sessions.values()} == {
+            token_cache_key("bob"), token_cache_key("carol")
+        }
+    await sessions.aclose()
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_counter_totals_keep_evicted_tenants_numbers():
+    registry = make_registry(FakeAccounts(), max_tenants=1)
+    tokens = iter(["alice", "alice", "bob"])
+    
+    with patch.object(server.mcp, "tenants", registry), \
+            patch.object(server.mcp, "request_token", lambda: next(tokens)), \
+            patch.object(server, "hubstaff_client", None):
+        for _ in range(2):
+            await server.mcp.call_tool("get_projects", {})
+        before = server.client_counters()["counters"]
+        await server.mcp.call_tool("get_projects", {})  # evicts alice
+        after = server.client_counters()["counters"]
+    
+    assert "alice" not in registry
+    assert before["token_refreshes_total"] == 1 and after["token_refreshes_total"] == 2
+    assert before["cache_hits_total"] == after["cache_hits_total"] == 1
+    assert after["cache_misses_total"] == 2
+    await registry.aclose()
+
+
+@pytest.mark.asyncio
+async def test_tenant_header_is_rejected_when_multi_tenant_is_off():
+    with patch.object(server.mcp, "tenants", None), \
+            patch.object(server.mcp, "request_token", lambda: "alice"):
+        with pytest.raises(ValueError, match="does not accept per-user tokens"):
+            await server.mcp.call_tool("get_current_user", {})
@@ -0,0 +1,117 @@
+"""Tests for the on-disk access-token cache."""
+
+import json
+import os
+import stat
+import time
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from hubstaff_mcp.client import HubstaffClient
+from hubstaff_mcp.token_cache import TokenCache, token_cache_key
+
+
+def test_cache_roundtrip_is_private_and_keyed_by_hash(tmp_path):
+    """Entries round-trip, the file is 0600 and never contains the raw key."""
+    cache = TokenCache(tmp_path / "nested" / "tokens.json")
+    key = token_cache_key("personal-token")
+    cache.save(key, "access", time.time() + 3600, "personal-token-2")
+    
+    entry = cache.load(key)
+    assert entry["access_token"] == "access"
+    assert entry["refresh_token"] == "personal-token-2"
+    assert stat.S_IMODE(os.stat(cache.path).st_mode) == 0o600
+    assert "personal-token\"" not in cache.path.read_text()
+    assert key in json.loads(cache.path.read_text())
+
+
+def test_cache_drops_expired_access_token(tmp_path):
+    """An expired access token is discarded but a rotated refresh token is kept."""
+    cache = TokenCache(tmp_path / "tokens.json")
+    key = token_cache_key("personal-token")
+    cache.save(key, "old-access", time.time() - 10, "rotated")
+    
+    entry = cache.load(key)
+    assert "access_token" not in entry
+    assert entry["refresh_token"] == "rotated"
+
+
+def test_cache_ignores_corrupt_file(tmp_path):
+    """A corrupt cache file behaves like an empty cache."""
+    path = tmp_path / "tokens.json"
+    path.write_text("{not json")
+    assert TokenCache(path).load("anything") is None
+
+
+@pytest.mark.asyncio
+async def test_warm_start_skips_token_exchange(tmp_path, make_client):
+    """A second client process reuses the cached token: one API round trip only."""
+    calls = []
+    
+    def handler(request):
+        calls.append(request.url.path)
+        if request.url.path == "/access_tokens":
+            return httpx.Response(200, json={"access_token": "cached", "expires_in": 3600})
+        return httpx.Response(200, json={"user": {"id": 1}})
+    
+    cache = TokenCache(tmp_path / "tokens.json")
+    first = make_client(handler, access_token=None, token_cache=cache)
+    await first.get_current_user()
+    await first.aclose()
+    assert calls == ["/access_tokens", "/v2/users/me"]
+    
+    calls.clear()
+    second = make_client(handler, access_token=None, token_cache=cache)
+    assert second.access_token == "cached"
+    await second.get_current_user()
+    await second.aclose()
+    assert calls == ["/v2/users/me"]
+
+
+@pytest.mark.asyncio
+async def test_rotated_refresh_token_is_persisted(tmp_path, make_client):
+    """A refresh token rotated by the auth endpoint is used after restart."""
+    seen_refresh_tokens = []
+    
+    def handler(request):
+        form = dict(httpx.QueryParams(request.content.decode()))
+        seen_refresh_tokens.append(form["refresh_token"])
+        return httpx.Response(
+            200,
+            json={"access_token": "a", "expires_in": 1, "refresh_token": "rotated-token"},
+        )
+    
+    cache = TokenCache(tmp_path / "tokens.json")
+    first = make_client(handler, access_token=None, token_cache=cache)
+    await first._ensure_access_token()
+    await first.aclose()
+    
+    # The one-second access token is too short-lived to reuse.
+    second = make_client(handler, access_token=None, token_cache=cache)
+    assert second.access_token is None
+    assert second.refresh_token == "rotated-token"
+    await second._ensure_access_token()
+    await second.aclose()
+    
+    assert seen_refresh_tokens == ["test_refresh_token", "rotated-token"]
+    assert seen_refresh_tokens == ["test_refresh_token", "rotated-token"]
+
+
+@pytest.mark.asyncio
+async def test_cache_from_env_can_be_disabled(tmp_path):
+    """HUBSTAFF_TOKEN_CACHE is the default; token_cache=None turns it off."""
+    path = tmp_path / "tokens.json"
+    transport = httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"access_token": "a", "expires_in": 3600})
+    )
+    env = {"HUBSTAFF_REFRESH_TOKEN": "test_refresh_token", "HUBSTAFF_TOKEN_CACHE": str(path)}
+    with patch.dict("os.environ", env):
+        assert HubstaffClient(transport=transport).token_cache.path == path
+        client = HubstaffClient(transport=transport, token_cache=None)
+    
+    assert client.token_cache is None
+    await client._ensure_access_token()
+    await client.aclose()
+    assert not path.exists()
@@ -0,0 +1,106 @@
+"""Tests for access-token expiry tracking and single-flight refresh."""
+
+import asyncio
+import functools
+import time
+
+import httpx
+import pytest
+
+
+class FakeHubstaff:
+    """Mock transport handler issuing short-lived tokens and checking them."""
+    
+    def __init__(self, expires_in=3600, refresh_delay=0.01):
+        self.expires_in = expires_in
+        self.refresh_delay = refresh_delay
+        self.refreshes = 0
+        self.api_calls = 0
+        self.valid_tokens = set()
+    
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/access_tokens":
+            self.refreshes += 1
+            await asyncio.sleep(self.refresh_delay)
+            token = f"token-{self.refreshes}"
+            self.valid_tokens = {token}
+            return httpx.Response(
+                200, json={"access_token": token, "expires_in": self.expires_in}
+            )
+        
+        self.api_calls += 1
+        token = request.headers["Authorization"].removeprefix("Bearer ")
+        if token not in self.valid_tokens:
+            return httpx.Response(401, json={"error": "invalid_token"})
+        return httpx.Response(200, json={"user": {"id": 1}})
+
+
+@pytest.fixture
+def make_client(make_client):
+    # Every concurrent call must reach the API to exercise token handling.
+    return functools.partial(make_client, access_token=None, coalesce_requests=False)
+
+
+@pytest.mark.asyncio
+async def test_refresh_records_expiry(make_client):
+    """The expires_in from the token response sets token_expires_at."""
+    fake = FakeHubstaff(expires_in=7200)
+    client = make_client(fake)
+    
+    before = time.time()
+    await client.get_current_user()
+    await client.aclose()
+    
+    assert before + 7200 <= client.token_expires_at <= time.time() + 7200
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_with_expired_token_refresh_once(make_client):
+    """100 parallel calls against an expired token trigger exactly one refresh."""
+    fake = FakeHubstaff()
+    client = make_client(fake)
+    client.access_token = "expired"
+    client.token_expires_at = time.time() - 1
+    
+    await asyncio.gather(*(client.get_current_user() for _ in range(100)))
+    await client.aclose()
+    
+    assert fake.refreshes == 1
+    assert fake.api_calls == 100
+    assert client.access_token == "token-1"
+
+
+@pytest.mark.asyncio
+async def test_concurrent_401s_refresh_once(make_client):
+    """100 parallel calls that all hit 401 share a single refresh."""
+    fake = FakeHubstaff()
+    client = make_client(fake)
+    # Server-side revoked token whose expiry the client doesn't know about.
+    client.access_token = "revoked"
+    
+    results = await asyncio.gather(*(client.get_current_user() for _ in range(100)))
+    await client.aclose()
+    
+    assert all(user == {"id": 1} for user in results)
+    assert fake.refreshes == 1
+    assert fake.api_calls == 200  # each call: one 401, one retry
+
+
+@pytest.mark.asyncio
+async def test_token_near_expiry_refreshes_in_background(make_client):
+    """A token inside the refresh margin is used while one background refresh runs."""
+    fake = FakeHubstaff(refresh_delay=0.05)
+    client = make_client(fake, token_refresh_margin=300)
+    await client.get_current_user()
+    assert fake.refreshes == 1
+    
+    # Pretend the token is about to expire but is still accepted.
+    client.token_expires_at = time.time() + 60
+    await asyncio.gather(*(client.get_current_user() for _ in range(100)))
+    assert client.access_token == "token-1"
+    
+    await client._background_refresh
+    assert fake.refreshes == 2
+    assert client.access_token == "token-2"
+    assert client.token_expires_at > time.time() + 300
+    await client.aclose()
@@ -0,0 +1,110 @@
+"""Tests for trace spans and sampled call profiling."""
+
+import json
+import pstats
+import time
+from datetime import date
+from unittest.mock import patch
+
+import httpx
+import pytest
+
+from hubstaff_mcp import server
+from hubstaff_mcp.tracing import TRACER, CallProfiler, JSONFileExporter, Tracer
+
+
+def read_traces(path):
+    return [
+        request["resourceSpans"][0]["scopeSpans"][0]["spans"]
+        for request in map(json.loads, path.read_text().splitlines())
+    ]
+
+
+def test_disabled_tracer_is_a_no_op():
+    tracer = Tracer()
+    with tracer.span("work") as span:
+        assert span is None
+    assert not tracer.enabled
+
+
+def test_spans_nest_and_record_errors(tmp_path):
+    tracer = Tracer(JSONFileExporter(str(tmp_path / "traces.jsonl")))
+    with pytest.raises(ValueError):
+        with tracer.span("outer", tool="demo"):
+            with tracer.span("inner") as inner:
+                inner.set("rows", 3)
+            raise ValueError("boom")
+    
+    (spans,) = read_traces(tmp_path / "traces.jsonl")
+    inner, outer = spans
+    assert outer["name"] == "outer" and "parentSpanId" not in outer
+    assert inner["parentSpanId"] == outer["spanId"]
+    assert inner["traceId"] == outer["traceId"]
+    assert inner["attributes"] == [{"key": "rows", "value": {"intValue": "3"}}]
+    assert outer["status"] == {"code": 2, "message": "ValueError: boom"}
+
+
+@pytest.mark.asyncio
+async def test_tool_call_trace_covers_token_http_decode_and_render(tmp_path, make_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/access_tokens":
+            return httpx.Response(200, json={"access_token": "token", "expires_in": 3600})
+        return httpx.Response(200, json={"projects": [{"id": 1, "name": "P"}]})
+    
+    client = make_client(handler, access_token=None, cache_enabled=False)
+    trace_file = tmp_path / "traces.jsonl"
+    
+    with patch.object(TRACER, "exporter", JSONFileExporter(str(trace_file))), \
+            patch.object(server, "hubstaff_client", client):
+        await server.mcp.call_tool("get_projects", {"format": "csv"})
+    await client.aclose()
+    
+    (spans,) = read_traces(trace_file)
+    names = {span["name"] for span in spans}
+    assert {"tool get_projects", "token.ensure", "http POST", "http GET", "decode", "render"} <= names
+    root = next(span for span in spans if span["name"] == "tool get_projects")
+    ids = {span["spanId"] for span in spans}
+    assert all(span["parentSpanId"] in ids for span in spans if span is not root)
+    render = next(span for span in spans if span["name"] == "render")
+    assert all(span.get("parentSpanId") != render["spanId"] for span in spans)
+
+
+@pytest.mark.asyncio
+async def test_streamed_pages_trace_decoding_without_spanning_yields(tmp_path, make_client):
+    def handler(request: httpx.Request) -> httpx.Response:
+        return httpx.Response(200, json={"activities": [{"id": 1}, {"id": 2}]})
+    
+    client = make_client(handler)
+    trace_file = tmp_path / "traces.jsonl"
+    
+    with patch.object(TRACER, "exporter", JSONFileExporter(str(trace_file))):
+        with TRACER.span("root"):
+            async for _ in client.iter_activities(date(2025, 1, 1), date(2025, 1, 1), stream=True):
+                with TRACER.span("consume"):
+                    pass
+    await client.aclose()
+    
+    (spans,) = read_traces(trace_file)
+    root = next(span for span in spans if span["name"] == "root")
+    decode = [span for span in spans if span["name"] == "decode"]
+    assert decode and all(span["parentSpanId"] == root["spanId"] for span in decode)
+    consume = [span for span in spans if span["name"] == "consume"]
+    assert len(consume) == 2 and all(span["parentSpanId"] == root["spanId"] for span in consume)
+
+
+def test_profiler_keeps_only_the_slowest_calls(tmp_path):
+    profiler = CallProfiler(str(tmp_path), keep=2, rng=lambda: 0.0)
+    for delay in (0.001, 0.03, 0.015):
+        with profiler.profile("get_users"):
+            time.sleep(delay)
+    
+    kept = profiler.slowest
+    assert profiler.profiled == 3
+    assert len(kept) == 2 and kept[0][0] > kept[1][0] >= 0.015
+    assert sorted(str(p) for p in tmp_path.iterdir()) == sorted(path for _, path in kept)
+    pstats.Stats(kept[0][1])  # a loadable profile
+    
+    unsampled = CallProfiler(str(tmp_path / "none"), rng=lambda: 0.9, sample_rate=0.5)
+    with unsampled.profile("get_users"):
+        pass
+    assert unsampled.profiled == 0
@@ -0,0 +1,69 @@
+"""Tests for the command-line transport options and the tool call limit."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from hubstaff_mcp import server
+
+
+def test_transport_defaults_come_from_environment():
+    env = {"HUBSTAFF_TRANSPORT": "streamable-http", "HUBSTAFF_PORT": "9100"}
+    with patch.dict("os.environ", env):
+        args = server.parse_args([])
+        assert (args.transport, args.host, args.port) == ("streamable-http", "127.0.0.1", 9100)
+        
+        args = server.parse_args(["--transport", "sse", "--host", "0.0.0.0", "--max-concurrent-calls", "4"])
+        assert (args.transport, args.host, args.max_concurrent_calls) == ("sse", "0.0.0.0", 4)
+    
+    with patch.dict("os.environ", {"HUBSTAFF_TRANSPORT": "websocket"}), pytest.raises(SystemExit):
+        server.parse_args([])
+
+
+def test_configure_transport_applies_settings():
+    settings = server.mcp.settings.model_copy()
+    with patch.object(server.mcp, "settings", settings), patch.object(server.mcp, "call_slots", None):
+        server.configure_transport(server.parse_args(["--port", "9200", "--max-concurrent-calls", "0"]))
+        assert settings.port == 9200
+        assert settings.transport_security is not None  # localhost keeps DNS rebinding protection
+        assert server.mcp.call_slots is None
+        
+        server.configure_transport(server.parse_args(["--host", "0.0.0.0", "--max-concurrent-calls", "2"]))
+        assert settings.host == "0.0.0.0"
+        assert settings.transport_security is None
+        assert server.mcp.call_slots is not None
+
+
+@pytest.mark.asyncio
+async def test_serve_dispatches_transport_and_cleans_up():
+    with patch.object(server.mcp, "run_streamable_http_async", new_callable=AsyncMock) as http, \
+            patch.object(server.mcp, "run_stdio_async", new_callable=AsyncMock) as stdio, \
+            patch.object(server, "hubstaff_client", AsyncMock()) as client, \
+            patch.object(server, "sync_store", None):
+        await server.serve("streamable-http")
+    
+    http.assert_awaited_once()
+    stdio.assert_not_awaited()
+    client.aclose.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_beyond_limit_wait_for_a_slot():
+    app = server.HubstaffMCP("test")
+    running = []
+    peak = []
+    
+    @app.tool()
+    async def slow() -> str:
+        running.append(1)
+        peak.append(len(running))
+        await asyncio.sleep(0.01)
+        running.pop()
+        return "done"
+    
+    app.limit_calls(2)
+    results = await asyncio.gather(*(app.call_tool("slow", {}) for _ in range(6)))
+    
+    assert len(results) == 6
+    assert max(peak) == 2
@@ -0,0 +1,79 @@
+"""Tests for background warming of the token, connections and reference data."""
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import httpx
+import pytest
+
+from hubstaff_mcp import ratelimit, server
+from hubstaff_mcp.client import HubstaffAPIError
+from hubstaff_mcp.warmup import ClientWarmer
+
+LISTINGS = {
+    "/v2/organizations": {"organizations": [{"id": 1, "name": "Org"}]},
+    "/v2/users": {"users": [{"id": 2, "name": "User"}]},
+    "/v2/projects": {"projects": [{"id": 3, "name": "Project"}]},
+    "/v2/organizations/1/teams": {"teams": [{"id": 4, "name": "Team"}]},
+}
+
+
+@pytest.mark.asyncio
+async def test_warmed_reference_data_serves_list_tools_and_refreshes(make_client):
+    requests = []
+    priorities = set()
+    
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/access_tokens":
+            return httpx.Response(200, json={"access_token": "token", "expires_in": 3600})
+        requests.append(str(request.url))
+        priorities.add(ratelimit._priority.get())
+        return httpx.Response(200, json=LISTINGS[request.url.path])
+    
+    client = make_client(handler, access_token=None)
+    
+    async with client:
+        await client.warm_reference_data()
+        warmed = len(requests)
+        assert warmed == 6  # organizations, then users and projects with and without the org, teams
+        assert priorities == {ratelimit.PRIORITY_BULK}
+        
+        with patch.object(server, "hubstaff_client", client):
+            for name, arguments in [
+                ("get_organizations", {}),
+                ("get_users", {}),
+                ("get_projects", {"organization_id": 1}),
+                ("get_teams", {"organization_id": 1}),
+            ]:
+                result = await server.mcp.call_tool(name, arguments)
+                assert "Error" not in result[1]["result"]
+        assert len(requests) == warmed
+        
+        await client.warm_reference_data()  # refetches entries that are still fresh
+        assert len(requests) == 2 * warmed
+
+
+@pytest.mark.asyncio
+async def test_warmer_refreshes_with_jitter_until_cancelled():
+    client = AsyncMock()
+    client.prewarm.side_effect = HubstaffAPIError("unavailable", 503)
+    client.warm_reference_data.side_effect = [HubstaffAPIError("unavailable", 503), None, None]
+    delays = []
+    
+    async def sleep(seconds):
+        delays.append(seconds)
+        if len(delays) == 3:
+            raise asyncio.CancelledError
+    
+    rolls = iter([0.0, 1.0, 0.5])
+    warmer = ClientWarmer(client, reference_data=True, interval=100, rng=lambda: next(rolls), sleep=sleep)
+    with pytest.raises(asyncio.CancelledError):
+        await warmer.run()
+    
+    assert delays == pytest.approx([90, 110, 100])
+    assert (warmer.refreshes, warmer.failures) == (2, 2)
+    
+    once = AsyncMock()
+    await ClientWarmer(once).run()
+    once.prewarm.assert_awaited_once()
+    once.warm_reference_data.assert_not_awaited()